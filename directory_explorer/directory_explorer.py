@@ -15,42 +15,72 @@ Author:
 
 Features: 
     - Dizin yapısını özyinelemeli olarak tarar ve analiz eder
+    - os.scandir ile tek geçişli tarama: dosya türü dizin listesinden gelir, her dosya en fazla bir stat çağrısı
+    - İsteğe bağlı paralel tarama (--workers): alt klasörler sınırlı bir kuyruk üzerinden thread'lere dağıtılır
+    - Özyineleme yok: tarama ve dışa aktarma açık yığınla yapılır, derinlik sınırı yoktur
+    - İsteğe bağlı kompakt ağaç (--compact): milyonlarca girdi için dizi tabanlı, düğüm başına ~40 bayt
+    - Akışlı JSON / NDJSON dışa aktarma (--ndjson): ağaç dolaşılırken dosyaya yazılır, ara sözlük veya metin tutulmaz
+    - Artımlı yeniden tarama (--snapshot): yalnızca mtime'ı değişen klasörler listelenir, eklenen/silinen/değişen raporu
+    - Tembel genişletme (--lazy, --max-depth, --no-sizes): klasörler erişildiğinde listelenir, boyutlar nesne üretmeden toplanır
+    - Hızlı TXT dışa aktarma: tek biçimlendirme geçişi, büyük parçalar halinde yazma, stdout'a veya pipe'a akış (--txt-out -)
+    - Filtreler (--exclude, --include, .explorerignore, boyut/yaş, --prune-depth): elenen klasörler hiç listelenmez
+    - Tarama sırasında toplanan istatistikler (--stats, --duplicates): en büyük dosya/klasörler, uzantı ve yaş dağılımı, kopya dosyalar
+    - Kopya bulucu (--hash-workers, --hash-cache): süreç havuzunda mmap ile hash, önce ilk/son blok, çalıştırmalar arası hash önbelleği
     - Klasör ve dosya boyutlarını hesaplar
     - Sonuçları JSON ve TXT olarak dışa aktarır
     - Özelleştirilebilir çıktı ve kolay komut satırı kullanımı
 
 Modules:
+    - PathFilter: gitignore tarzı dahil etme/hariç tutma, boyut/yaş ve derinlik kuralları
+    - TreeStats: Tarama sırasında doldurulan en büyükler, histogramlar ve kopya dosya adayları
+    - DuplicateFinder, HashCache: Aynı boyuttaki dosyaları süreç havuzunda hash'leyen kopya bulucu ve hash önbelleği
     - ClassFile: Dosya nesnesi oluşturma ve boyut hesaplama
     - ClassDirectory: Dizin nesnesi oluşturma, yürüme ve dönüştürme
+    - CompactTree: Dizi tabanlı kompakt ağaç ve C_file/C_folder görünümleri
+    - Snapshot: Diske kaydedilen tarama indeksi ve artımlı yeniden tarama
+    - LazyFolder: Erişildiğinde listelenen, derinlik sınırlı C_folder
     - DirectoryExplorer: Çalıştırma ve dışa aktarma için ana arayüz
 
 Classes:
     - C_file: Dosya bilgisi için veri sınıfı
     - C_folder: Klasör bilgisi için veri sınıfı
+    - C_changes: Artımlı taramanın eklenen/silinen/değişen girdi raporu
+    - PathFilter: Derlenmiş filtre kuralları; girdiler stat edilmeden veya içine girilmeden değerlendirilir
+    - TreeStats: En büyük N dosya/klasör (heap), uzantı/yaş histogramları ve kopya adayları (boyuta göre)
+    - DuplicateFinder: boyut -> ilk/son blok hash'i -> tam hash; ProcessPoolExecutor ve mmap ile okuma
+    - HashCache: (aygıt, inode, mtime, boyut) anahtarlı, diske kaydedilen kenar/tam hash önbelleği
     - ClassFile: Dosya işlemleri için statik metotlar
     - ClassDirectory: Dizin işlemleri için statik metotlar
+    - CompactTree: İsimleri tekilleştirilmiş, boyut/tarihleri array içinde tutan ağaç
+    - CompactFile, CompactFolder: CompactTree girdilerinin salt okunur C_file/C_folder görünümleri
+    - Snapshot: Yol (isim zinciri) anahtarlı boyut/mtime/inode indeksi; kaydetme, yükleme ve artımlı tarama
+    - LazyFolder: files/folders ilk erişimde listelenen, size/date ClassDirectory.measure ile toplanan C_folder
     - DirectoryExplorer: Kullanıcı etkileşimi için ana sınıf
 
 Functions:
     - _print_info(message, sleeping): Renkli bilgi mesajı yazdırır
+    - _iter_json(data, indent, level): json.dumps çıktısını özyinelemesiz parçalar halinde üretir
+    - _ns_to_datetime(ns): Nanosaniye zaman damgasını os.stat ile aynı yuvarlamayla datetime'a çevirir
+    - _format_date(date): Tarihi strftime("%Y-%m-%d %H:%M:%S") ile aynı, ondan hızlı biçimlendirir
+    - _hash_file(job): Süreç havuzunda çalışır; dosyanın ilk/son bloklarının veya tamamının blake2b hash'i (mmap)
     - Dosya/klasör işlemleri ve dışa aktarma için tüm sınıf metotları
 
 Usage:
     1. Kök dizini ve çıktı dizinini belirtin.
     2. İsteğe bağlı olarak hariç tutulacak dizin ve dosya adlarını girin.
-    3. cmd -> `python directory_explorer_v1_1_0.py [path] [--no-print] [--no-json] [--no-txt]`
+    3. cmd -> `python directory_explorer.py [path] [--no-print] [--no-json] [--no-txt] [--ndjson] [--snapshot FILE [--verify-files]] [--txt-out FILE|-] [--exclude PATTERN] [--include PATTERN] [--prune-depth N] [--stats [N]] [--duplicates [--hash-workers N] [--hash-cache FILE]] [--workers N | --compact | --lazy [--max-depth N] [--no-sizes]]`
     4. Sonuç olarak belirtilen dizinde JSON ve/veya TXT dosyası oluşacaktır.
 
 Requirements:
     - Python 3.7 veya üstü
     - Dependencies:
-        - os, json, datetime, pathlib, typing, argparse, dataclasses, re, time (standart)
+        - os, json, datetime, pathlib, typing, argparse, dataclasses, re, time, threading, queue, array, collections, heapq, hashlib, mmap, concurrent.futures (standart)
 
 Installation:
     1. Dosyayı .py uzantılı olarak kaydedin.
     2. Tüm bağımlılıklar standart kütüphane olduğu için ek kurulum gerekmez.
     3. `if __name__ == "__main__":` bloğunu ihtiyaca göre düzenleyin.
-    4. cmd -> `python directory_explorer.py [path] [--no-print] [--no-json] [--no-txt]`
+    4. cmd -> `python directory_explorer.py [path] [--no-print] [--no-json] [--no-txt] [--ndjson] [--snapshot FILE [--verify-files]] [--txt-out FILE|-] [--exclude PATTERN] [--include PATTERN] [--prune-depth N] [--stats [N]] [--duplicates [--hash-workers N] [--hash-cache FILE]] [--workers N | --compact | --lazy [--max-depth N] [--no-sizes]]`
 
 Documentation: 
     - Detaylı bilgi için README.md dosyasına bakınız
@@ -61,6 +91,17 @@ License:
 Changelog:
     - 1.0.0 (2024-08-25): İlk sürüm
     - 1.1.0 (2025-07-19): Büyük iyileştirmeler ve yapı değişiklikleri
+    - 1.2.0 (2026-10-18): os.scandir tabanlı tek geçişli walk (dosya başına tek stat) ve benchmark scripti
+    - 1.3.0 (2026-10-18): Paralel tarama (ClassDirectory.walk_parallel, --workers), boyut/tarih alttan üste birleştirilir
+    - 1.4.0 (2026-10-18): Tüm tarama ve dışa aktarma yolları özyinelemesiz (10.000 seviye derinlikte doğrulandı)
+    - 1.5.0 (2026-10-18): CompactTree (--compact): array tabanlı kompakt ağaç, tembel C_file/C_folder görünümleri, bellek benchmark'ı
+    - 1.6.0 (2026-10-18): Akışlı JSON dışa aktarma (ClassDirectory.iter_json) ve NDJSON modu (--ndjson)
+    - 1.7.0 (2026-10-18): Snapshot ile artımlı yeniden tarama (--snapshot, --verify-files) ve değişiklik raporu
+    - 1.8.0 (2026-10-18): LazyFolder ile tembel genişletme (--lazy, --max-depth, --no-sizes) ve ClassDirectory.measure hızlı boyut yolu
+    - 1.9.0 (2026-10-18): ClassDirectory.iter_txt ile parçalı TXT dışa aktarma, hızlı tarih biçimlendirme, --txt-out (dosya veya stdout)
+    - 1.10.0 (2026-10-18): PathFilter: gitignore tarzı kurallar, .explorerignore, boyut/yaş filtreleri ve --prune-depth; elenen alt ağaçlar listelenmez
+    - 1.11.0 (2026-10-18): TreeStats (--stats, --duplicates): tarama sırasında en büyük N dosya/klasör, uzantı ve yaş histogramları, kopya dosya bulucu
+    - 1.12.0 (2026-10-18): DuplicateFinder: ilk/son blok ardından tam hash, süreç havuzu ve mmap (--hash-workers), HashCache ile çalıştırmalar arası önbellek (--hash-cache)
 
 Contributors: None
 
@@ -85,7 +126,7 @@ Disclaimer and Legal Notice:
 ===============================================================================
 """
 
-__version__ = "1.1.0"
+__version__ = "1.12.0"
 __author__ = "Mefamex"
 __email__ = "info@mefamex.com"
 __license__ = "MIT"
@@ -97,7 +138,7 @@ __url_github__ = "https://github.com/Mefamex/Python_Code_Snippets"
 __copyright__ = "Copyright (c) 2025 Mefamex"
 __description__ = "A flexible directory structure visualization tool for Python."
 __date__ = "2024-08-25" 
-__date_modify__ = "2025-07-19"
+__date_modify__ = "2026-10-18"
 __python_version__ = ">=3.7" 
 __dependencies__ = {
     "python": ">=3.7",
@@ -109,19 +150,34 @@ __dependencies__ = {
     "datetime": "built-in",
     "pathlib": "built-in",
     "dataclasses": "built-in",
-    "typing": "built-in"
+    "typing": "built-in",
+    "threading": "built-in",
+    "queue": "built-in",
+    "array": "built-in",
+    "collections": "built-in",
+    "heapq": "built-in",
+    "hashlib": "built-in",
+    "mmap": "built-in",
+    "concurrent.futures": "built-in"
 }
 
 #============================ IMPORTS =========================================
-import os, json, time, re, argparse
-from datetime import datetime
-from typing import Dict, List, Union, Optional
+import os, sys, json, time, re, argparse, threading, heapq, hashlib, mmap, tempfile
+from queue import Queue, Full
+from concurrent.futures import ProcessPoolExecutor
+from array import array
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Dict, List, Union, Optional, Tuple, Iterator, Iterable, Callable, TextIO, BinaryIO
 from pathlib import Path
 from dataclasses import dataclass, field
 #==============================================================================
 
 
 #============================ STATIC METHODS ==================================
+_INFO_STREAM: Optional[TextIO] = None  # None: sys.stdout; çıktı stdout'a akıtılırken bilgi mesajları sys.stderr'e yönlendirilir
+
+
 def _print_info(message: str, sleeping: float = 0.1) -> None:
     """ Print information messages with ANSI color formatting. """
     RESET, BLUE, YELLOW, GREEN, CYAN = "\033[0m", "\033[1;34m", "\033[1;33m", "\033[1;32m", "\033[1;36m"
@@ -132,8 +188,67 @@ def _print_info(message: str, sleeping: float = 0.1) -> None:
         parts = msg.split(":", 1)
         msg = f"{YELLOW}{parts[0]}:{CYAN}{parts[1]}{RESET}"
     else: msg = f"{YELLOW}{msg}{RESET}"
-    print(output + msg)
+    print(output + msg, file=_INFO_STREAM)
     if sleeping > 0.0: time.sleep(sleeping)
+
+
+def _write_atomic(file: Path, write: Callable[[BinaryIO], None]) -> None:
+    """ Write through a unique temp file next to file and rename it over file; the temp file is removed if anything fails. """
+    temp = tempfile.NamedTemporaryFile("wb", dir=file.parent, prefix=file.name + ".", suffix=".tmp", delete=False)  # aynı dosyaya yazan iki işlem birbirinin temp'ini ezmez
+    try:
+        with temp: write(temp)
+        os.replace(temp.name, file)
+    except BaseException:
+        try: os.remove(temp.name)
+        except OSError: pass
+        raise
+
+
+def _iter_json(data, indent: int = 4, level: int = 0):
+    """ Yield json.dumps(data, indent=indent, ensure_ascii=False) piece by piece, with an explicit stack instead of recursion.
+    level: indentation level of data when it is embedded in a larger document. """
+    encode_str, end = json.encoder.encode_basestring, object()
+    stack: list = []  # [öğe iteratörü, dict mi, seviye, ilk öğe mi]
+    value = data
+    while True:
+        if isinstance(value, (dict, list)) and value:
+            is_dict = isinstance(value, dict)
+            yield "{" if is_dict else "["
+            stack.append([iter(value.items()) if is_dict else iter(value), is_dict, level + len(stack) + 1, True])
+        elif isinstance(value, dict): yield "{}"
+        elif isinstance(value, list): yield "[]"
+        elif isinstance(value, str): yield encode_str(value)
+        else: yield json.dumps(value)
+        while stack:
+            frame = stack[-1]
+            item = next(frame[0], end)
+            if item is end:
+                stack.pop()
+                yield "\n" + " " * (indent * (frame[2] - 1)) + ("}" if frame[1] else "]")
+                continue
+            prefix = ("\n" if frame[3] else ",\n") + " " * (indent * frame[2])
+            frame[3] = False
+            if frame[1]:
+                key, value = item
+                yield f"{prefix}{encode_str(str(key))}: "
+            else:
+                value = item
+                yield prefix
+            break
+        else: return
+
+
+def _ns_to_datetime(ns: int) -> datetime:
+    """ Nanosecond timestamp to local datetime, rounded exactly like datetime.fromtimestamp(os.stat_result.st_mtime). """
+    return datetime.fromtimestamp(ns // 10**9 + (ns % 10**9) * 1e-9)
+
+
+def _format_date(date: datetime) -> str:
+    """ date.strftime("%Y-%m-%d %H:%M:%S") without the format parsing; strftime is kept for years before 1000, whose padding depends on the platform. """
+    return date.isoformat(" ", "seconds") if date.year >= 1000 else date.strftime("%Y-%m-%d %H:%M:%S")
+
+
+_UNSIZED_NS = int(datetime(2000, 1, 1).timestamp()) * 10**9  # ClassFile.create_class_file_from_entry: boyutu okunamayan dosyanın tarihi
 #==============================================================================
 
 
@@ -156,6 +271,372 @@ class C_folder:
     folders: List['C_folder' ] = field(default_factory=list)
     is_sized: bool = False
     is_walked: bool = False
+
+@dataclass
+class C_changes:
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    scanned: int = 0    # os.scandir ile listelenen klasör sayısı
+    reused: int = 0     # listesi snapshot'tan alınan (mtime'ı değişmemiş) klasör sayısı
+#==============================================================================
+
+
+#============================ FILTER RULES ====================================
+class PathFilter:
+    """ Include/exclude rules compiled once and checked on every listed entry, before it is stat'ed or descended into.
+    exclude: gitignore-style lines: `#` comments, `!` re-includes, a trailing `/` matches folders only, any other `/`
+        anchors the pattern to the root, `*`, `?`, `[...]` and `**`. The last matching line wins; an excluded folder is
+        never listed, so nothing below it can be re-included.
+    include: patterns a file must match to be kept (folders are always entered).
+    min_size/max_size (bytes) and newer_than/older_than (age in seconds) keep files by the stat they get anyway.
+    max_depth: folders at this depth are kept but not listed (root: 0). """
+    IGNORE_FILE = ".explorerignore"
+    SIZE_UNITS = {"": 1, "B": 1, "K": 2**10, "M": 2**20, "G": 2**30, "T": 2**40}
+    AGE_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+    def __init__(self, exclude: Iterable[str] = (), include: Iterable[str] = (), min_size: Optional[int] = None, max_size: Optional[int] = None, newer_than: Optional[float] = None, older_than: Optional[float] = None, max_depth: Optional[int] = None):
+        if max_depth is not None and (not isinstance(max_depth, int) or max_depth < 0): raise ValueError(f"max_depth must be a non-negative integer: {max_depth}")
+        self.exclude, self.include = list(exclude), list(include)
+        self.min_size, self.max_size, self.newer_than, self.older_than, self.max_depth = min_size, max_size, newer_than, older_than, max_depth
+        self._rules: List[Tuple[re.Pattern, bool, bool]] = []  # (regex, yeniden dahil mi, yalnızca klasör mü)
+        for line in self.exclude:
+            line = line.strip()
+            if not line or line.startswith("#"): continue
+            negate = line.startswith("!")
+            regex, dir_only = PathFilter._translate(line[1:] if negate else line)
+            self._rules.append((re.compile(regex), negate, dir_only))
+        self._any = re.compile("|".join(f"(?:{regex.pattern})" for regex, _, _ in self._rules)) if self._rules else None  # hiçbir kurala uymayan girdi için tek arama
+        include = [PathFilter._translate(pattern.strip())[0] for pattern in self.include if pattern.strip()]
+        self._include = re.compile("|".join(f"(?:{regex})" for regex in include)) if include else None
+        now = time.time_ns()
+        self._oldest = None if newer_than is None else now - int(newer_than * 10**9)  # bundan eski mtime elenir
+        self._newest = None if older_than is None else now - int(older_than * 10**9)  # bundan yeni mtime elenir
+        self._stat_needed = any(value is not None for value in (min_size, max_size, newer_than, older_than))
+        self._root, self._offset = "", 0  # bind ile ayarlanır
+
+    @property
+    def active(self) -> bool: return bool(self._rules) or self._include is not None or self._stat_needed or self.max_depth is not None
+
+    def bind(self, root: Union[str, Path], ignore_file: Optional[Union[str, Path, bool]] = None) -> "PathFilter":
+        """ Copy of the filter for the tree at root. The lines of ignore_file (default: root/.explorerignore if it exists,
+        False: none) come before exclude, so command line patterns override them. """
+        lines: List[str] = []
+        if ignore_file is not False:
+            file = Path(ignore_file) if ignore_file else Path(root) / PathFilter.IGNORE_FILE
+            if ignore_file or file.is_file(): lines = file.read_text(encoding="utf-8").splitlines()
+        bound = PathFilter(lines + self.exclude, self.include, self.min_size, self.max_size, self.newer_than, self.older_than, self.max_depth)
+        bound._root = os.path.normpath(str(root))
+        bound._offset = len(bound._root.rstrip(os.sep)) + 1
+        return bound
+
+    def keep(self, entry: os.DirEntry, is_dir: bool) -> bool:
+        """ Whether a listed entry stays in the tree. Files are stat'ed only for size/age rules (the stat is cached on the entry). """
+        rel = self._relative(entry.path)
+        if self._any is not None and self._any.match(rel) and self._excluded(rel, is_dir): return False
+        if is_dir: return True
+        if self._include is not None and not self._include.match(rel): return False
+        if not self._stat_needed: return True
+        try: stat = entry.stat()
+        except OSError: return True  # boyutu okunamayan dosya elenmez, walk'taki gibi boyutsuz eklenir
+        return ((self.min_size is None or stat.st_size >= self.min_size) and (self.max_size is None or stat.st_size <= self.max_size)
+                and (self._oldest is None or stat.st_mtime_ns >= self._oldest) and (self._newest is None or stat.st_mtime_ns <= self._newest))
+
+    def descend(self, path: Union[str, Path]) -> bool:
+        """ False for folders at max_depth: they stay in the tree, empty, and are never listed. """
+        if self.max_depth is None: return True
+        rel = self._relative(str(path))
+        return (rel.count("/") + 1 if rel else 0) < self.max_depth
+
+    def _relative(self, path: str) -> str:
+        if self._root == ".": rel = path[2:] if path.startswith("." + os.sep) else ("" if path == "." else path)  # Path("./a") -> "a"
+        else: rel = path[self._offset:]
+        return rel if os.sep == "/" else rel.replace(os.sep, "/")
+
+    def _excluded(self, rel: str, is_dir: bool) -> bool:
+        for regex, negate, dir_only in reversed(self._rules):
+            if (is_dir or not dir_only) and regex.match(rel): return not negate
+        return False
+
+    @staticmethod
+    def _translate(pattern: str) -> Tuple[str, bool]:
+        """ gitignore pattern -> (regex for the '/'-separated path relative to the root, folders only?) """
+        dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        out, i, n = [], 0, len(pattern)
+        while i < n:
+            c = pattern[i]
+            if pattern.startswith("**/", i): out.append("(?:.*/)?"); i += 3
+            elif pattern.startswith("**", i): out.append(".*"); i += 2
+            elif c == "*": out.append("[^/]*"); i += 1
+            elif c == "?": out.append("[^/]"); i += 1
+            elif c == "\\" and i + 1 < n: out.append(re.escape(pattern[i + 1])); i += 2
+            elif c == "[" and pattern.find("]", i + 2) != -1:
+                j = pattern.find("]", i + 2)
+                body = pattern[i + 1:j]
+                out.append("[" + ("^" + body[1:] if body.startswith("!") else body).replace("\\", "\\\\") + "]")
+                i = j + 1
+            else: out.append(re.escape(c)); i += 1
+        return ("" if anchored else "(?:.*/)?") + "".join(out) + "$", dir_only
+
+    @staticmethod
+    def parse_size(text: str) -> int:
+        """ "500", "64K", "1.5M", "2G" -> bytes (1K = 1024). """
+        match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]?)[iI]?[bB]?\s*", text)
+        if not match or match.group(2).upper() not in PathFilter.SIZE_UNITS: raise ValueError(f"invalid size: {text!r}")
+        return int(float(match.group(1)) * PathFilter.SIZE_UNITS[match.group(2).upper()])
+
+    @staticmethod
+    def parse_age(text: str) -> float:
+        """ "90", "30m", "12h", "7d", "2w" -> seconds. """
+        match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhdw]?)\s*", text)
+        if not match: raise ValueError(f"invalid age: {text!r}")
+        return float(match.group(1)) * PathFilter.AGE_UNITS[match.group(2)]
+#==============================================================================
+
+
+#============================ AGGREGATIONS ====================================
+class TreeStats:
+    """ Aggregations filled while the tree is walked, so the exported tree never has to be read back: the top_n largest
+    files and folders (min-heaps of top_n entries), file count and bytes per extension and per age bucket, and files
+    grouped by size as duplicate candidates for duplicates(). Walkers call add_files once per listed folder and
+    add_folder once per merged folder; both take a lock, so walk_parallel feeds one instance from every thread. """
+    AGE_BUCKETS = ((86400, "< 1 gün"), (7 * 86400, "< 1 hafta"), (30 * 86400, "< 1 ay"), (365 * 86400, "< 1 yıl"), (None, ">= 1 yıl"))
+    UNKNOWN_AGE = "bilinmiyor"
+
+    def __init__(self, top_n: int = 10, now: Optional[datetime] = None):
+        if not isinstance(top_n, int) or top_n < 1: raise ValueError(f"top_n must be a positive integer: {top_n}")
+        self.top_n, self.now = top_n, now or datetime.now()
+        self.files, self.bytes = 0, 0
+        self.extensions: Dict[str, List[int]] = {}  # ".py" -> [dosya sayısı, bayt]
+        self.ages: Dict[str, List[int]] = {label: [0, 0] for _, label in TreeStats.AGE_BUCKETS + ((None, TreeStats.UNKNOWN_AGE),)}
+        self.duplicate_groups: Optional[List[Tuple[int, List[str]]]] = None  # duplicates() ile doldurulur: (boyut, yollar)
+        self._cutoffs = [(self.now - timedelta(seconds=seconds) if seconds else datetime(1, 1, 1), label) for seconds, label in TreeStats.AGE_BUCKETS]
+        self._top_files: List[Tuple[int, str]] = []
+        self._top_folders: List[Tuple[int, str]] = []
+        self._by_size: Dict[int, Union[C_file, List[C_file]]] = {}  # aynı boyuttaki ikinci dosyada listeye dönüşür
+        self._lock = threading.Lock()
+
+    @property
+    def top_files(self) -> List[Tuple[int, str]]: return sorted(self._top_files, reverse=True)
+
+    @property
+    def top_folders(self) -> List[Tuple[int, str]]: return sorted(self._top_folders, reverse=True)
+
+    def add_files(self, files: List[C_file]) -> None:
+        with self._lock:
+            top, top_n, by_size, extensions, ages, cutoffs = self._top_files, self.top_n, self._by_size, self.extensions, self.ages, self._cutoffs
+            for file in files:
+                size = file.size
+                self.bytes += size
+                extension = os.path.splitext(file.name)[1].lower()
+                counter = extensions.get(extension)
+                if counter is None: counter = extensions[extension] = [0, 0]
+                counter[0] += 1
+                counter[1] += size
+                label = TreeStats.UNKNOWN_AGE
+                if file.is_sized:
+                    for cutoff, label in cutoffs:
+                        if file.date >= cutoff: break
+                    if size > 0:
+                        same = by_size.get(size)
+                        if same is None: by_size[size] = file
+                        elif isinstance(same, list): same.append(file)
+                        else: by_size[size] = [same, file]
+                bucket = ages[label]
+                bucket[0] += 1
+                bucket[1] += size
+                if len(top) < top_n: heapq.heappush(top, (size, str(file.path)))
+                elif size >= top[0][0] and (size, str(file.path)) > top[0]: heapq.heapreplace(top, (size, str(file.path)))  # eşitlikte yol sırası: yürüyüş sırasından bağımsız
+            self.files += len(files)
+
+    def add_folder(self, folder: C_folder) -> None:
+        with self._lock:
+            if len(self._top_folders) < self.top_n: heapq.heappush(self._top_folders, (folder.size, str(folder.path)))
+            elif (folder.size, str(folder.path)) > self._top_folders[0]: heapq.heapreplace(self._top_folders, (folder.size, str(folder.path)))
+
+    def duplicates(self, finder: Optional["DuplicateFinder"] = None) -> List[Tuple[int, List[str]]]:
+        """ Groups of files with identical content, most wasted space first, found by finder (default: a single process
+        DuplicateFinder without cache) among the files that share their size with another one. """
+        candidates = [file for same in self._by_size.values() if isinstance(same, list) for file in same]
+        self.duplicate_groups = (finder or DuplicateFinder()).find(candidates)
+        return self.duplicate_groups
+
+    def to_dict(self) -> Dict[str, object]:
+        """ JSON-ready summary; duplicates are included once duplicates() has run. """
+        data: Dict[str, object] = {
+            "files": self.files, "size": self.bytes,
+            "top_files": [{"path": path, "size": size} for size, path in self.top_files],
+            "top_folders": [{"path": path, "size": size} for size, path in self.top_folders],
+            "extensions": {ext or "(uzantısız)": {"files": count, "size": size} for ext, (count, size) in sorted(self.extensions.items(), key=lambda item: (-item[1][1], item[0]))},
+            "ages": {label: {"files": count, "size": size} for label, (count, size) in self.ages.items()}}
+        if self.duplicate_groups is not None:
+            data["duplicates"] = [{"size": size, "wasted": size * (len(paths) - 1), "paths": paths} for size, paths in self.duplicate_groups]
+        return data
+#==============================================================================
+
+
+#============================ DUPLICATE FINDER ================================
+def _hash_file(job: Tuple[str, int, int, bool]) -> Optional[bytes]:
+    """ Process pool worker: blake2b of the first and last `block` bytes of a file of `size` bytes, or of the whole file
+    when `whole` is set. Read through mmap; None if the file cannot be read or its size changed since the walk. """
+    path, size, block, whole = job
+    digest = hashlib.blake2b(digest_size=HashCache.DIGEST_SIZE)
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size != size: return None
+            try: mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError, OverflowError): mapped = None  # mmap kullanılamıyorsa (özel dosyalar, 32 bit adres alanı) okunur
+            if mapped is not None:
+                with mapped, memoryview(mapped) as view:
+                    if whole: digest.update(view)
+                    else:
+                        digest.update(view[:block])
+                        digest.update(view[-block:])
+            elif whole:
+                for chunk in iter(lambda: f.read(1 << 20), b""): digest.update(chunk)
+            else:
+                digest.update(f.read(block))
+                f.seek(-block, os.SEEK_END)
+                digest.update(f.read(block))
+    except OSError: return None
+    return digest.digest()
+
+
+class HashCache:
+    """ Content hashes kept across runs, keyed by (device, inode, mtime_ns, size): a file that was not modified or
+    replaced keeps its key, so its hashes are reused without opening it. save() writes only the entries used by this
+    run, so deleted and modified files do not pile up in the file. """
+    MAGIC = b"DXHASH1\n"
+    EDGE, FULL = 1, 2         # flags: ilk/son blok hash'i var / tam hash var
+    DIGEST_SIZE = 16
+
+    def __init__(self):
+        self.entries: Dict[Tuple[int, int, int, int], List[Optional[bytes]]] = {}  # bu çalıştırmada kullanılanlar: anahtar -> [kenar, tam]
+        self._stored: Dict[Tuple[int, int, int, int], List[Optional[bytes]]] = {}  # dosyadan yüklenip henüz sorulmamış olanlar
+
+    def __len__(self) -> int: return len(self.entries) + len(self._stored)
+
+    def get(self, key: Tuple[int, int, int, int], kind: int) -> Optional[bytes]:
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self._stored.pop(key, None)
+            if entry is None: return None
+            self.entries[key] = entry
+        return entry[kind - 1]
+
+    def put(self, key: Tuple[int, int, int, int], kind: int, digest: bytes) -> None:
+        entry = self.entries.get(key) or self._stored.pop(key, None) or [None, None]
+        self.entries[key] = entry
+        entry[kind - 1] = digest
+
+    def save(self, file: Union[str, Path]) -> None:
+        """ Write the used entries atomically: magic line, JSON header line, key arrays, flags, edge and full digests. """
+        file, empty = Path(file), bytes(HashCache.DIGEST_SIZE)
+        arrays = array("Q"), array("Q"), array("q"), array("q")
+        for key in self.entries:
+            for arr, value in zip(arrays, key): arr.append(value)
+        header = {"entries": len(self.entries), "digest_size": HashCache.DIGEST_SIZE, "byteorder": sys.byteorder, "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+        def write(f: BinaryIO) -> None:
+            f.write(HashCache.MAGIC + json.dumps(header).encode() + b"\n")
+            for arr in arrays: arr.tofile(f)
+            f.write(bytes((HashCache.EDGE if edge is not None else 0) | (HashCache.FULL if full is not None else 0) for edge, full in self.entries.values()))
+            f.write(b"".join((edge or empty) + (full or empty) for edge, full in self.entries.values()))
+        _write_atomic(file, write)
+
+    @classmethod
+    def load(cls, file: Union[str, Path]) -> "HashCache":
+        cache = cls()
+        with open(file, "rb") as f:
+            if f.readline() != cls.MAGIC: raise ValueError(f"Not a directory_explorer hash cache: {file}")
+            header = json.loads(f.readline())
+            count, size = header["entries"], header["digest_size"]
+            if size != cls.DIGEST_SIZE: raise ValueError(f"Hash cache uses another digest size: {file}")
+            arrays = array("Q"), array("Q"), array("q"), array("q")
+            try:
+                for arr in arrays: arr.fromfile(f, count)
+            except EOFError: raise ValueError(f"Hash cache is truncated: {file}")
+            if header["byteorder"] != sys.byteorder:
+                for arr in arrays: arr.byteswap()
+            flags, digests = f.read(count), f.read(count * 2 * size)
+            if len(flags) != count or len(digests) != count * 2 * size: raise ValueError(f"Hash cache is truncated: {file}")
+        for i, key in enumerate(zip(*arrays)):
+            edge, full = digests[2 * i * size:(2 * i + 1) * size], digests[(2 * i + 1) * size:(2 * i + 2) * size]
+            cache._stored[key] = [edge if flags[i] & cls.EDGE else None, full if flags[i] & cls.FULL else None]
+        return cache
+
+
+class DuplicateFinder:
+    """ Duplicate files among C_file entries that already carry their size, so only files sharing a size are read.
+    Each of them is hashed by its first and last block_size bytes (files of up to two blocks are hashed whole) and only
+    files that still match are hashed in full. Hashing runs in a pool of `workers` processes reading through mmap;
+    with a HashCache, files whose (device, inode, mtime, size) was hashed by an earlier run are not opened at all. """
+    def __init__(self, workers: int = 1, block_size: int = 64 * 1024, cache: Optional[HashCache] = None):
+        if not isinstance(workers, int) or workers < 1: raise ValueError(f"workers must be a positive integer: {workers}")
+        if not isinstance(block_size, int) or block_size < 1: raise ValueError(f"block_size must be a positive integer: {block_size}")
+        self.workers, self.block_size, self.cache = workers, block_size, cache
+        self.counts = {"candidates": 0, "read": 0, "full": 0, "cached": 0, "bytes": 0}  # son find() çağrısı: okunan dosya/bayt, önbellekten gelen hash
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def find(self, files: Iterable[C_file]) -> List[Tuple[int, List[str]]]:
+        """ (size, sorted paths) of every group of identical non-empty files, most wasted space first. """
+        by_size: Dict[int, List[C_file]] = {}
+        for file in files:
+            if file.is_sized and file.size > 0: by_size.setdefault(file.size, []).append(file)
+        groups = [group for group in by_size.values() if len(group) > 1]
+        self.counts = dict.fromkeys(self.counts, 0)
+        self.counts["candidates"] = sum(map(len, groups))
+        try:
+            groups = self._split(groups, HashCache.EDGE)
+            groups = [group for group in groups if group[0].size <= 2 * self.block_size] + self._split([group for group in groups if group[0].size > 2 * self.block_size], HashCache.FULL)
+        finally:
+            if self._executor is not None: self._executor.shutdown()
+            self._executor = None
+        result = [(group[0].size, sorted(str(file.path) for file in group)) for group in groups]
+        result.sort(key=lambda group: (group[0] * (len(group[1]) - 1), group[1]), reverse=True)
+        return result
+
+    def _split(self, groups: List[List[C_file]], kind: int) -> List[List[C_file]]:
+        """ Split every group by the given hash; unreadable files and groups of one are dropped. """
+        digests, result, index = self._digests([file for group in groups for file in group], kind), [], 0
+        for group in groups:
+            by_hash: Dict[bytes, List[C_file]] = {}
+            for file in group:
+                if digests[index] is not None: by_hash.setdefault(digests[index], []).append(file)
+                index += 1
+            result.extend(same for same in by_hash.values() if len(same) > 1)
+        return result
+
+    def _digests(self, files: List[C_file], kind: int) -> List[Optional[bytes]]:
+        """ Hash of every file from the cache or the pool; EDGE hashes of files up to two blocks are whole-file hashes. """
+        kinds = [HashCache.FULL if kind == HashCache.FULL or file.size <= 2 * self.block_size else HashCache.EDGE for file in files]
+        keys: List[Optional[Tuple[int, int, int, int]]] = [None] * len(files)
+        digests: List[Optional[bytes]] = [None] * len(files)
+        if self.cache is not None:
+            for i, file in enumerate(files):
+                try: stat = os.stat(file.path)
+                except OSError: continue
+                if stat.st_size != file.size: continue  # taramadan sonra değişmiş
+                keys[i] = (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+                digests[i] = self.cache.get(keys[i], kinds[i])
+            todo = [i for i in range(len(files)) if digests[i] is None and keys[i] is not None]
+            self.counts["cached"] += sum(digest is not None for digest in digests)
+        else: todo = list(range(len(files)))
+        jobs = [(str(files[i].path), files[i].size, self.block_size, kinds[i] == HashCache.FULL) for i in todo]
+        self.counts["read"] += len(jobs)
+        self.counts["full"] += len(jobs) if kind == HashCache.FULL else 0
+        self.counts["bytes"] += sum(size if whole else 2 * block for _, size, block, whole in jobs)
+        if self.workers == 1 or len(jobs) < 2: hashed = map(_hash_file, jobs)
+        else:
+            if self._executor is None: self._executor = ProcessPoolExecutor(self.workers)
+            # kenar hash'leri küçük ve eşit işler, tam hash'ler dosya boyutu kadar farklı: tek tek dağıtılır
+            hashed = self._executor.map(_hash_file, jobs, chunksize=1 if kind == HashCache.FULL else max(1, min(256, len(jobs) // (self.workers * 4))))
+        for i, digest in zip(todo, hashed):
+            digests[i] = digest
+            if digest is not None and keys[i] is not None: self.cache.put(keys[i], kinds[i], digest)
+        return digests
 #==============================================================================
 
 
@@ -167,11 +648,18 @@ class ClassFile:
         if not path.is_file(): return C_file(name="", path=path, size=0, date=datetime(2000, 1, 1), is_sized=False)
         return C_file(name=path.name, path=path, size=path.stat().st_size if path.is_file() else 0, date=datetime.fromtimestamp(path.stat().st_mtime) if path.is_file() else datetime(2000, 1, 1), is_sized=False)
 
+    @staticmethod
+    def create_class_file_from_entry(entry: os.DirEntry) -> C_file:
+        """ Build a C_file from an os.scandir entry; the single stat result is cached on the entry. """
+        try: stat = entry.stat()
+        except OSError: return C_file(name=entry.name, path=Path(entry.path), size=0, date=datetime(2000, 1, 1), is_sized=False)
+        return C_file(name=entry.name, path=Path(entry.path), size=stat.st_size, date=datetime.fromtimestamp(stat.st_mtime), is_sized=True)
+
     @staticmethod
     def to_dict_data(file: C_file) -> Dict[str, Union[str, int]]:
         """ Convert the C_file object to a dictionary. """
         #date format : YYYY-MM-DD HH:MM:SS
-        return {"name": file.name, "path": str(file.path), "date": file.date.strftime("%Y-%m-%d %H:%M:%S"), "size": f"{file.size:,}".replace(",", ".")}
+        return {"name": file.name, "path": str(file.path), "date": _format_date(file.date), "size": f"{file.size:,}".replace(",", ".")}
 
     @staticmethod
     def calculate_size(object: C_file) -> int:
@@ -193,63 +681,584 @@ class ClassDirectory:
 
     @staticmethod
     def to_dict_data(folder: C_folder) -> Dict[str, Union[str, int, list, dict]]:
-        """ Convert the C_folder object to a dictionary. """
-        return { "name": folder.name, "path": str(folder.path), "date": folder.date.strftime("%Y-%m-%d %H:%M:%S"), "size": f"{folder.size:,}".replace(",", "."), "files": [ClassFile.to_dict_data(f) for f in folder.files], "folders": [ClassDirectory.to_dict_data(f) for f in folder.folders]}
+        """ Convert the C_folder object to a dictionary (explicit stack, any depth). """
+        def node(folder: C_folder) -> Dict[str, Union[str, int, list, dict]]:
+            return { "name": folder.name, "path": str(folder.path), "date": _format_date(folder.date), "size": f"{folder.size:,}".replace(",", "."), "files": [ClassFile.to_dict_data(f) for f in folder.files], "folders": []}
+        root = node(folder)
+        stack = [(folder, root)]
+        while stack:
+            current, data = stack.pop()
+            for sub in current.folders:
+                data["folders"].append(node(sub))
+                stack.append((sub, data["folders"][-1]))
+        return root
+
+    @staticmethod
+    def iter_json(folder: C_folder, indent: int = 4, head: Optional[Dict[str, str]] = None):
+        """ Yield the JSON of to_dict_data(folder) (with head's keys first) piece by piece, straight from the tree.
+        No dict or string of the whole tree is built; extra memory grows only with the depth of the tree. """
+        encode_str = json.encoder.encode_basestring
+        def pad(level: int) -> str: return "\n" + " " * (indent * level)
+        def opening(folder: C_folder, level: int, head: Optional[Dict[str, str]]):
+            yield "{"
+            for key, value in (*(head or {}).items(), ("name", folder.name), ("path", str(folder.path)), ("date", _format_date(folder.date)), ("size", f"{folder.size:,}".replace(",", "."))):
+                yield f"{pad(level + 1)}{encode_str(key)}: {encode_str(value)},"
+            files, inner, close = folder.files, pad(level + 3), pad(level + 2)
+            yield f'{pad(level + 1)}"files": [' + ("" if files else "],")
+            for i, file in enumerate(files):  # dosya başına tek parça: {"name": ..., "path": ..., "date": ..., "size": ...}
+                yield ("," if i else "") + close + "{" + ",".join(f"{inner}{encode_str(key)}: {encode_str(value) if isinstance(value, str) else json.dumps(value)}" for key, value in ClassFile.to_dict_data(file).items()) + close + "}"
+            if files: yield f"{pad(level + 1)}],"
+            yield f'{pad(level + 1)}"folders": '
+        yield from opening(folder, 0, head)
+        stack = [[iter(folder.folders), 0, True]]  # [alt klasör iteratörü, seviye, ilk mi]
+        while stack:
+            frame = stack[-1]
+            sub = next(frame[0], None)
+            if sub is None:
+                stack.pop()
+                yield ("[]" if frame[2] else f"{pad(frame[1] + 1)}]") + pad(frame[1]) + "}"
+                continue
+            yield ("[" if frame[2] else ",") + pad(frame[1] + 2)
+            frame[2] = False
+            yield from opening(sub, frame[1] + 2, None)
+            stack.append([iter(sub.folders), frame[1] + 2, True])
 
     @staticmethod
-    def walk(object: C_folder, force_walk:bool = False) -> bool:
-        """ Walk through the directory and return a boolean indicating success or failure."""
+    def iter_ndjson(folder: C_folder):
+        """ Yield one JSON line per folder and file (folder first, then its files, then its subfolders). """
+        stack = [folder]
+        while stack:
+            current = stack.pop()
+            yield json.dumps({"type": "folder", "name": current.name, "path": str(current.path), "date": _format_date(current.date), "size": current.size}, ensure_ascii=False) + "\n"
+            for file in current.files:
+                yield json.dumps({"type": "file", "name": file.name, "path": str(file.path), "date": _format_date(file.date), "size": file.size}, ensure_ascii=False) + "\n"
+            stack.extend(reversed(current.folders))
+
+    @staticmethod
+    def iter_txt(folder: C_folder, width: Optional[int] = None, lines_per_chunk: int = 4096):
+        """ Yield the TXT tree of folder in chunks of about lines_per_chunk lines, formatting every entry once.
+        File sizes start at column width + 2; when width is None it is measured first with a pass that only reads names. """
+        if width is None:
+            width, stack = 0, [(folder, 5)]
+            while stack:
+                current, indent = stack.pop()
+                files = current.files
+                if files: width = max(width, indent + max(len(file.name) for file in files))  # len("|    " * (derinlik+1) + file.name)
+                stack.extend((sub, indent + 5) for sub in current.folders)
+        width, dashes, chunk, stack = width + 2, "-" * 50, [], [(folder, "")]
+        while stack:
+            current, indent = stack.pop()
+            folders, file_indent = current.folders, indent + "|    "
+            chunk.append(f"{indent}{current.name}({len(folders)}){dashes} {_format_date(current.date)}\n")
+            chunk.extend(f"{(file_indent + file.name).ljust(width)}{file.size} {_format_date(file.date)}\n" for file in current.files)
+            if len(chunk) >= lines_per_chunk:
+                yield "".join(chunk)
+                chunk = []
+            stack.extend((sub, file_indent) for sub in reversed(folders))  # ters sırayla: ilk alt klasör önce yazılır
+        if chunk: yield "".join(chunk)
+
+    @staticmethod
+    def walk(object: C_folder, force_walk:bool = False, workers: int = 1, rules: Optional[PathFilter] = None, stats: Optional[TreeStats] = None) -> bool:
+        """ Walk through the directory and return a boolean indicating success or failure. workers > 1 walks in parallel.
+        rules: a PathFilter bound to object.path; entries it drops are never stat'ed, folders it drops are never listed.
+        stats: a TreeStats fed with every listed file and every merged subfolder during the same walk. """
         if not isinstance(object, C_folder): return False
-        if not object.path.exists() or not object.path.is_dir(): return False
         if object.is_walked and not force_walk: return True
-        # check path is valid and not empty
-        try: 
-            if not object.path.is_dir(): return False
-            filenames = os.listdir(object.path)
-            if not filenames: 
-                object.is_walked = True
-                object.is_sized = True
-                object.size = 0
-                object.files = []
-                object.folders = []
-                return True
-        except Exception: return False
-        object.files = []
-        object.folders = []
-        object.size = 0
-        last_modified = datetime(1, 1, 1)
-        for entry in os.listdir(object.path):
-            full_path = object.path / entry
-            if full_path.is_file():
-                newFile = ClassFile.create_class_file(full_path)
-                object.size += ClassFile.calculate_size(newFile)
-                object.files.append(newFile)
-                if newFile.date > last_modified: last_modified = newFile.date
-            elif full_path.is_dir():
-                newFolder = ClassDirectory.create_class_directory(full_path)
-                if not isinstance(newFolder, C_folder): continue
-                ClassDirectory.walk(newFolder)
-                object.size += newFolder.size
-                if newFolder.date > last_modified: last_modified = newFolder.date
-                object.folders.append(newFolder)
-        object.date = last_modified
+        if workers > 1: return ClassDirectory.walk_parallel(object, workers, rules=rules, stats=stats)
+        return ClassDirectory._scan(object, rules, stats)
+
+    @staticmethod
+    def walk_parallel(object: C_folder, workers: int = 8, max_queue: int = 1024, rules: Optional[PathFilter] = None, stats: Optional[TreeStats] = None) -> bool:
+        """ Walk with `workers` threads: subfolders are fanned out through a bounded queue, sizes and dates are merged bottom-up at the end. """
+        subfolders = ClassDirectory._scan_level(object, rules, stats)
+        if subfolders is None: return False
+        tasks: Queue = Queue(maxsize=max_queue)
+        errors: List[BaseException] = []
+        def worker() -> None:
+            while True:
+                folder = tasks.get()
+                try:
+                    if folder is None: return
+                    stack = [folder]
+                    while stack:
+                        for sub in ClassDirectory._scan_level(stack.pop(), rules, stats) or ():
+                            try: tasks.put_nowait(sub)
+                            except Full: stack.append(sub)  # kuyruk doluysa alt klasörü bu thread kendisi tarar, bloklanmaz
+                except BaseException as e: errors.append(e)
+                finally: tasks.task_done()
+        threads = [threading.Thread(target=worker, name=f"walk-{i}", daemon=True) for i in range(workers)]
+        for t in threads: t.start()
+        for sub in subfolders: tasks.put(sub)
+        tasks.join()
+        for _ in threads: tasks.put(None)
+        for t in threads: t.join()
+        if errors: raise errors[0]
+        ClassDirectory._merge_tree(object, stats)
+        return True
+
+    @staticmethod
+    def _scan(object: C_folder, rules: Optional[PathFilter] = None, stats: Optional[TreeStats] = None) -> bool:
+        """ Depth-first walk on the calling thread with an explicit stack, so deep trees never hit the recursion limit. """
+        subfolders = ClassDirectory._scan_level(object, rules, stats)
+        if subfolders is None: return False
+        stack = list(subfolders)
+        while stack: stack.extend(ClassDirectory._scan_level(stack.pop(), rules, stats) or ())  # okunamayan alt klasör boş ve is_walked=False kalır
+        ClassDirectory._merge_tree(object, stats)
+        return True
+
+    @staticmethod
+    def _scan_level(object: C_folder, rules: Optional[PathFilter] = None, stats: Optional[TreeStats] = None) -> Optional[List[C_folder]]:
+        """ Fill one folder from a single listing. Subfolders are created but not walked; returns them, or None if the directory cannot be listed. """
+        listing = ClassDirectory._list_level(object.path, rules=rules)
+        if listing is None: return None
+        if stats is not None and listing[0]: stats.add_files(listing[0])
+        object.files, object.folders, object.size, object.date = listing
         object.is_walked = True
+        return listing[1]
+
+    @staticmethod
+    def _list_level(path: Path, new_folder: Callable[[os.DirEntry], C_folder] = lambda entry: C_folder(name=entry.name, path=Path(entry.path)), rules: Optional[PathFilter] = None) -> Optional[Tuple[List[C_file], List[C_folder], int, datetime]]:
+        """ Single os.scandir pass over one directory: entry types come from the listing, every file costs one stat.
+        Returns (files, subfolders made by new_folder, size and newest date of the files), or None if it cannot be listed. """
+        if rules is not None and not rules.descend(path): return [], [], 0, datetime(1, 1, 1)
+        try: entries = os.scandir(path)
+        except OSError: return None
+        files, folders, size, last_modified = [], [], 0, datetime(1, 1, 1)
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        if rules is not None and not rules.keep(entry, False): continue
+                        newFile = ClassFile.create_class_file_from_entry(entry)
+                        size += newFile.size
+                        files.append(newFile)
+                        if newFile.date > last_modified: last_modified = newFile.date
+                    elif entry.is_dir() and (rules is None or rules.keep(entry, True)): folders.append(new_folder(entry))
+                except OSError: continue
+        return files, folders, size, last_modified
+
+    @staticmethod
+    def measure(path: Union[str, Path], cache: Optional[Dict[str, Tuple[int, int]]] = None, rules: Optional[PathFilter] = None) -> Tuple[int, datetime]:
+        """ Size-only fast path: total size and newest file date below path, equal to walk + folder.size/date, but no
+        C_file/C_folder is created (os.scandir, one stat per file, explicit stack). cache maps every measured folder
+        (os.path.normpath) to (size, newest mtime ns); folders already in it are not listed again. """
+        cache = {} if cache is None else cache
+        root = os.path.normpath(str(path))
+        if root not in cache:
+            pending, stack = [], [root]
+            while stack:
+                folder, size, newest, subfolders = stack.pop(), 0, CompactTree.NO_DATE, []
+                try: entries = os.scandir(folder) if rules is None or rules.descend(folder) else None  # derinlik sınırındaki klasör boş kalır
+                except OSError: entries = None  # okunamayan klasör: 0 bayt ve tarihsiz, walk ile aynı
+                if entries is not None:
+                    with entries:
+                        for entry in entries:
+                            try:
+                                if entry.is_file():
+                                    if rules is not None and not rules.keep(entry, False): continue
+                                    try: stat = entry.stat()
+                                    except OSError: mtime = _UNSIZED_NS
+                                    else: size, mtime = size + stat.st_size, stat.st_mtime_ns
+                                    if mtime > newest: newest = mtime
+                                elif entry.is_dir() and (rules is None or rules.keep(entry, True)):
+                                    subfolders.append(entry.path)
+                                    if entry.path not in cache: stack.append(entry.path)
+                            except OSError: continue
+                pending.append((folder, size, newest, subfolders))
+            for folder, size, newest, subfolders in reversed(pending):  # alt klasörler her zaman ebeveynden sonra eklenir
+                for sub in subfolders:
+                    sub_size, sub_newest = cache[sub]
+                    size += sub_size
+                    if sub_newest > newest: newest = sub_newest
+                cache[folder] = size, newest
+        size, newest = cache[root]
+        return size, datetime(1, 1, 1) if newest == CompactTree.NO_DATE else _ns_to_datetime(newest)
+
+    @staticmethod
+    def _merge_children(object: C_folder) -> None:
+        """ Add the sizes and latest dates of the (already merged) subfolders to object. """
+        for sub in object.folders:
+            object.size += sub.size
+            if sub.date > object.date: object.date = sub.date
         object.is_sized = True
-        return True
+
+    @staticmethod
+    def _merge_tree(object: C_folder, stats: Optional[TreeStats] = None) -> None:
+        """ Bottom-up merge for a tree scanned level by level: every folder is merged after all of its subfolders.
+        stats receives every folder below object once its size is final. """
+        order, stack = [], [object]
+        while stack:
+            folder = stack.pop()
+            order.append(folder)
+            stack.extend(folder.folders)
+        for folder in reversed(order):
+            if folder.is_walked: ClassDirectory._merge_children(folder)
+            if stats is not None and folder is not object: stats.add_folder(folder)
+#==============================================================================
+
+
+#============================ COMPACT TREE ====================================
+class CompactTree:
+    """ Array-backed directory tree for multi-million entry scans.
+    Every file and folder is one index: names are interned in `names`, parents/children are index arrays,
+    sizes and mtimes (ns) are int64 arrays. Children of a folder are contiguous: first[i] .. first[i] + count[i]. """
+    DIR, DONE = 1, 2          # flags: klasör mü / klasör tarandı veya dosya boyutu okundu
+    NO_DATE = -2**63          # datetime(1, 1, 1): boş ya da okunamayan klasör
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.names: List[str] = []
+        self._name_ids: Dict[str, int] = {}
+        self.name, self.parent, self.first, self.count = array("I"), array("i"), array("I"), array("I")
+        self.size, self.mtime, self.flags = array("q"), array("q"), bytearray()
+        self._append(-1, self.path.name, CompactTree.DIR, 0, CompactTree.NO_DATE)
+
+    def __len__(self) -> int: return len(self.flags)
+
+    @property
+    def root(self) -> "CompactFolder": return CompactFolder(self, 0)
+
+    @classmethod
+    def from_path(cls, path: Union[str, Path], rules: Optional[PathFilter] = None) -> "CompactTree":
+        """ Scan path breadth-first with os.scandir (one stat per file) and merge sizes/dates bottom-up; rules: see ClassDirectory.walk. """
+        tree = cls(path)
+        pending = deque([(0, str(tree.path))])
+        while pending:
+            index, folder_path = pending.popleft()
+            if rules is not None and not rules.descend(folder_path):
+                tree.flags[index] |= CompactTree.DONE  # derinlik sınırındaki klasör boş kalır
+                continue
+            try: entries = os.scandir(folder_path)
+            except OSError: continue  # okunamayan klasör boş ve taranmamış kalır
+            first = len(tree.flags)
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file():
+                            if rules is not None and not rules.keep(entry, False): continue
+                            try: stat = entry.stat()
+                            except OSError: tree._append(index, entry.name, 0, 0, _UNSIZED_NS)
+                            else: tree._append(index, entry.name, CompactTree.DONE, stat.st_size, stat.st_mtime_ns)
+                        elif entry.is_dir() and (rules is None or rules.keep(entry, True)):
+                            pending.append((len(tree.flags), entry.path))
+                            tree._append(index, entry.name, CompactTree.DIR, 0, CompactTree.NO_DATE)
+                    except OSError: continue
+            tree.first[index], tree.count[index] = first, len(tree.flags) - first
+            tree.flags[index] |= CompactTree.DONE
+        parent, size, mtime = tree.parent, tree.size, tree.mtime
+        for i in range(len(tree.flags) - 1, 0, -1):  # çocuklar her zaman ebeveynden sonra eklenir
+            p = parent[i]
+            size[p] += size[i]
+            if mtime[i] > mtime[p]: mtime[p] = mtime[i]
+        return tree
+
+    def _append(self, parent: int, name: str, flags: int, size: int, mtime_ns: int) -> None:
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self.names)
+            self.names.append(name)
+        self.name.append(name_id)
+        self.parent.append(parent)
+        self.first.append(0)
+        self.count.append(0)
+        self.size.append(size)
+        self.mtime.append(mtime_ns)
+        self.flags.append(flags)
+
+    def path_of(self, index: int) -> Path:
+        parts = []
+        while index > 0:
+            parts.append(self.names[self.name[index]])
+            index = self.parent[index]
+        return self.path.joinpath(*reversed(parts))
+
+    def date_of(self, index: int) -> datetime:
+        ns = self.mtime[index]
+        if ns == CompactTree.NO_DATE: return datetime(1, 1, 1)
+        return _ns_to_datetime(ns)
+
+    def children(self, index: int) -> range: return range(self.first[index], self.first[index] + self.count[index])
+
+
+class CompactFile(C_file):
+    """ Read-only C_file view of a CompactTree entry; fields are read from the arrays on access. """
+    __slots__ = ("_tree", "_index")
+
+    def __init__(self, tree: CompactTree, index: int): self._tree, self._index = tree, index
+
+    name = property(lambda self: self._tree.names[self._tree.name[self._index]])
+    path = property(lambda self: self._tree.path_of(self._index))
+    size = property(lambda self: self._tree.size[self._index])
+    date = property(lambda self: self._tree.date_of(self._index) if self.is_sized else datetime(2000, 1, 1))
+    is_sized = property(lambda self: bool(self._tree.flags[self._index] & CompactTree.DONE))
+
+
+class CompactFolder(C_folder):
+    """ Read-only C_folder view of a CompactTree folder; files and folders are new views on every access. """
+    __slots__ = ("_tree", "_index")
+
+    def __init__(self, tree: CompactTree, index: int): self._tree, self._index = tree, index
+
+    name = property(lambda self: self._tree.names[self._tree.name[self._index]])
+    path = property(lambda self: self._tree.path_of(self._index))
+    size = property(lambda self: self._tree.size[self._index])
+    date = property(lambda self: self._tree.date_of(self._index))
+    files = property(lambda self: [CompactFile(self._tree, i) for i in self._tree.children(self._index) if not self._tree.flags[i] & CompactTree.DIR])
+    folders = property(lambda self: [CompactFolder(self._tree, i) for i in self._tree.children(self._index) if self._tree.flags[i] & CompactTree.DIR])
+    is_walked = property(lambda self: bool(self._tree.flags[self._index] & CompactTree.DONE))
+    is_sized = is_walked
+#==============================================================================
+
+
+#============================ LAZY TREE =======================================
+class LazyFolder(C_folder):
+    """ C_folder whose directory is listed only when files/folders are first read (one os.scandir, subfolders stay unlisted).
+    size and date are computed on first read: from the listed part of the subtree plus ClassDirectory.measure for the rest,
+    sharing one cache per root. Folders at max_depth are collapsed: no files or folders, but the size and date of the
+    whole subtree. sizes=False skips the aggregation: size is 0 and date is the folder's own mtime. rules: see ClassDirectory.walk. """
+    __slots__ = ("name", "path", "_depth", "_max_depth", "_sizes", "_rules", "_cache", "_listing", "_totals")
+
+    def __init__(self, name: str, path: Path, max_depth: Optional[int] = None, sizes: bool = True, depth: int = 0, cache: Optional[Dict[str, Tuple[int, int]]] = None, rules: Optional[PathFilter] = None):
+        self.name, self.path, self._depth, self._max_depth, self._sizes, self._rules = name, path, depth, max_depth, sizes, rules
+        self._cache = {} if cache is None else cache  # ClassDirectory.measure önbelleği, kökten gelen tüm klasörlerde ortak
+        self._listing: Optional[tuple] = None  # (files, folders, dosyaların boyutu, en yeni dosya tarihi, listelendi mi)
+        self._totals: Optional[Tuple[int, datetime]] = None
+
+    @property
+    def collapsed(self) -> bool: return self._max_depth is not None and self._depth >= self._max_depth
+
+    def _expand(self) -> tuple:
+        if self._listing is None:
+            listing = None if self.collapsed else ClassDirectory._list_level(self.path, lambda entry: LazyFolder(entry.name, Path(entry.path), self._max_depth, self._sizes, self._depth + 1, self._cache, self._rules), self._rules)
+            self._listing = ([], [], 0, datetime(1, 1, 1), False) if listing is None else (*listing, True)
+        return self._listing
+
+    def _measure(self) -> Tuple[int, datetime]:
+        if self._totals is None and not self._sizes:
+            try: self._totals = 0, datetime.fromtimestamp(os.stat(self.path).st_mtime)
+            except OSError: self._totals = 0, datetime(1, 1, 1)
+        if self._totals is None:
+            order, stack = [], [self]
+            while stack:  # listelenmiş alt klasörler kendi listelerinden, diğerleri measure ile toplanır
+                folder = stack.pop()
+                order.append(folder)
+                if folder._listing is not None and folder._listing[4]: stack.extend(sub for sub in folder._listing[1] if sub._totals is None)
+            for folder in reversed(order):
+                if folder._listing is None or not folder._listing[4]:
+                    folder._totals = ClassDirectory.measure(folder.path, folder._cache, folder._rules)
+                    continue
+                _, folders, size, last_modified, _ = folder._listing
+                for sub in folders:
+                    size += sub._totals[0]
+                    if sub._totals[1] > last_modified: last_modified = sub._totals[1]
+                folder._totals = size, last_modified
+        return self._totals
+
+    files = property(lambda self: self._expand()[0])
+    folders = property(lambda self: self._expand()[1])
+    size = property(lambda self: self._measure()[0])
+    date = property(lambda self: self._measure()[1])
+    is_walked = property(lambda self: self._expand()[4])
+    is_sized = is_walked
+#==============================================================================
+
+
+#============================ SNAPSHOT ========================================
+class Snapshot:
+    """ Persisted index of a scan for incremental rescans. Every entry is keyed by its path (the chain of interned names
+    from the root) and stores its own size, mtime (ns) and inode; folders store their own mtime, not the newest child's.
+    Children of a folder are contiguous: first[i] .. first[i] + count[i]; index 0 is the root. """
+    MAGIC = b"DXSNAP1\n"
+    DIR, DONE = 1, 2          # flags: klasör mü / klasör listelendi veya dosya boyutu okundu
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.names: List[str] = []
+        self._name_ids: Dict[str, int] = {}
+        self.name, self.first, self.count = array("I"), array("I"), array("I")
+        self.size, self.mtime, self.inode, self.flags = array("q"), array("q"), array("Q"), bytearray()
+
+    def __len__(self) -> int: return len(self.flags)
+
+    def _arrays(self) -> Tuple[array, ...]: return self.name, self.first, self.count, self.size, self.mtime, self.inode
+
+    def _append(self, name: str, flags: int, size: int, mtime_ns: int, inode: int) -> int:
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self.names)
+            self.names.append(name)
+        for arr, value in zip(self._arrays(), (name_id, 0, 0, size, mtime_ns, inode)): arr.append(value)
+        self.flags.append(flags)
+        return len(self.flags) - 1
+
+    def children(self, index: int) -> Dict[str, int]:
+        """ Child name -> index for one folder, in the order the folder was listed. """
+        names, name = self.names, self.name
+        return {names[name[i]]: i for i in range(self.first[index], self.first[index] + self.count[index])}
+
+    def subtree_paths(self, index: int, path: Path) -> Iterator[str]:
+        """ Paths of the entry at index and everything below it. """
+        stack = [(index, path)]
+        while stack:
+            index, path = stack.pop()
+            yield str(path)
+            stack.extend((i, path / name) for name, i in self.children(index).items())
+
+    def save(self, file: Union[str, Path]) -> None:
+        """ Write the snapshot atomically: magic line, JSON header line, NUL separated names, raw arrays, flags. """
+        file = Path(file)
+        names = "\0".join(self.names).encode("utf-8", "surrogateescape")
+        header = {"root": str(self.path), "entries": len(self.flags), "names": len(self.names), "names_bytes": len(names), "byteorder": sys.byteorder, "itemsizes": [arr.itemsize for arr in self._arrays()], "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+        def write(f: BinaryIO) -> None:
+            f.write(Snapshot.MAGIC + json.dumps(header).encode() + b"\n" + names)
+            for arr in self._arrays(): arr.tofile(f)
+            f.write(self.flags)
+        _write_atomic(file, write)
+
+    @classmethod
+    def load(cls, file: Union[str, Path]) -> "Snapshot":
+        with open(file, "rb") as f:
+            if f.readline() != cls.MAGIC: raise ValueError(f"Not a directory_explorer snapshot: {file}")
+            header = json.loads(f.readline())
+            snapshot = cls(header["root"])
+            if header["itemsizes"] != [arr.itemsize for arr in snapshot._arrays()]: raise ValueError(f"Snapshot was written on an incompatible platform: {file}")
+            snapshot.names = f.read(header["names_bytes"]).decode("utf-8", "surrogateescape").split("\0") if header["names"] else []
+            snapshot._name_ids = {name: i for i, name in enumerate(snapshot.names)}
+            try:
+                for arr in snapshot._arrays(): arr.fromfile(f, header["entries"])
+            except EOFError: raise ValueError(f"Snapshot is truncated: {file}")
+            if header["byteorder"] != sys.byteorder:
+                for arr in snapshot._arrays(): arr.byteswap()
+            snapshot.flags = bytearray(f.read(header["entries"]))
+            if len(snapshot.flags) != header["entries"]: raise ValueError(f"Snapshot is truncated: {file}")
+        return snapshot
+
+    @classmethod
+    def scan(cls, root: C_folder, previous: Optional["Snapshot"] = None, verify_files: bool = False, stats: Optional[TreeStats] = None) -> Tuple["Snapshot", C_changes]:
+        """ Walk root like ClassDirectory.walk and record a new snapshot. A folder whose own mtime and inode equal the previous
+        snapshot reuses the stored listing: no os.scandir and no stat for its files (verify_files stats them to catch in-place
+        edits); only its subfolders are stat'ed, since a change deeper down does not touch the mtime of their parents. """
+        snapshot, changes = cls(root.path), C_changes()
+        try: stat = os.stat(root.path)
+        except OSError: return snapshot, changes
+        snapshot._append(root.path.name, Snapshot.DIR, 0, stat.st_mtime_ns, stat.st_ino)
+        compare = previous is not None and previous.path == root.path and len(previous) > 0  # False: ilk tarama, rapor boş kalır
+        pending = deque([(root, 0, 0 if compare else None)])
+        while pending:
+            folder, index, old = pending.popleft()
+            old_children = previous.children(old) if old is not None else {}
+            known = snapshot.mtime[index] or snapshot.inode[index]  # 0/0: stat'ı okunamamış klasör, her seferinde listelenir
+            if known and old is not None and previous.flags[old] & Snapshot.DONE and previous.mtime[old] == snapshot.mtime[index] and previous.inode[old] == snapshot.inode[index]:
+                listing = cls._reuse_listing(previous, old_children, folder.path, verify_files)
+                changes.reused += 1
+            else:
+                listing = cls._read_listing(folder.path)
+                if listing is None: continue  # okunamayan klasör boş ve taranmamış kalır
+                changes.scanned += 1
+            files, folders, size, last_modified, first = [], [], 0, datetime(1, 1, 1), len(snapshot)
+            for name, path, flags, entry_size, mtime_ns, inode in listing:
+                snapshot._append(name, flags, entry_size, mtime_ns, inode)
+                old_child = old_children.pop(name, None)
+                if old_child is not None and (previous.flags[old_child] ^ flags) & Snapshot.DIR:  # dosya <-> klasör
+                    changes.removed.extend(previous.subtree_paths(old_child, path))
+                    old_child = None
+                if compare and old_child is None: changes.added.append(str(path))
+                if flags & Snapshot.DIR:
+                    newFolder = C_folder(name=name, path=path)
+                    folders.append(newFolder)
+                    pending.append((newFolder, len(snapshot) - 1, old_child))
+                    continue
+                if old_child is not None and (previous.size[old_child], previous.mtime[old_child], previous.inode[old_child]) != (entry_size, mtime_ns, inode): changes.modified.append(str(path))
+                newFile = C_file(name=name, path=path, size=entry_size, date=_ns_to_datetime(mtime_ns) if flags & Snapshot.DONE else datetime(2000, 1, 1), is_sized=bool(flags & Snapshot.DONE))
+                size += newFile.size
+                files.append(newFile)
+                if newFile.date > last_modified: last_modified = newFile.date
+            for name, old_child in old_children.items(): changes.removed.extend(previous.subtree_paths(old_child, folder.path / name))
+            snapshot.first[index], snapshot.count[index] = first, len(snapshot) - first
+            snapshot.flags[index] |= Snapshot.DONE
+            folder.files, folder.folders, folder.size, folder.date, folder.is_walked = files, folders, size, last_modified, True
+            if stats is not None and files: stats.add_files(files)
+        ClassDirectory._merge_tree(root, stats)
+        return snapshot, changes
+
+    @staticmethod
+    def _read_listing(path: Path) -> Optional[List[tuple]]:
+        """ (name, path, flags, size, mtime_ns, inode) for every entry, read with os.scandir: one stat per file and folder. """
+        try: entries = os.scandir(path)
+        except OSError: return None
+        listing = []
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        try: stat = entry.stat()
+                        except OSError: listing.append((entry.name, Path(entry.path), 0, 0, _UNSIZED_NS, 0))
+                        else: listing.append((entry.name, Path(entry.path), Snapshot.DONE, stat.st_size, stat.st_mtime_ns, stat.st_ino))
+                    elif entry.is_dir():
+                        # stat'ı okunamayan klasör de ağaçta kalır (walk gibi); bilinmeyen mtime/inode 0, listesi yeniden kullanılmaz
+                        try: stat = entry.stat()
+                        except OSError: listing.append((entry.name, Path(entry.path), Snapshot.DIR, 0, 0, 0))
+                        else: listing.append((entry.name, Path(entry.path), Snapshot.DIR, 0, stat.st_mtime_ns, stat.st_ino))
+                except OSError: continue
+        return listing
+
+    @staticmethod
+    def _reuse_listing(previous: "Snapshot", old_children: Dict[str, int], path: Path, verify_files: bool) -> List[tuple]:
+        """ The stored listing of an unchanged folder; subfolders (and files with verify_files) are stat'ed again. """
+        listing = []
+        for name, i in old_children.items():
+            flags, entry_path = previous.flags[i], path / name
+            if flags & Snapshot.DIR or verify_files:
+                try: stat = os.stat(entry_path)
+                except (FileNotFoundError, NotADirectoryError): continue  # kaybolan girdi: çağıran silindi olarak raporlar
+                except OSError:  # var ama stat'ı okunamıyor: _read_listing gibi bilinmeyen değerlerle kalır
+                    listing.append((name, entry_path, Snapshot.DIR, 0, 0, 0) if flags & Snapshot.DIR else (name, entry_path, 0, 0, _UNSIZED_NS, 0))
+                    continue
+                listing.append((name, entry_path, flags & Snapshot.DIR or Snapshot.DONE, stat.st_size if not flags & Snapshot.DIR else 0, stat.st_mtime_ns, stat.st_ino))
+            else: listing.append((name, entry_path, flags, previous.size[i], previous.mtime[i], previous.inode[i]))
+        return listing
 #==============================================================================
 
 
 #============================ MAIN CLASS =====================================
 class DirectoryExplorer:
-    def __init__(self, path: Optional[Union[str, Path]] = None):
+    JSON_COMMENT = "script: github.com/Mefamex/Python_Code_Snippets/directory_explorer ; Licence: MIT ; Have a good code"
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, workers: int = 1, compact: bool = False, snapshot: Optional[Union[str, Path]] = None, verify_files: bool = False, lazy: bool = False, max_depth: Optional[int] = None, sizes: bool = True, path_filter: Optional[PathFilter] = None, ignore_file: Optional[Union[str, Path, bool]] = None, stats: Optional[int] = None, duplicates: bool = False,
+                 hash_workers: int = 1, hash_cache: Optional[Union[str, Path]] = None):
         path = Path(path) if path else Path.cwd()
         self.data: C_folder # ignore value, checked everywhere
+        if not isinstance(workers, int) or workers < 1: raise ValueError(f"workers must be a positive integer: {workers}")
+        if compact and workers > 1: raise ValueError("compact tree is scanned on a single thread, workers must be 1.")
+        if snapshot and (compact or workers > 1): raise ValueError("snapshot rescans build a regular tree on a single thread, compact and workers > 1 are not supported.")
+        if max_depth is not None and (not isinstance(max_depth, int) or max_depth < 1): raise ValueError(f"max_depth must be a positive integer: {max_depth}")
+        lazy = lazy or max_depth is not None or not sizes
+        if lazy and (compact or snapshot or workers > 1): raise ValueError("lazy folders are listed on access on a single thread, compact, snapshot and workers > 1 are not supported.")
+        if snapshot and path_filter is not None and path_filter.active: raise ValueError("snapshot rescans reuse unfiltered listings, filters are not supported.")
+        if not isinstance(hash_workers, int) or hash_workers < 1: raise ValueError(f"hash_workers must be a positive integer: {hash_workers}")
+        if stats is None and duplicates: stats = 10
+        if stats is not None and (compact or lazy): raise ValueError("stats are collected by the C_file/C_folder walkers, compact and lazy trees are not supported.")
         if not self.__set_main_path(path): raise ValueError(f"Invalid path provided: {path}")
         self.TABSIZE = 4  # Number of spaces for indentation in the output
+        self.workers = workers  # 1: tek thread, >1: ClassDirectory.walk_parallel
+        self.compact = compact  # True: self.data, CompactTree.root görünümüdür (salt okunur)
+        self.snapshot = Path(snapshot) if snapshot else None  # artımlı tarama için okunan ve güncellenen snapshot dosyası
+        self.verify_files = verify_files
+        self.changes: Optional[C_changes] = None  # son snapshot taramasının raporu (ilk taramada None)
+        self.lazy = lazy  # True: self.data bir LazyFolder, klasörler erişildikçe listelenir
+        self.max_depth = max_depth  # lazy: kökten bu kadar seviye listelenir, daha derindekiler yalnızca boyut/tarih verir
+        self.sizes = sizes  # lazy: False ise klasör boyutları toplanmaz (0), tarih klasörün kendi mtime'ıdır
+        self.path_filter = path_filter  # kök dizine bağlanmamış kurallar; tarama sırasında .explorerignore ile birleştirilir
+        self.ignore_file = ignore_file  # None: kökteki .explorerignore (varsa), False: okunmaz
+        self.top_n = stats  # None: istatistik toplanmaz; aksi halde en büyük kaç dosya/klasörün tutulacağı
+        self.find_duplicates = duplicates
+        self.hash_workers = hash_workers  # kopya bulucunun süreç sayısı
+        self.hash_cache = Path(hash_cache) if hash_cache else None  # çalıştırmalar arasında saklanan hash önbelleği dosyası
+        self.stats: Optional[TreeStats] = None  # son taramada toplanan istatistikler
         _print_info(f"DirectoryExplorer initialized with path: {self.data.path}")
 
-    def run(self, path: Optional[Union[str, Path]] = None, print_data: bool = True, exportJson: bool = True, exportTxt: bool = True) -> bool:
-        """ Run the DirectoryExplorer with the given path. """
+    def run(self, path: Optional[Union[str, Path]] = None, print_data: bool = True, exportJson: bool = True, exportTxt: bool = True, ndjson: bool = False, txt_output: Optional[Union[str, Path, TextIO]] = None) -> bool:
+        """ Run the DirectoryExplorer with the given path. txt_output: see export_to_txt. """
         _print_info(f"Running DirectoryExplorer with path: {path if path else self.data.path}")
         if path:
             if not isinstance(path, (str, Path)): raise TypeError("Path must be a string or a Path object.")
@@ -267,8 +1276,10 @@ class DirectoryExplorer:
         _print_info("DirectoryExplorer is ready to use.")
         self.explore()
         if print_data: self.print_data()
-        if exportJson: self.export_data_json()
-        if exportTxt : self.export_to_txt()
+        if exportJson: self.export_data_json(ndjson=ndjson)
+        if exportTxt : self.export_to_txt(txt_output)
+        if exportTxt and self.changes is not None: self.export_changes()
+        if self.top_n is not None: self.export_stats()
         _print_info("DirectoryExplorer run completed successfully.")
         return True
     
@@ -305,11 +1316,95 @@ class DirectoryExplorer:
         if path is not None and not isinstance(path, (str, Path)):
             raise TypeError("Path must be a string or a Path object.")
         _print_info(f"Exploring directory: {path if path else self.data.path}")
-        if not ClassDirectory.walk(self.data): raise RuntimeError("Failed to walk through the directory.")
+        rules = self.get_filter()
+        if self.compact:
+            if not self.data.is_walked: self.data = CompactTree.from_path(self.data.path, rules).root
+        elif self.snapshot:
+            if rules is not None: raise ValueError(f"snapshot rescans reuse unfiltered listings, remove '{self.data.path / PathFilter.IGNORE_FILE}' or disable it (--no-ignore-file, ignore_file=False).")
+            if not self.data.is_walked: self.rescan()
+        elif self.lazy:
+            if not isinstance(self.data, LazyFolder): self.data = LazyFolder(self.data.name, self.data.path, self.max_depth, self.sizes, rules=rules)
+        elif not ClassDirectory.walk(self.data, workers=self.workers, rules=rules, stats=self._start_stats()): raise RuntimeError("Failed to walk through the directory.")
         if not self.data.is_walked: raise RuntimeError("Directory has not been walked yet.")
         if not self.data.is_sized: raise RuntimeError("Directory has not been sized yet.")
         return
 
+    def _start_stats(self) -> Optional[TreeStats]:
+        """ A new TreeStats for the walk about to start, if stats are on and the data has not been walked yet. """
+        if self.top_n is None or self.data.is_walked: return None
+        self.stats = TreeStats(self.top_n)
+        return self.stats
+
+    def get_filter(self) -> Optional[PathFilter]:
+        """ path_filter bound to the current root, after the lines of its .explorerignore (or ignore_file); None if nothing is filtered. """
+        rules = (self.path_filter or PathFilter()).bind(self.data.path, self.ignore_file)
+        if not rules.active: return None
+        _print_info(f"Filter: {len(rules._rules)} exclude rules, {len(rules.include)} include patterns{', size/age rules' if rules._stat_needed else ''}{f', prune depth {rules.max_depth}' if rules.max_depth is not None else ''}")
+        return rules
+
+    def rescan(self) -> Optional[C_changes]:
+        """ Walk the directory reusing the listings of unchanged folders from the snapshot file, then save the new snapshot.
+        Returns the changes since the previous snapshot, None when there was none to compare with. """
+        if not self.snapshot: raise ValueError("No snapshot file is set.")
+        previous = None
+        if self.snapshot.exists():
+            previous = Snapshot.load(self.snapshot)
+            if previous.path != self.data.path:
+                _print_info(f"Snapshot '{self.snapshot}' belongs to '{previous.path}', doing a full scan.")
+                previous = None
+        self.data.files, self.data.folders, self.data.is_walked, self.data.is_sized = [], [], False, False
+        snapshot, changes = Snapshot.scan(self.data, previous, verify_files=self.verify_files, stats=self._start_stats())
+        if not self.data.is_walked: raise RuntimeError("Failed to walk through the directory.")
+        self.changes = changes if previous is not None else None
+        try: snapshot.save(self.snapshot)
+        except OSError as error: _print_info(f"Warning: snapshot could not be saved to '{self.snapshot}' ({error}), the next run will do a full scan", sleeping=0)  # walk sonucu kaybolmaz
+        else:
+            if self.changes is None: _print_info(f"Snapshot created: '{self.snapshot}' ({len(snapshot):,} entries)")
+        if self.changes is not None: _print_info(f"Snapshot rescan: {len(self.changes.added):,} added, {len(self.changes.removed):,} removed, {len(self.changes.modified):,} modified; {self.changes.scanned:,} folders listed, {self.changes.reused:,} reused")
+        return self.changes
+
+    def export_changes(self) -> None:
+        """ Export the last snapshot report to a text file: '+' added, '-' removed, '~' modified. """
+        _print_info("Exporting changes to text file...")
+        if self.changes is None: raise RuntimeError("No snapshot rescan has been done.")
+        file_name = f"DirectoryExplorer_changes_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}.txt"
+        with open(self.data.path / file_name, "w", encoding="utf-8") as f:
+            for mark, paths in (("+", self.changes.added), ("-", self.changes.removed), ("~", self.changes.modified)):
+                f.writelines(f"{mark} {path}\n" for path in paths)
+        _print_info(f"Changes exported successfully to '{self.data.path / file_name}'.")
+
+    def export_stats(self) -> None:
+        """ Print a summary of the walk's TreeStats and write them to a JSON file; runs the duplicate finder first if it is on. """
+        _print_info("Exporting stats to JSON file...")
+        self.check_data_ready()
+        if self.stats is None: raise RuntimeError("No stats were collected, create the explorer with stats=N and walk again.")
+        if self.find_duplicates and self.stats.duplicate_groups is None: self.find_duplicate_files()
+        _print_info(f"Stats: {self.stats.files:,} files, {self.stats.bytes:,} bytes, {len(self.stats.extensions):,} extensions", sleeping=0)
+        for size, path in self.stats.top_files[:3]: _print_info(f"Largest file: {size:,} bytes '{path}'", sleeping=0)
+        for size, path in self.stats.top_folders[:3]: _print_info(f"Largest folder: {size:,} bytes '{path}'", sleeping=0)
+        if self.stats.duplicate_groups is not None: _print_info(f"Duplicates: {len(self.stats.duplicate_groups):,} groups, {sum(size * (len(paths) - 1) for size, paths in self.stats.duplicate_groups):,} bytes wasted", sleeping=0)
+        file_name = f"DirectoryExplorer_stats_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}.json"
+        with open(self.data.path / file_name, "w", encoding="utf-8") as f: f.writelines(_iter_json({"_comment": self.JSON_COMMENT, **self.stats.to_dict()}, indent=4))
+        _print_info(f"Stats exported successfully to '{self.data.path / file_name}'.")
+
+    def find_duplicate_files(self) -> List[Tuple[int, List[str]]]:
+        """ Run the DuplicateFinder over the walk's same-sized files, loading and saving the hash cache file if one is set. """
+        _print_info("Looking for duplicate files...")
+        self.check_data_ready()
+        if self.stats is None: raise RuntimeError("No stats were collected, create the explorer with stats=N and walk again.")
+        cache = None
+        if self.hash_cache is not None: cache = HashCache.load(self.hash_cache) if self.hash_cache.exists() else HashCache()
+        finder = DuplicateFinder(self.hash_workers, cache=cache)
+        groups = self.stats.duplicates(finder)
+        counts = finder.counts
+        _print_info(f"Duplicate candidates: {counts['candidates']:,} files, {counts['read']:,} read ({counts['full']:,} in full, {counts['bytes']:,} bytes), {counts['cached']:,} hashes from cache", sleeping=0)
+        if cache is not None:
+            try:
+                cache.save(self.hash_cache)
+                _print_info(f"Hash cache saved: '{self.hash_cache}' ({len(cache.entries):,} entries)", sleeping=0)
+            except OSError as error: _print_info(f"Warning: hash cache could not be saved to '{self.hash_cache}' ({error})", sleeping=0)  # bulunan gruplar yine döner
+        return groups
+
     def get_data_dict(self) -> Dict[str, Union[str, int, list, dict]]:
         """ Get the data in Dictionary format. """
         _print_info(f"Getting data in dictionary format...")
@@ -323,53 +1418,42 @@ class DirectoryExplorer:
             if not isinstance(data, dict): raise TypeError("Data must be a dictionary.")
         else:
             self.check_data_ready()
-            data = self.get_data_dict()
-        if "_comment" not in data: data = {"_comment": "script: github.com/Mefamex/Python_Code_Snippets/directory_explorer ; Licence: MIT ; Have a good code", **data}
-        return json.dumps(data, indent=4, ensure_ascii=False)
+            return "".join(ClassDirectory.iter_json(self.data, indent=4, head={"_comment": self.JSON_COMMENT}))
+        if "_comment" not in data: data = {"_comment": self.JSON_COMMENT, **data}
+        return "".join(_iter_json(data, indent=4))  # json.dumps(indent=4) ile aynı çıktı, derin ağaçlarda RecursionError yok
 
     def print_data(self) -> None:
-        """ Print the data in a pretty format. """
+        """ Print the data in a pretty format (to the info stream, so it never mixes into a TXT tree streamed to stdout). """
         _print_info("Printing data...")
         self.check_data_ready()
-        print(self.get_data_json())
+        stream = _INFO_STREAM or sys.stdout
+        stream.writelines(ClassDirectory.iter_json(self.data, indent=4, head={"_comment": self.JSON_COMMENT}))
+        stream.write("\n")
     
-    def export_data_json(self) -> None:
-        """ Export the data to a JSON file. """
-        _print_info("Exporting data to JSON file...")
+    def export_data_json(self, ndjson: bool = False) -> None:
+        """ Stream the data to a JSON file while walking the tree; ndjson writes one folder/file entry per line. """
+        _print_info(f"Exporting data to {'NDJSON' if ndjson else 'JSON'} file...")
         self.check_data_ready()
-        file_name = f"DirectoryExplorer_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}.json"
-        with open(self.data.path / file_name, "w", encoding="utf-8") as f: f.write(self.get_data_json())
+        file_name = f"DirectoryExplorer_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}.{'ndjson' if ndjson else 'json'}"
+        chunks = ClassDirectory.iter_ndjson(self.data) if ndjson else ClassDirectory.iter_json(self.data, indent=4, head={"_comment": self.JSON_COMMENT})
+        with open(self.data.path / file_name, "w", encoding="utf-8") as f: f.writelines(chunks)
         _print_info(f"Data exported successfully to '{self.data.path / file_name}'.")
     
-    def export_to_txt(self) -> None:
-        """ Export the data to a text file. """
+    def export_to_txt(self, output: Optional[Union[str, Path, TextIO]] = None) -> None:
+        """ Export the data as a text tree, written in large chunks: to a new file in the root directory by default,
+        to the given file path, to stdout with "-", or to any open text stream (file, pipe). """
         _print_info("Exporting data to text file...")
         self.check_data_ready()
-        file_name = f"DirectoryExplorer_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}.txt"
-        def get_max_name_length(folder, depth=0):
-            max_len = 0
-            for file in folder.files:
-                fname = "|    " * (depth+1) + file.name
-                if len(fname) > max_len: max_len = len(fname)
-            for subfolder in folder.folders:
-                sub_max = get_max_name_length(subfolder, depth+1)
-                if sub_max > max_len: max_len = sub_max
-            return max_len
-        max_name_length = get_max_name_length(self.data, 0)
-        def write_tree(folder, depth=0):
-            indent = "|    " * depth
-            f.write(f"{indent}{folder.name}({len(folder.folders)}){'-'*50} {folder.date.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            for file in folder.files:
-                fname = file.name
-                size = str(file.size)
-                date = file.date.strftime('%Y-%m-%d %H:%M:%S')
-                file_indent = indent + "|    "
-                name_part = f"{file_indent}{fname}"
-                space_count = max_name_length - len(name_part) + 2
-                f.write(f"{name_part}{' ' * space_count}{size} {date}\n")
-            for subfolder in folder.folders: write_tree(subfolder, depth+1)
-        with open(self.data.path / file_name, "w", encoding="utf-8") as f: write_tree(self.data, 0)
-        _print_info(f"Data exported successfully to '{self.data.path / file_name}'.")
+        chunks = ClassDirectory.iter_txt(self.data)
+        if output == "-": output = sys.stdout
+        if hasattr(output, "write"):
+            output.writelines(chunks)
+            output.flush()
+            _print_info(f"Data exported successfully to '{getattr(output, 'name', output)}'.")
+            return
+        file_path = Path(output) if output else self.data.path / f"DirectoryExplorer_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}.txt"
+        with open(file_path, "w", encoding="utf-8") as f: f.writelines(chunks)
+        _print_info(f"Data exported successfully to '{file_path}'.")
 #==============================================================================
 
 
@@ -387,8 +1471,31 @@ if __name__ == "__main__":
     parser.add_argument("--no-print", dest="print_data", action="store_false", help="Do not print the directory data to the console.")
     parser.add_argument("--no-json", dest="export_json", action="store_false", help="Do not export the directory data to a JSON file.")
     parser.add_argument("--no-txt", dest="export_txt", action="store_false", help="Do not export the directory data to a TXT file.")
+    parser.add_argument("--ndjson", action="store_true", help="Export JSON as NDJSON: one folder/file entry per line.")
+    parser.add_argument("--txt-out", metavar="FILE", help="Write the TXT tree to FILE instead of a new file in the root; '-' streams it to stdout (messages go to stderr, implies --no-print).")
+    parser.add_argument("--exclude", action="append", default=[], metavar="PATTERN", help="gitignore-style pattern to skip (repeatable, '!' re-includes); excluded folders are never listed. Added after the root's .explorerignore.")
+    parser.add_argument("--include", action="append", default=[], metavar="PATTERN", help="Keep only files matching PATTERN (repeatable, gitignore-style); folders are always entered.")
+    parser.add_argument("--ignore-file", metavar="FILE", help=f"Read exclude patterns from FILE instead of <path>/{PathFilter.IGNORE_FILE}.")
+    parser.add_argument("--no-ignore-file", dest="ignore_file", action="store_const", const=False, help=f"Do not read <path>/{PathFilter.IGNORE_FILE}.")
+    parser.add_argument("--min-size", type=PathFilter.parse_size, metavar="SIZE", help="Keep only files of at least SIZE (e.g. 100K, 1.5M, 2G).")
+    parser.add_argument("--max-size", type=PathFilter.parse_size, metavar="SIZE", help="Keep only files of at most SIZE.")
+    parser.add_argument("--newer", type=PathFilter.parse_age, metavar="AGE", help="Keep only files modified within AGE (e.g. 30m, 12h, 7d, 2w).")
+    parser.add_argument("--older", type=PathFilter.parse_age, metavar="AGE", help="Keep only files not modified for AGE.")
+    parser.add_argument("--prune-depth", type=int, metavar="N", help="Do not list folders N levels below the root: they are shown empty and their contents are never read (unlike --max-depth).")
+    parser.add_argument("--stats", type=int, nargs="?", const=10, metavar="N", help="Collect the N (default 10) largest files/folders and extension/age histograms during the walk, written to DirectoryExplorer_stats_*.json.")
+    parser.add_argument("--duplicates", action="store_true", help="With the stats, find duplicate files: same size, then same first and last 64 KiB, then same content (implies --stats).")
+    parser.add_argument("--hash-workers", type=int, default=1, metavar="N", help="Hash duplicate candidates in N processes (implies --duplicates, default 1).")
+    parser.add_argument("--hash-cache", metavar="FILE", help="Reuse and update content hashes keyed by device, inode, mtime and size across runs (implies --duplicates).")
+    parser.add_argument("--snapshot", metavar="FILE", help="Snapshot file for incremental rescans: only folders whose mtime changed are listed again, changes are reported.")
+    parser.add_argument("--verify-files", action="store_true", help="With --snapshot, also stat files in unchanged folders to catch in-place edits.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of threads used to walk the directory tree (default: 1, single thread).")
+    parser.add_argument("--compact", action="store_true", help="Keep the tree in compact arrays (much less memory for millions of entries, single thread).")
+    parser.add_argument("--lazy", action="store_true", help="List folders only when they are printed or exported; folder sizes are summed without building the tree.")
+    parser.add_argument("--max-depth", type=int, metavar="N", help="List only N levels below the root (implies --lazy); deeper folders still report their total size.")
+    parser.add_argument("--no-sizes", dest="sizes", action="store_false", help="With --lazy, skip folder size totals (size 0, date is the folder's own mtime) for instant listings.")
     parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
     args = parser.parse_args()
+    if args.txt_out == "-": _INFO_STREAM, args.print_data = sys.stderr, False  # stdout yalnızca TXT ağacını taşır (ör. `| less`, `> tree.txt`); JSON dökümü basılmaz
 
     
     # print docstring of file
@@ -396,7 +1503,7 @@ if __name__ == "__main__":
         lines = [line for line in __doc__.splitlines()] + ["\n","="*60,"\t\t\tPROGRESS STARTED\t\t\t","="*60,"\n"]
         total_chars = sum(len(line) for line in lines) or 1
         for line in lines:
-            print(line)
+            print(line, file=_INFO_STREAM)
             time.sleep((len(line) / total_chars) * 2)
 
     
@@ -413,13 +1520,20 @@ if __name__ == "__main__":
 
     
     # Initialize DirectoryExplorer with the provided path
-        explorer = DirectoryExplorer(args.path)
+        explorer = DirectoryExplorer(args.path, workers=args.workers, compact=args.compact, snapshot=args.snapshot, verify_files=args.verify_files, lazy=args.lazy, max_depth=args.max_depth, sizes=args.sizes,
+                                     path_filter=PathFilter(args.exclude, args.include, args.min_size, args.max_size, args.newer, args.older, args.prune_depth), ignore_file=args.ignore_file, stats=args.stats,
+                                     duplicates=args.duplicates or args.hash_workers > 1 or args.hash_cache is not None, hash_workers=args.hash_workers, hash_cache=args.hash_cache)
         explorer.run(
             print_data=args.print_data,
             exportJson=args.export_json,
-            exportTxt=args.export_txt
+            exportTxt=args.export_txt,
+            ndjson=args.ndjson,
+            txt_output=args.txt_out
         )
         _print_info("DirectoryExplorer finished successfully.")
+    except BrokenPipeError:  # stdout'u okuyan taraf erken kapandı (ör. `| head`)
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        exit(1)
     except Exception as e:
         _print_info(f"Error: {e}")
         exit(1)
@@ -0,0 +1,832 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+===============================================================================
+                        Directory Explorer Benchmark
+===============================================================================
+Description:
+    directory_explorer için karşılaştırmalı performans ölçümleri.
+
+    walk : Sentetik bir dizin ağacı (varsayılan 1.000.000 dosya) oluşturur ve v1.1.0'daki
+           os.listdir + pathlib tabanlı tarayıcı ile os.scandir tabanlı ClassDirectory.walk'u
+           karşılaştırır.
+           - stat çağrıları : os.stat / os.lstat ve DirEntry.stat() (syscall yapan ilk çağrı) sayısı
+           - listeleme      : os.listdir / os.scandir çağrı sayısı
+           - süre           : Sayım yapılmadan, ısınmış disk önbelleğiyle ölçülen duvar süresi
+           Sayım Python 3.11+ ile doğrudur (eski sürümlerde pathlib os.stat'ı içeride saklar).
+
+    memory   : --entries (varsayılan 5.000.000) girdilik sanal, geniş bir ağacı (klasör başına --per-dir dosya,
+               isimler klasörler arasında tekrar eder) C_file/C_folder nesneleri ve CompactTree ile ayrı süreçlerde
+               tarar; tarama sonrası kalan bellek (RSS) ve girdi başına bayt ölçülür. Önce küçük bir ağaçta iki
+               gösterimin aynı JSON'u ürettiği doğrulanır.
+
+    export   : --entries (varsayılan 1.000.000) girdilik sanal ağacı tarar, ardından v1.5.0'daki dışa aktarmayı
+               (to_dict_data + tek parça JSON metni), akışlı JSON'u ve NDJSON'u dosyaya yazar. Ağaç dışında
+               ayrılan en yüksek bellek (tracemalloc), süre ve dosya boyutu ölçülür; JSON dosyalarının aynı
+               olduğu doğrulanır.
+
+    txt      : --entries (varsayılan 1.000.000) girdilik sanal ağacı tarar ve TXT ağacını v1.8.0'daki export_to_txt
+               (iki tam geçiş, girdi başına strftime ve satır başına f.write) ile ClassDirectory.iter_txt'e (tek
+               biçimlendirme geçişi, hızlı tarih, büyük parçalar) dosyaya ve bir pipe'a (`cat > /dev/null`) yazdırır.
+               Süre, yazma çağrısı sayısı ve çıktıların aynı olduğu ölçülür.
+
+    rescan   : Gerçek bir ağaçta (varsayılan 100.000 dosya, klasör başına 100) tam tarama ile Snapshot.scan'i
+               karşılaştırır: ilk tarama, değişiklik yokken yeniden tarama, --changes klasörde dosya eklenip
+               silindikten/değiştirildikten sonra yeniden tarama ve verify_files ile yeniden tarama. stat ve
+               listeleme çağrıları walk'taki gibi sayılır; raporun yapılan değişikliklerle eşleştiği doğrulanır.
+
+    filter   : Gerçek bir proje ağacı (varsayılan 5.000 kaynak dosyası, 60.000 dosyalık node_modules, 20.000 dosyalık
+               .git ve 10.000 dosyalık .venv) oluşturur ve filtresiz walk'u PathFilter kurallarıyla karşılaştırır:
+               .explorerignore ile hariç tutma, --include, --min-size ve --prune-depth. stat ve listeleme
+               çağrıları walk'taki gibi sayılır; hariç tutulan klasörlerin hiç listelenmediği doğrulanır.
+
+    parallel : Aynı ağacı farklı thread sayılarıyla (ClassDirectory.walk, workers=N) tarar. Ağ dosya
+               sistemlerini taklit etmek için her os.scandir çağrısına --latency-ms kadar gecikme eklenebilir.
+               Sonuçların tek thread'li taramayla aynı olduğu doğrulanır.
+
+    lazy     : Gerçek bir ağaçta (varsayılan 100.000 dosya, klasör başına 100) NDJSON listesinin ilk satırına ve
+               tamamına kadar geçen süreyi karşılaştırır: tam walk + tüm liste (v1.7.0), --max-depth N ile
+               LazyFolder (boyutlar ClassDirectory.measure ile), --max-depth N --no-sizes ve yalnızca kök boyutu
+               için ClassDirectory.measure. stat ve listeleme çağrıları walk'taki gibi sayılır; boyutlu satırların
+               tam taramadaki satırlarla aynı olduğu doğrulanır.
+
+    stats    : Gerçek bir ağaçta (varsayılan 100.000 dosya, klasör başına 100) tarama sonrası hesaplanan istatistikleri
+               TreeStats ile karşılaştırır: v1.10.0'daki yol (walk + JSON dışa aktarma + JSON'u geri okuyup en büyük
+               --top dosya/klasörü, uzantı ve yaş histogramlarını hesaplama) ile walk(stats=TreeStats). Sonuçların
+               aynı olduğu doğrulanır.
+
+    duplicates: --files rastgele boyutlu (en çok --max-kib KiB) dosya, kopyaları ve ilk/son/orta baytı farklı aynı
+               boyutlu ikizlerinden oluşan bir ağaçta kopya bulucuları karşılaştırır: tüm dosyaları tam hash'leme,
+               v1.11.0 (ilk 64 KiB -> tam hash), DuplicateFinder (ilk/son 64 KiB -> tam hash) farklı --workers süreç
+               sayılarıyla ve HashCache ile ilk/ikinci çalıştırma. Okunan dosya ve bayt sayılır; disk önbelleği ısıtılır.
+
+    deep     : --depth (varsayılan 10.000) seviye derin, her seviyede bir alt klasör ve --file-every seviyede bir
+               dosya bulunan sanal bir ağacı os.scandir üzerinden sunar (gerçek diskte PATH_MAX, 4096 bayt, bu
+               derinliğe izin vermez) ve walk, walk_parallel, to_dict_data, JSON ve TXT dışa aktarmayı çalıştırır.
+               Hepsi sys.getrecursionlimit()'in çok ötesinde RecursionError olmadan bitmelidir.
+
+Usage:
+    cmd -> `python directory_explorer_benchmark.py walk [--files 1000000] [--per-dir 1000] [--root DIR] [--keep]`
+    cmd -> `python directory_explorer_benchmark.py deep [--depth 10000] [--file-every 10]`
+    cmd -> `python directory_explorer_benchmark.py memory [--entries 5000000] [--per-dir 1000]`
+    cmd -> `python directory_explorer_benchmark.py export [--entries 1000000] [--per-dir 1000] [--compact]`
+    cmd -> `python directory_explorer_benchmark.py txt [--entries 1000000] [--per-dir 1000] [--compact]`
+    cmd -> `python directory_explorer_benchmark.py rescan [--files 100000] [--per-dir 100] [--changes 10] [--root DIR] [--keep]`
+    cmd -> `python directory_explorer_benchmark.py lazy [--files 100000] [--per-dir 100] [--depths 1 2] [--root DIR] [--keep]`
+    cmd -> `python directory_explorer_benchmark.py stats [--files 100000] [--per-dir 100] [--top 10] [--root DIR] [--keep]`
+    cmd -> `python directory_explorer_benchmark.py duplicates [--files 500] [--max-kib 4096] [--workers 1 4] [--root DIR] [--keep]`
+    cmd -> `python directory_explorer_benchmark.py filter [--files 5000] [--root DIR] [--keep]`
+    cmd -> `python directory_explorer_benchmark.py parallel [--files 100000] [--per-dir 100] [--workers 1 4 8 16] [--latency-ms 0 2] [--root DIR] [--keep]`
+
+Author:
+    Mefamex (info@mefamex.com) (https://mefamex.com)
+
+License:
+    MIT Lisansı (https://opensource.org/licenses/MIT)
+===============================================================================
+"""
+
+#============================ IMPORTS =========================================
+import argparse, filecmp, gc, hashlib, json, os, random, shutil, subprocess, sys, tempfile, tracemalloc
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter, sleep
+from typing import Callable, Dict
+import directory_explorer as de
+from directory_explorer import C_folder, ClassDirectory, ClassFile, CompactTree, DirectoryExplorer, DuplicateFinder, HashCache, LazyFolder, PathFilter, Snapshot, TreeStats, _iter_json
+#==============================================================================
+
+
+#============================ HELPERS =========================================
+def _print_table(title: str, header: list, rows: list) -> None:
+    widths = [max(len(str(x)) for x in col) + 2 for col in zip(header, *rows)]
+    line = "|" + "|".join("-" * w for w in widths) + "|"
+    print(f"\n{title}\n{line}")
+    print("|" + "|".join(f" {h:<{w - 1}}" for h, w in zip(header, widths)) + "|")
+    print(line)
+    for row in rows: print("|" + "|".join(f" {str(c):<{w - 1}}" for c, w in zip(row, widths)) + "|")
+    print(line)
+
+
+def _prepare_tree(base: Path, files: int, per_dir: int) -> Path:
+    tree = base / f"tree_{files}_{per_dir}"
+    if not tree.exists():
+        print(f"Ağaç oluşturuluyor: {tree} ({files:,} dosya)...")
+        start = perf_counter()
+        folders = build_tree(tree, files, per_dir)
+        print(f"  {folders:,} klasör, {perf_counter() - start:.1f} sn")
+    return tree
+
+
+def build_tree(root: Path, files: int, per_dir: int = 1000, fanout: int = 100) -> int:
+    """Creates `files` small files, `per_dir` per leaf folder, leaves grouped `fanout` per parent. Returns the folder count."""
+    folders = 0
+    for i in range(0, files, per_dir):
+        leaf = root / f"d{i // (per_dir * fanout):04d}" / f"d{i // per_dir:06d}"
+        leaf.mkdir(parents=True, exist_ok=True)
+        folders += 1
+        for j in range(i, min(i + per_dir, files)):
+            with open(leaf / f"f{j:07d}.txt", "wb") as f: f.write(b"x" * (j % 97))
+    return folders + len(list(root.iterdir()))
+#==============================================================================
+
+
+#============================ LEGACY WALKER ===================================
+def legacy_walk(object: C_folder, force_walk: bool = False) -> bool:
+    """ClassDirectory.walk as of v1.1.0: os.listdir twice, then pathlib checks and stats per entry."""
+    if not isinstance(object, C_folder): return False
+    if not object.path.exists() or not object.path.is_dir(): return False
+    if object.is_walked and not force_walk: return True
+    try:
+        if not object.path.is_dir(): return False
+        filenames = os.listdir(object.path)
+        if not filenames:
+            object.is_walked, object.is_sized, object.size, object.files, object.folders = True, True, 0, [], []
+            return True
+    except Exception: return False
+    object.files, object.folders, object.size = [], [], 0
+    last_modified = datetime(1, 1, 1)
+    for entry in os.listdir(object.path):
+        full_path = object.path / entry
+        if full_path.is_file():
+            newFile = ClassFile.create_class_file(full_path)
+            object.size += ClassFile.calculate_size(newFile)
+            object.files.append(newFile)
+            if newFile.date > last_modified: last_modified = newFile.date
+        elif full_path.is_dir():
+            newFolder = ClassDirectory.create_class_directory(full_path)
+            if not isinstance(newFolder, C_folder): continue
+            legacy_walk(newFolder)
+            object.size += newFolder.size
+            if newFolder.date > last_modified: last_modified = newFolder.date
+            object.folders.append(newFolder)
+    object.date, object.is_walked, object.is_sized = last_modified, True, True
+    return True
+#==============================================================================
+
+
+#============================ SYSCALL COUNTING ================================
+class _CountingEntry:
+    """Wraps a DirEntry and counts the stat() calls that actually reach the OS (the first one per entry)."""
+    __slots__ = ("_entry", "_counts", "_statted", "name", "path")
+
+    def __init__(self, entry: os.DirEntry, counts: Dict[str, int]):
+        self._entry, self._counts, self._statted, self.name, self.path = entry, counts, False, entry.name, entry.path
+
+    def is_file(self, *, follow_symlinks: bool = True) -> bool: return self._entry.is_file(follow_symlinks=follow_symlinks)
+
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool: return self._entry.is_dir(follow_symlinks=follow_symlinks)
+
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+        if not self._statted: self._counts["stat"] += 1
+        self._statted = True
+        return self._entry.stat(follow_symlinks=follow_symlinks)
+
+
+class _CountingScandir:
+    def __init__(self, iterator, counts: Dict[str, int]): self._iterator, self._counts = iterator, counts
+
+    def __enter__(self) -> "_CountingScandir": return self
+
+    def __exit__(self, *exc) -> None: self._iterator.close()
+
+    def __iter__(self): return (_CountingEntry(entry, self._counts) for entry in self._iterator)
+
+
+def count_calls(walker: Callable[[C_folder], bool], root: Path) -> Dict[str, int]:
+    """Runs walker on root with os.stat/os.lstat/os.listdir/os.scandir instrumented."""
+    counts = {"stat": 0, "list": 0}
+    originals = os.stat, os.lstat, os.listdir, os.scandir
+    def counted(func, key):
+        def wrapper(*args, **kwargs):
+            counts[key] += 1
+            return func(*args, **kwargs)
+        return wrapper
+    os.stat, os.lstat, os.listdir = counted(os.stat, "stat"), counted(os.lstat, "stat"), counted(os.listdir, "list")
+    os.scandir = lambda *args: (counts.__setitem__("list", counts["list"] + 1), _CountingScandir(originals[3](*args), counts))[1]
+    try: walker(C_folder(name=root.name, path=root))
+    finally: os.stat, os.lstat, os.listdir, os.scandir = originals
+    return counts
+
+
+def time_walk(walker: Callable[[C_folder], bool], root: Path) -> tuple:
+    folder = C_folder(name=root.name, path=root)
+    start = perf_counter()
+    walker(folder)
+    return perf_counter() - start, folder
+#==============================================================================
+
+
+#============================ WALK BENCHMARK ==================================
+def run_walk(files: int, per_dir: int, root: str, keep: bool) -> None:
+    base = Path(root) if root else Path(tempfile.mkdtemp(prefix="dirx_bench_"))
+    try:
+        tree = _prepare_tree(base, files, per_dir)
+        walkers = {"listdir + pathlib (v1.1.0)": legacy_walk, "os.scandir (walk)": ClassDirectory.walk}
+        rows, results = [], {}
+        for name, walker in walkers.items():
+            time_walk(walker, tree)  # disk önbelleğini ısıt
+            seconds, folder = time_walk(walker, tree)
+            counts = count_calls(walker, tree)
+            results[name] = folder
+            rows.append([name, f"{files:,}", f"{counts['stat']:,}", f"{counts['stat'] / max(1, files):.2f}", f"{counts['list']:,}", f"{seconds:.2f}"])
+        same = len({str(ClassDirectory.to_dict_data(folder)) for folder in results.values()}) == 1
+        _print_table(f"WALK: {files:,} dosya (aynı sonuç: {same})", ["walker", "files", "stat calls", "stat/file", "list calls", "wall s"], rows)
+    finally:
+        if not keep and not root: shutil.rmtree(base, ignore_errors=True)
+#==============================================================================
+
+
+#============================ PARALLEL BENCHMARK ==============================
+def run_parallel(files: int, per_dir: int, root: str, keep: bool, workers: list, latencies: list) -> None:
+    base = Path(root) if root else Path(tempfile.mkdtemp(prefix="dirx_bench_"))
+    scandir = os.scandir
+    try:
+        tree = _prepare_tree(base, files, per_dir)
+        time_walk(ClassDirectory.walk, tree)  # disk önbelleğini ısıt
+        expected = str(ClassDirectory.to_dict_data(time_walk(ClassDirectory.walk, tree)[1]))
+        rows = []
+        for latency in latencies:
+            def slow_scandir(*args, delay=latency / 1000):
+                sleep(delay)
+                return scandir(*args)
+            os.scandir = slow_scandir if latency else scandir
+            try:
+                baseline = None
+                for n in workers:
+                    seconds, folder = time_walk(lambda f, n=n: ClassDirectory.walk(f, workers=n), tree)
+                    baseline = baseline or seconds
+                    rows.append([f"{latency:g}", n, f"{seconds:.2f}", f"{baseline / seconds:.1f}x", str(ClassDirectory.to_dict_data(folder)) == expected])
+            finally: os.scandir = scandir
+        _print_table(f"PARALLEL: {files:,} dosya, klasör başına {per_dir}", ["scandir latency ms", "workers", "wall s", "speedup", "same result"], rows)
+    finally:
+        if not keep and not root: shutil.rmtree(base, ignore_errors=True)
+#==============================================================================
+
+
+#============================ FILTER BENCHMARK ================================
+def run_filter(files: int, root: str, keep: bool) -> None:
+    base = Path(root) if root else Path(tempfile.mkdtemp(prefix="dirx_bench_"))
+    try:
+        tree = base / f"project_{files}"
+        if not tree.exists():
+            print(f"Proje ağacı oluşturuluyor: {tree}...")
+            for sub, count, per_dir in (("src", files, 50), ("node_modules", files * 12, 100), (".git", files * 4, 100), (".venv", files * 2, 100)): build_tree(tree / sub, count, per_dir, fanout=10)
+        (tree / PathFilter.IGNORE_FILE).write_text("# bağımlılıklar ve VCS\nnode_modules/\n.git/\n.venv/\n", encoding="utf-8")
+        listed: list = []
+        scandir = os.scandir
+        def tracking(path=".", *args):
+            listed.append(os.fspath(path))
+            return scandir(path, *args)
+        configs = [("filtre yok", PathFilter(), False), (".explorerignore", PathFilter(), True),
+                   (".explorerignore + --include '*.txt'", PathFilter(include=["*.txt"]), True),
+                   (".explorerignore + --min-size 64", PathFilter(min_size=64), True), ("--prune-depth 2 (ignore dosyası yok)", PathFilter(max_depth=2), False)]
+        rows = []
+        for name, path_filter, use_file in configs:
+            rules = path_filter.bind(tree, None if use_file else False)
+            rules = rules if rules.active else None
+            walker = lambda f, rules=rules: ClassDirectory.walk(f, rules=rules)
+            time_walk(walker, tree)  # disk önbelleğini ısıt
+            seconds, folder = time_walk(walker, tree)
+            counts = count_calls(walker, tree)
+            kept, stack = 0, [folder]
+            while stack:
+                current = stack.pop()
+                kept += len(current.files)
+                stack.extend(current.folders)
+            listed.clear()
+            os.scandir = tracking
+            try: ClassDirectory.walk(C_folder(name=tree.name, path=tree), rules=rules)
+            finally: os.scandir = scandir
+            pruned = not any(part in Path(p).parts for p in listed for part in ("node_modules", ".git", ".venv")) if use_file else "-"
+            rows.append([name, f"{kept:,}", f"{counts['stat']:,}", f"{counts['list']:,}", f"{seconds:.2f}", pruned])
+        _print_table(f"FILTER: {files:,} kaynak + {files * 18:,} bağımlılık/VCS dosyası", ["filter", "kept files", "stat calls", "list calls", "wall s", "ignored never listed"], rows)
+    finally:
+        if not keep and not root: shutil.rmtree(base, ignore_errors=True)
+#==============================================================================
+
+
+#============================ STATS BENCHMARK =================================
+def legacy_stats(json_path: Path, top_n: int, now: datetime) -> dict:
+    """v1.10.0 workflow: read the exported tree back and compute top-N, extension and age histograms from it."""
+    with open(json_path, encoding="utf-8") as f: data = json.load(f)
+    size = lambda node: int(node["size"].replace(".", ""))
+    cutoffs = TreeStats(top_n, now)._cutoffs
+    top_files, top_folders, extensions, ages, stack = [], [], {}, {}, [data]
+    while stack:
+        node = stack.pop()
+        for file in node["files"]:
+            top_files.append((size(file), file["path"]))
+            counter = extensions.setdefault(os.path.splitext(file["name"])[1].lower(), [0, 0])
+            counter[0], counter[1] = counter[0] + 1, counter[1] + size(file)
+            date = datetime.fromisoformat(file["date"])
+            label = next(label for cutoff, label in cutoffs if date >= cutoff)
+            ages[label] = ages.get(label, 0) + 1
+        top_folders.extend((size(sub), sub["path"]) for sub in node["folders"])
+        stack.extend(node["folders"])
+    return {"top_files": sorted(top_files, reverse=True)[:top_n], "top_folders": sorted(top_folders, reverse=True)[:top_n], "extensions": extensions, "ages": ages}
+
+
+class _ReadCounter:
+    """Wraps open() for directory_explorer and the naive finder to count opened files and bytes read."""
+    def __init__(self): self.files, self.bytes = 0, 0
+
+    def __call__(self, path, mode="r", *args, **kwargs):
+        f = open(path, mode, *args, **kwargs)
+        if "b" not in mode: return f
+        self.files += 1
+        read = f.read
+        def counted(*size):
+            data = read(*size)
+            self.bytes += len(data)
+            return data
+        f.read = counted
+        return f
+
+
+def naive_duplicates(folder: C_folder, opener=open) -> int:
+    """Hashes every non-empty file in full and returns the number of duplicate groups."""
+    by_hash, stack = {}, [folder]
+    while stack:
+        current = stack.pop()
+        for file in current.files:
+            if not file.size: continue
+            digest = hashlib.blake2b(digest_size=16)
+            with opener(file.path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""): digest.update(chunk)
+            by_hash.setdefault(digest.digest(), []).append(file)
+        stack.extend(current.folders)
+    return sum(1 for group in by_hash.values() if len(group) > 1)
+
+
+def build_dup_tree(root: Path, files: int, max_kib: int) -> None:
+    """Random-sized files up to max_kib KiB; every 10th is copied elsewhere and same-sized twins differ from every 25th
+    in the first byte, from every 40th in the last byte and from every 50th in the middle byte (needs the full hash)."""
+    rng = random.Random(20)
+    for i in range(20): (root / f"d{i:02d}").mkdir(parents=True, exist_ok=True)
+    for i in range(files):
+        folder, data = root / f"d{i % 20:02d}", rng.randbytes(rng.randint(1, max_kib * 1024))
+        (folder / f"f{i:05d}.bin").write_bytes(data)
+        if i % 10 == 0: (root / f"d{(i + 7) % 20:02d}" / f"copy{i:05d}.bin").write_bytes(data)
+        if i % 25 == 0: (folder / f"first{i:05d}.bin").write_bytes(bytes([data[0] ^ 1]) + data[1:])
+        if i % 40 == 0: (folder / f"last{i:05d}.bin").write_bytes(data[:-1] + bytes([data[-1] ^ 1]))
+        if i % 50 == 0: (folder / f"middle{i:05d}.bin").write_bytes(data[:len(data) // 2] + bytes([data[len(data) // 2] ^ 1]) + data[len(data) // 2 + 1:])
+
+
+def legacy_duplicates(files: list, block: int = 64 * 1024, opener=open) -> int:
+    """v1.11.0 TreeStats.duplicates: hash of the first block, then of the whole file. Returns the number of groups."""
+    def split(files: list, limit) -> list:
+        by_hash = {}
+        for file in files:
+            digest = hashlib.blake2b(digest_size=16)
+            with opener(file.path, "rb") as f:
+                if limit is not None: digest.update(f.read(limit))
+                else:
+                    for chunk in iter(lambda: f.read(1 << 20), b""): digest.update(chunk)
+            by_hash.setdefault(digest.digest(), []).append(file)
+        return [group for group in by_hash.values() if len(group) > 1]
+    by_size, groups = {}, 0
+    for file in files: by_size.setdefault(file.size, []).append(file)
+    for same in by_size.values():
+        for group in split(same, block) if len(same) > 1 else ():
+            groups += len(split(group, None)) if same[0].size > block else 1
+    return groups
+
+
+def run_duplicates(files: int, max_kib: int, workers: list, root: str, keep: bool) -> None:
+    base = Path(root) if root else Path(tempfile.mkdtemp(prefix="dirx_bench_"))
+    cache_file = Path(tempfile.mkdtemp(prefix="dirx_hash_")) / "hashes.cache"
+    try:
+        tree = base / f"dups_{files}_{max_kib}"
+        if not tree.exists():
+            print(f"Kopya ağacı oluşturuluyor: {tree}...")
+            build_dup_tree(tree, files, max_kib)
+        stats, folder = TreeStats(), C_folder(name=tree.name, path=tree)
+        ClassDirectory.walk(folder, stats=stats)
+        candidates = [file for same in stats._by_size.values() if isinstance(same, list) for file in same]
+        naive_duplicates(folder)  # disk önbelleğini ısıt
+        rows = []
+        def timed(name: str, run: Callable[[], tuple]) -> None:
+            start = perf_counter()
+            groups, opened, read = run()
+            rows.append([name, f"{opened:,}", f"{read / 2**20:,.1f}", groups, f"{perf_counter() - start:.2f}"])
+        def counted(find: Callable) -> tuple:
+            reads = _ReadCounter()
+            return find(reads), reads.files, reads.bytes
+        def finder(label: str, finder: DuplicateFinder) -> None:
+            timed(label, lambda: (len(finder.find(candidates)), finder.counts["read"], finder.counts["bytes"]))
+        timed("tüm dosyaları tam hash'le", lambda: counted(lambda reads: naive_duplicates(folder, reads)))
+        timed("ilk 64 KiB -> tam hash (v1.11.0)", lambda: counted(lambda reads: legacy_duplicates(candidates, opener=reads)))
+        for n in workers: finder(f"DuplicateFinder workers={n}", DuplicateFinder(n))
+        cache = HashCache()
+        finder(f"+ HashCache, ilk çalıştırma (workers={workers[-1]})", DuplicateFinder(workers[-1], cache=cache))
+        cache.save(cache_file)
+        finder(f"+ HashCache, ikinci çalıştırma (workers={workers[-1]})", DuplicateFinder(workers[-1], cache=HashCache.load(cache_file)))
+        _print_table(f"DUPLICATES: {stats.files:,} dosya, {stats.bytes / 2**20:,.0f} MB, {len(candidates):,} aday (boyutu başka bir dosyayla aynı), {os.cpu_count()} CPU",
+                     ["yöntem", "okunan dosya", "okunan MB", "grup", "wall s"], rows)
+    finally:
+        shutil.rmtree(cache_file.parent, ignore_errors=True)
+        if not keep and not root: shutil.rmtree(base, ignore_errors=True)
+
+
+def run_stats(files: int, per_dir: int, top_n: int, root: str, keep: bool) -> None:
+    base = Path(root) if root else Path(tempfile.mkdtemp(prefix="dirx_bench_"))
+    out = Path(tempfile.mkdtemp(prefix="dirx_stats_"))
+    try:
+        tree = _prepare_tree(base, files, per_dir)
+        time_walk(lambda f: ClassDirectory.walk(f), tree)  # disk önbelleğini ısıt
+        rows, now, best = [], datetime.now(), lambda times: min(times)
+        seconds = best(time_walk(lambda f: ClassDirectory.walk(f), tree)[0] for _ in range(3))
+        rows.append(["walk (istatistik yok)", f"{seconds:.2f}", "-"])
+        def legacy() -> tuple:
+            start = perf_counter()
+            folder = C_folder(name=tree.name, path=tree)
+            ClassDirectory.walk(folder)
+            with open(out / "tree.json", "w", encoding="utf-8") as f: f.writelines(ClassDirectory.iter_json(folder))
+            del folder
+            gc.collect()
+            return perf_counter() - start, legacy_stats(out / "tree.json", top_n, now)
+        timings = []
+        for _ in range(3):
+            gc.collect()
+            start = perf_counter()
+            result = legacy()
+            timings.append(perf_counter() - start)
+        rows.append(["walk + JSON + JSON'dan hesaplama (v1.10.0)", f"{best(timings):.2f}", f"{best(timings) - seconds:.2f}"])
+        timings = []
+        for _ in range(3):
+            gc.collect()
+            stats = TreeStats(top_n, now)
+            timings.append(time_walk(lambda f: ClassDirectory.walk(f, stats=stats), tree)[0])
+        rows.append(["walk(stats=TreeStats)", f"{best(timings):.2f}", f"{best(timings) - seconds:.2f}"])
+        legacy_result = result[1]
+        same = (stats.top_files == legacy_result["top_files"] and stats.top_folders == legacy_result["top_folders"] and stats.extensions == legacy_result["extensions"]
+                and {label: count for label, (count, _) in stats.ages.items() if count} == legacy_result["ages"])
+        _print_table(f"STATS: {files:,} dosya, en büyük {top_n} (aynı sonuç: {same})", ["yöntem", "wall s (en iyi 3)", "taramaya ek s"], rows)
+    finally:
+        shutil.rmtree(out, ignore_errors=True)
+        if not keep and not root: shutil.rmtree(base, ignore_errors=True)
+#==============================================================================
+
+
+#============================ DEEP TREE CHECK =================================
+class _VirtualEntry:
+    """DirEntry stand-in for the virtual deep tree."""
+    __slots__ = ("name", "path", "_is_dir", "_stat")
+
+    def __init__(self, parent: str, name: str, is_dir: bool, size: int = 0, mtime_ns: int = 0):
+        self.name, self.path, self._is_dir = name, os.path.join(parent, name), is_dir
+        mtime_ns = mtime_ns or (1_700_000_000 + size) * 10**9
+        seconds = mtime_ns // 10**9
+        self._stat = os.stat_result((0o100644, 0, 0, 1, 0, 0, size, seconds, seconds, seconds), {"st_mtime": seconds + (mtime_ns % 10**9) * 1e-9, "st_mtime_ns": mtime_ns})
+
+    def is_file(self, *, follow_symlinks: bool = True) -> bool: return not self._is_dir
+
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool: return self._is_dir
+
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result: return self._stat
+
+
+class _VirtualScandir(list):
+    def __enter__(self) -> "_VirtualScandir": return self
+
+    def __exit__(self, *exc) -> None: pass
+
+
+def virtual_scandir(root: str, depth: int, file_every: int) -> Callable:
+    """os.scandir replacement serving root/d/d/.../d (depth levels), one file every `file_every` levels."""
+    scandir = os.scandir
+    def fake(path=".") -> _VirtualScandir:
+        path = os.fspath(path)
+        if not path.startswith(root): return scandir(path)
+        level = (len(path) - len(root)) // 2
+        entries = _VirtualScandir()
+        if level % file_every == 0 or level == depth: entries.append(_VirtualEntry(path, f"f{level}.txt", False, level))
+        if level < depth: entries.append(_VirtualEntry(path, "d", True))
+        return entries
+    return fake
+
+
+def run_deep(depth: int, file_every: int) -> None:
+    base, scandir, rows = Path(tempfile.mkdtemp(prefix="dirx_deep_")), os.scandir, []
+    expected_size = sum(level for level in range(depth + 1) if level % file_every == 0 or level == depth)
+    def step(name: str, func: Callable, check: Callable) -> object:
+        start = perf_counter()
+        try: result, ok = func(), None
+        except RecursionError: result, ok = None, "RecursionError"
+        rows.append([name, f"{perf_counter() - start:.2f}", ok or check(result)])
+        return result
+    def levels(folder: C_folder) -> int:
+        count = 0
+        while folder.folders: folder, count = folder.folders[0], count + 1
+        return count
+    def digest(folder: C_folder) -> str:
+        h = hashlib.sha1()
+        for chunk in _iter_json(ClassDirectory.to_dict_data(folder)): h.update(chunk.encode())
+        return h.hexdigest()
+    os.scandir = virtual_scandir(str(base), depth, file_every)
+    try:
+        explorer = DirectoryExplorer(base)
+        step("walk (workers=1)", explorer.explore, lambda _: levels(explorer.data) == depth and explorer.data.size == expected_size)
+        parallel = C_folder(name=base.name, path=base)
+        step("walk (workers=4)", lambda: ClassDirectory.walk(parallel, workers=4), lambda ok: ok and digest(parallel) == digest(explorer.data))
+        data = step("to_dict_data", lambda: ClassDirectory.to_dict_data(explorer.data), lambda d: d is not None)
+        step("JSON (_iter_json)", lambda: sum(len(chunk) for chunk in _iter_json(data)), lambda n: f"{n:,} karakter")
+        del data
+        step("export_to_txt", explorer.export_to_txt, lambda _: f"{sum(os.path.getsize(base / n) for n in os.listdir(base) if n.endswith('.txt')):,} bayt")  # glob da sanal scandir'i görür
+    finally:
+        os.scandir = scandir
+        shutil.rmtree(base, ignore_errors=True)
+    _print_table(f"DEEP: {depth:,} seviye (recursion limit {sys.getrecursionlimit():,})", ["step", "wall s", "result"], rows)
+#==============================================================================
+
+
+#============================ MEMORY BENCHMARK ================================
+def virtual_wide_scandir(root: str, entries: int, per_dir: int) -> Callable:
+    """os.scandir replacement serving root/dNNNNN/file_NNNN.txt: `entries` files, `per_dir` per folder."""
+    scandir, folders = os.scandir, -(-entries // per_dir)
+    def fake(path=".") -> _VirtualScandir:
+        path = os.fspath(path)
+        if path == root: return _VirtualScandir(_VirtualEntry(path, f"d{i:05d}", True) for i in range(folders))
+        if not path.startswith(root): return scandir(path)
+        start = int(path[-5:]) * per_dir
+        return _VirtualScandir(_VirtualEntry(path, f"file_{j - start:04d}.txt", False, j % 4096, 1_700_000_000_123_456_789 + j * 7_919_000_000) for j in range(start, min(start + per_dir, entries)))
+    return fake
+
+
+def _rss_bytes() -> int:
+    """Current resident set size from /proc; falls back to the peak from resource.getrusage."""
+    try:
+        with open("/proc/self/statm") as f: return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+
+
+def _build(kind: str, root: str) -> object:
+    if kind == "compact": return CompactTree.from_path(root)
+    folder = C_folder(name=Path(root).name, path=Path(root))
+    ClassDirectory.walk(folder)
+    return folder
+
+
+def measure_child(kind: str, entries: int, per_dir: int) -> None:
+    """Runs in a fresh interpreter: builds one representation and prints its retained memory as JSON."""
+    root = os.path.join(tempfile.gettempdir(), "dirx_virtual")
+    os.scandir = virtual_wide_scandir(root, entries, per_dir)
+    gc.collect()
+    before, start = _rss_bytes(), perf_counter()
+    data = _build(kind, root)
+    seconds = perf_counter() - start
+    gc.collect()
+    print(json.dumps({"bytes": _rss_bytes() - before, "seconds": seconds, "nodes": len(data) if kind == "compact" else entries + -(-entries // per_dir) + 1}))
+
+
+def run_memory(entries: int, per_dir: int) -> None:
+    root, scandir = os.path.join(tempfile.gettempdir(), "dirx_virtual"), os.scandir
+    os.scandir = virtual_wide_scandir(root, min(entries, 20_000), per_dir)
+    try:
+        digests = {kind: hashlib.sha1("".join(_iter_json(ClassDirectory.to_dict_data(_build(kind, root) if kind == "objects" else _build(kind, root).root))).encode()).hexdigest() for kind in ("objects", "compact")}
+    finally: os.scandir = scandir
+    rows = []
+    for kind in ("objects", "compact"):
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), "memory", "--child", kind, "--entries", str(entries), "--per-dir", str(per_dir)], capture_output=True, text=True)
+        if out.returncode != 0:
+            rows.append([kind, f"{entries:,}", f"başarısız (kod {out.returncode})", "-", "-"])
+            continue
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        rows.append([kind, f"{result['nodes']:,}", f"{result['bytes'] / 2**20:,.0f}", f"{result['bytes'] / result['nodes']:,.0f}", f"{result['seconds']:.1f}"])
+    _print_table(f"MEMORY: {entries:,} dosya, klasör başına {per_dir} (aynı JSON: {len(set(digests.values())) == 1})", ["representation", "nodes", "retained MB", "bytes/node", "build s"], rows)
+#==============================================================================
+
+
+#============================ EXPORT BENCHMARK ================================
+def run_export(entries: int, per_dir: int, compact: bool) -> None:
+    root, scandir = os.path.join(tempfile.gettempdir(), "dirx_virtual"), os.scandir
+    os.scandir = virtual_wide_scandir(root, entries, per_dir)
+    try: folder = _build("compact", root).root if compact else _build("objects", root)
+    finally: os.scandir = scandir
+    head = {"_comment": DirectoryExplorer.JSON_COMMENT}
+    def legacy(f) -> None: f.write(json.dumps({**head, **ClassDirectory.to_dict_data(folder)}, indent=4, ensure_ascii=False))
+    exporters = {"to_dict_data + json.dumps (v1.5.0)": ("json", legacy),
+                 "iter_json (akışlı)": ("json", lambda f: f.writelines(ClassDirectory.iter_json(folder, 4, head))),
+                 "iter_ndjson": ("ndjson", lambda f: f.writelines(ClassDirectory.iter_ndjson(folder)))}
+    out, rows, files = Path(tempfile.mkdtemp(prefix="dirx_export_")), [], []
+    try:
+        for i, (name, (ext, export)) in enumerate(exporters.items()):
+            files.append(out / f"{i}.{ext}")
+            gc.collect()
+            start = perf_counter()
+            with open(files[-1], "w", encoding="utf-8") as f: export(f)
+            seconds = perf_counter() - start
+            tracemalloc.start()  # bellek ayrı bir geçişte ölçülür, tracemalloc süreyi şişirir
+            with open(files[-1], "w", encoding="utf-8") as f: export(f)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            rows.append([name, f"{peak / 2**20:,.2f}", f"{seconds:.1f}", f"{files[-1].stat().st_size / 2**20:,.0f}"])
+        same = filecmp.cmp(files[0], files[1], shallow=False)
+    finally: shutil.rmtree(out, ignore_errors=True)
+    _print_table(f"EXPORT: {entries:,} dosya, {'CompactTree' if compact else 'C_file/C_folder'} (aynı JSON: {same})", ["exporter", "peak extra MB", "wall s", "file MB"], rows)
+#==============================================================================
+
+
+#============================ TXT BENCHMARK ===================================
+def legacy_export_txt(folder: C_folder, f) -> None:
+    """DirectoryExplorer.export_to_txt as of v1.8.0: a width pass, then strftime and one f.write per line."""
+    max_len, stack = 0, [(folder, 0)]
+    while stack:
+        current, depth = stack.pop()
+        for file in current.files: max_len = max(max_len, 5 * (depth + 1) + len(file.name))
+        stack.extend((sub, depth + 1) for sub in current.folders)
+    stack = [(folder, 0)]
+    while stack:
+        current, depth = stack.pop()
+        indent = "|    " * depth
+        f.write(f"{indent}{current.name}({len(current.folders)}){'-'*50} {current.date.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        for file in current.files:
+            name_part = f"{indent}|    {file.name}"
+            f.write(f"{name_part}{' ' * (max_len - len(name_part) + 2)}{file.size} {file.date.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        stack.extend((sub, depth + 1) for sub in reversed(current.folders))
+
+
+class _CountingWriter:
+    def __init__(self): self.calls, self.digest = 0, hashlib.sha1()
+
+    def write(self, text: str) -> None:
+        self.calls += 1
+        self.digest.update(text.encode())
+
+    def writelines(self, lines) -> None:
+        for text in lines: self.write(text)
+
+
+def run_txt(entries: int, per_dir: int, compact: bool) -> None:
+    root, scandir = os.path.join(tempfile.gettempdir(), "dirx_virtual"), os.scandir
+    os.scandir = virtual_wide_scandir(root, entries, per_dir)
+    try: folder = _build("compact", root).root if compact else _build("objects", root)
+    finally: os.scandir = scandir
+    exporters = {"export_to_txt (v1.8.0) -> dosya": (False, lambda f: legacy_export_txt(folder, f)),
+                 "iter_txt -> dosya": (False, lambda f: f.writelines(ClassDirectory.iter_txt(folder))),
+                 "iter_txt -> pipe (cat > /dev/null)": (True, lambda f: f.writelines(ClassDirectory.iter_txt(folder)))}
+    out, rows, digests = Path(tempfile.mkdtemp(prefix="dirx_txt_")), [], set()
+    try:
+        for name, (pipe, export) in exporters.items():
+            gc.collect()
+            start = perf_counter()
+            if pipe:
+                with subprocess.Popen(["cat"], stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, text=True, encoding="utf-8") as proc: export(proc.stdin)
+            else:
+                with open(out / "tree.txt", "w", encoding="utf-8") as f: export(f)
+            seconds = perf_counter() - start
+            counter = _CountingWriter()  # yazma çağrıları ve çıktı özeti ayrı bir geçişte sayılır
+            export(counter)
+            digests.add(counter.digest.hexdigest())
+            rows.append([name, f"{counter.calls:,}", f"{seconds:.2f}", f"{(entries + -(-entries // per_dir) + 1) / seconds:,.0f}"])
+    finally: shutil.rmtree(out, ignore_errors=True)
+    _print_table(f"TXT: {entries:,} dosya, {'CompactTree' if compact else 'C_file/C_folder'} (aynı çıktı: {len(digests) == 1})", ["exporter", "write calls", "wall s", "lines/s"], rows)
+#==============================================================================
+
+
+#============================ RESCAN BENCHMARK ================================
+def run_rescan(files: int, per_dir: int, changes: int, root: str, keep: bool) -> None:
+    base = Path(root) if root else Path(tempfile.mkdtemp(prefix="dirx_bench_"))
+    try:
+        tree = _prepare_tree(base, files, per_dir)
+        leaves = sorted(leaf for group in tree.iterdir() for leaf in group.iterdir())
+        rows, state = [], {}
+        def measure(name: str, walker: Callable[[C_folder], object]) -> None:
+            time_walk(walker, tree)  # disk önbelleğini ısıt
+            seconds, _ = time_walk(lambda f: state.update(result=walker(f)), tree)
+            counts = count_calls(walker, tree)
+            report = state["result"][1] if isinstance(state["result"], tuple) else None
+            rows.append([name, f"{counts['stat']:,}", f"{counts['list']:,}", f"{seconds:.2f}"] + ([f"{len(report.added)}/{len(report.removed)}/{len(report.modified)}", f"{report.scanned:,}/{report.reused:,}"] if report else ["-", "-"]))
+        measure("full walk (ClassDirectory.walk)", ClassDirectory.walk)
+        measure("snapshot: first scan", lambda f: Snapshot.scan(f))
+        previous = state["result"][0]
+        measure("rescan, no changes", lambda f: Snapshot.scan(f, previous))
+        touched = leaves[::max(1, len(leaves) // (changes * 3))][:changes * 3]
+        for i, leaf in enumerate(touched):  # her üç klasörden birine ekle, birinden sil, birinde yeniden yazarak değiştir
+            victim = next(leaf.iterdir())
+            if i % 3 == 0: (leaf / "added.txt").write_bytes(b"new")
+            elif i % 3 == 1: victim.unlink()
+            else:
+                victim.with_suffix(".tmp").write_bytes(b"rewritten" * 3)
+                os.replace(victim.with_suffix(".tmp"), victim)
+        measure("rescan after changes", lambda f: Snapshot.scan(f, previous))
+        report = state["result"][1]
+        expected = (len(touched[0::3]), len(touched[1::3]), len(touched[2::3]))
+        measure("rescan after changes, verify_files", lambda f: Snapshot.scan(f, previous, verify_files=True))
+        _print_table(f"RESCAN: {files:,} dosya, {len(leaves):,} yaprak klasör (rapor doğru: {(len(report.added), len(report.removed), len(report.modified)) == expected})",
+                     ["scan", "stat calls", "list calls", "wall s", "added/removed/modified", "listed/reused"], rows)
+    finally:
+        if not keep and not root: shutil.rmtree(base, ignore_errors=True)
+#==============================================================================
+
+
+#============================ LAZY BENCHMARK ==================================
+def _list_timed(make: Callable[[C_folder], C_folder], tree: Path) -> tuple:
+    """Returns (ms to the first NDJSON line, ms to the last one, the lines) for the folder make() returns."""
+    start = perf_counter()
+    lines = ClassDirectory.iter_ndjson(make(C_folder(name=tree.name, path=tree)))
+    first = [next(lines)]
+    first_ms = (perf_counter() - start) * 1000
+    first.extend(lines)
+    return first_ms, (perf_counter() - start) * 1000, first
+
+
+def run_lazy(files: int, per_dir: int, root: str, keep: bool, depths: list) -> None:
+    base = Path(root) if root else Path(tempfile.mkdtemp(prefix="dirx_bench_"))
+    try:
+        tree = _prepare_tree(base, files, per_dir)
+        modes = [("walk + tam liste (v1.7.0)", lambda f: (ClassDirectory.walk(f), f)[1], True)]
+        for depth in depths:
+            modes.append((f"lazy, --max-depth {depth}", lambda f, d=depth: LazyFolder(f.name, f.path, max_depth=d), True))
+            modes.append((f"lazy, --max-depth {depth} --no-sizes", lambda f, d=depth: LazyFolder(f.name, f.path, max_depth=d, sizes=False), False))
+        modes.append(("yalnızca kök boyutu (measure)", lambda f: C_folder(f.name, f.path, *ClassDirectory.measure(f.path)), True))
+        rows, expected = [], None
+        for name, make, sized in modes:
+            _list_timed(make, tree)  # disk önbelleğini ısıt
+            first_ms, total_ms, lines = _list_timed(make, tree)
+            counts = count_calls(lambda f: sum(1 for _ in ClassDirectory.iter_ndjson(make(f))), tree)
+            expected = expected or set(lines)
+            rows.append([name, f"{len(lines):,}", f"{counts['stat']:,}", f"{counts['list']:,}", f"{first_ms:.1f}", f"{total_ms:.1f}", set(lines) <= expected if sized else "-"])
+        _print_table(f"LAZY: {files:,} dosya, klasör başına {per_dir}", ["mode", "listed entries", "stat calls", "list calls", "first line ms", "total ms", "same sizes"], rows)
+    finally:
+        if not keep and not root: shutil.rmtree(base, ignore_errors=True)
+#==============================================================================
+
+
+#============================ MAIN EXECUTION ==================================
+if __name__ == "__main__":
+    de._print_info = lambda *args, **kwargs: None  # ölçüme bilgi mesajları karışmasın
+    parser = argparse.ArgumentParser(description="directory_explorer benchmark suite")
+    sub = parser.add_subparsers(dest="suite", required=True)
+    p_walk = sub.add_parser("walk", help="v1.1.0 tarayıcısı ile os.scandir tarayıcısını karşılaştırır")
+    p_walk.add_argument("--files", type=int, default=1_000_000)
+    p_walk.add_argument("--per-dir", type=int, default=1000)
+    p_walk.add_argument("--root", default="", help="ağacın oluşturulacağı/bulunduğu dizin (verilirse silinmez)")
+    p_walk.add_argument("--keep", action="store_true", help="geçici ağacı silme")
+    p_par = sub.add_parser("parallel", help="tek thread ile workers=N paralel taramayı karşılaştırır")
+    p_par.add_argument("--files", type=int, default=100_000)
+    p_par.add_argument("--per-dir", type=int, default=100)
+    p_par.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8, 16])
+    p_par.add_argument("--latency-ms", type=float, nargs="+", default=[0, 2], help="her os.scandir çağrısına eklenen gecikme (ağ dosya sistemi taklidi)")
+    p_par.add_argument("--root", default="", help="ağacın oluşturulacağı/bulunduğu dizin (verilirse silinmez)")
+    p_par.add_argument("--keep", action="store_true", help="geçici ağacı silme")
+    p_lazy = sub.add_parser("lazy", help="tam taramayı --max-depth / --no-sizes ile tembel listelemeyle karşılaştırır")
+    p_lazy.add_argument("--files", type=int, default=100_000)
+    p_lazy.add_argument("--per-dir", type=int, default=100)
+    p_lazy.add_argument("--depths", type=int, nargs="+", default=[1, 2])
+    p_lazy.add_argument("--root", default="", help="ağacın oluşturulacağı/bulunduğu dizin (verilirse silinmez)")
+    p_lazy.add_argument("--keep", action="store_true", help="geçici ağacı silme")
+    p_flt = sub.add_parser("filter", help="filtresiz taramayı .explorerignore ve diğer PathFilter kurallarıyla karşılaştırır")
+    p_flt.add_argument("--files", type=int, default=5_000, help="kaynak dosyası sayısı (bağımlılık/VCS klasörleri bunun 18 katı)")
+    p_flt.add_argument("--root", default="", help="ağacın oluşturulacağı/bulunduğu dizin (verilirse silinmez)")
+    p_flt.add_argument("--keep", action="store_true", help="geçici ağacı silme")
+    p_st = sub.add_parser("stats", help="tarama sonrası JSON'dan hesaplanan istatistikleri TreeStats ve kopya bulucu ile karşılaştırır")
+    p_st.add_argument("--files", type=int, default=100_000)
+    p_st.add_argument("--per-dir", type=int, default=100)
+    p_st.add_argument("--top", type=int, default=10)
+    p_st.add_argument("--root", default="", help="ağacın oluşturulacağı/bulunduğu dizin (verilirse silinmez)")
+    p_st.add_argument("--keep", action="store_true", help="geçici ağacı silme")
+    p_dup = sub.add_parser("duplicates", help="kopya bulucuyu tam hash, v1.11.0 ve süreç havuzu/hash önbelleğiyle karşılaştırır")
+    p_dup.add_argument("--files", type=int, default=500, help="rastgele boyutlu dosya sayısı (kopyalar ve ikizler hariç)")
+    p_dup.add_argument("--max-kib", type=int, default=4096, help="en büyük dosya boyutu (KiB)")
+    p_dup.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    p_dup.add_argument("--root", default="", help="ağacın oluşturulacağı/bulunduğu dizin (verilirse silinmez)")
+    p_dup.add_argument("--keep", action="store_true", help="geçici ağacı silme")
+    p_deep = sub.add_parser("deep", help="sanal, çok derin bir ağaçta özyinelemesiz tarama ve dışa aktarmayı doğrular")
+    p_deep.add_argument("--depth", type=int, default=10_000)
+    p_deep.add_argument("--file-every", type=int, default=10, help="kaç seviyede bir dosya bulunacağı")
+    p_mem = sub.add_parser("memory", help="C_file/C_folder nesneleri ile CompactTree'nin bellek kullanımını karşılaştırır")
+    p_mem.add_argument("--entries", type=int, default=5_000_000)
+    p_mem.add_argument("--per-dir", type=int, default=1000)
+    p_mem.add_argument("--child", choices=("objects", "compact"), help=argparse.SUPPRESS)
+    p_exp = sub.add_parser("export", help="tek parça JSON ile akışlı JSON/NDJSON dışa aktarmayı karşılaştırır")
+    p_exp.add_argument("--entries", type=int, default=1_000_000)
+    p_exp.add_argument("--per-dir", type=int, default=1000)
+    p_exp.add_argument("--compact", action="store_true", help="ağacı CompactTree olarak tut")
+    p_txt = sub.add_parser("txt", help="v1.8.0 TXT dışa aktarmasını parçalı iter_txt ile karşılaştırır")
+    p_txt.add_argument("--entries", type=int, default=1_000_000)
+    p_txt.add_argument("--per-dir", type=int, default=1000)
+    p_txt.add_argument("--compact", action="store_true", help="ağacı CompactTree olarak tut")
+    p_re = sub.add_parser("rescan", help="tam tarama ile snapshot tabanlı artımlı taramayı karşılaştırır")
+    p_re.add_argument("--files", type=int, default=100_000)
+    p_re.add_argument("--per-dir", type=int, default=100)
+    p_re.add_argument("--changes", type=int, default=10, help="ekleme, silme ve değiştirme yapılan klasör sayısı (her biri için)")
+    p_re.add_argument("--root", default="", help="ağacın oluşturulacağı dizin (verilirse silinmez; ağaç değiştirilir)")
+    p_re.add_argument("--keep", action="store_true", help="geçici ağacı silme")
+    args = parser.parse_args()
+    if args.suite == "walk": run_walk(args.files, args.per_dir, args.root, args.keep)
+    if args.suite == "deep": run_deep(args.depth, args.file_every)
+    if args.suite == "export": run_export(args.entries, args.per_dir, args.compact)
+    if args.suite == "txt": run_txt(args.entries, args.per_dir, args.compact)
+    if args.suite == "rescan": run_rescan(args.files, args.per_dir, args.changes, args.root, args.keep)
+    if args.suite == "memory": measure_child(args.child, args.entries, args.per_dir) if args.child else run_memory(args.entries, args.per_dir)
+    if args.suite == "parallel": run_parallel(args.files, args.per_dir, args.root, args.keep, args.workers, args.latency_ms)
+    if args.suite == "filter": run_filter(args.files, args.root, args.keep)
+    if args.suite == "duplicates": run_duplicates(args.files, args.max_kib, args.workers, args.root, args.keep)
+    if args.suite == "stats": run_stats(args.files, args.per_dir, args.top, args.root, args.keep)
+    if args.suite == "lazy": run_lazy(args.files, args.per_dir, args.root, args.keep, args.depths)
+#==============================================================================
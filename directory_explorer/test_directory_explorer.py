@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+directory_explorer için davranış testleri: tarama modları, filtreler, kopya bulucu ve snapshot ile artımlı tarama.
+Referans çıktılar directory_explorer_benchmark'taki v1.x uygulamalarından (legacy_walk, legacy_export_txt) alınır.
+
+Usage:
+    cmd -> `python -m pytest directory_explorer/test_directory_explorer.py` veya `python -m unittest test_directory_explorer` (directory_explorer içinde)
+"""
+
+import io, json, os, shutil, tempfile, unittest
+from pathlib import Path
+from unittest import mock
+import directory_explorer as de
+from directory_explorer import C_folder, ClassDirectory, DirectoryExplorer, DuplicateFinder, HashCache, PathFilter, Snapshot
+from directory_explorer_benchmark import legacy_export_txt, legacy_walk
+
+
+class _TreeTest(unittest.TestCase):
+    """Builds a small tree in a temp folder; info messages (and their sleeps) are silenced."""
+
+    def setUp(self):
+        patcher = mock.patch.object(de, "_print_info")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.root = Path(tempfile.mkdtemp(prefix="dirx_test_"))
+        self.addCleanup(shutil.rmtree, self.root, True)
+
+    def write(self, rel: str, data: bytes = b"x") -> Path:
+        path = self.root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        return path
+
+    def build(self) -> None:
+        for i, rel in enumerate(["a.txt", "b.log", "ç ş.md", ".hidden", "src/main.py", "src/util.py", "src/pkg/__init__.py", "src/pkg/deep/x/y.bin", "docs/readme.md", "build/out.o", "build/keep.log"]):
+            self.write(rel, b"y" * (i * 37 + 1))
+        (self.root / "empty").mkdir()
+
+    def names(self, folder: C_folder) -> list:
+        """Root relative paths of every file in the tree."""
+        out, stack = [], [folder]
+        while stack:
+            current = stack.pop()
+            out.extend(Path(file.path).relative_to(self.root).as_posix() for file in current.files)
+            stack.extend(current.folders)
+        return sorted(out)
+
+
+class WalkOutputTest(_TreeTest):
+    """Every walk mode produces the same tree, JSON and TXT as the v1.1.0 walker with the v1.5.0/v1.8.0 exporters."""
+    MODES = {"sequential": {}, "workers": {"workers": 4}, "compact": {"compact": True}, "lazy": {"lazy": True}}
+
+    def setUp(self):
+        super().setUp()
+        self.build()
+        baseline = C_folder(name=self.root.name, path=self.root)
+        legacy_walk(baseline)
+        self.expected_dict = ClassDirectory.to_dict_data(baseline)
+        self.expected_json = json.dumps({"_comment": DirectoryExplorer.JSON_COMMENT, **self.expected_dict}, indent=4, ensure_ascii=False)
+        self.expected_txt = io.StringIO()
+        legacy_export_txt(baseline, self.expected_txt)
+
+    def test_modes_match_the_baseline(self):
+        for mode, options in self.MODES.items():
+            with self.subTest(mode=mode):
+                explorer = DirectoryExplorer(self.root, ignore_file=False, **options)
+                explorer.explore()
+                self.assertEqual(explorer.get_data_dict(), self.expected_dict)
+                self.assertEqual(explorer.get_data_json(), self.expected_json)
+                txt = io.StringIO()
+                explorer.export_to_txt(txt)
+                self.assertEqual(txt.getvalue(), self.expected_txt.getvalue())
+
+    def test_ndjson_has_one_entry_per_line(self):
+        explorer = DirectoryExplorer(self.root, ignore_file=False)
+        explorer.explore()
+        lines = [json.loads(line) for line in ClassDirectory.iter_ndjson(explorer.data)]
+        self.assertEqual(len(lines), 11 + 8)  # 11 dosya, kök dahil 8 klasör
+
+
+class PathFilterTest(_TreeTest):
+    def walk(self, rules: PathFilter) -> list:
+        folder = C_folder(name=self.root.name, path=self.root)
+        self.assertTrue(ClassDirectory.walk(folder, rules=rules.bind(self.root, ignore_file=False)))
+        return self.names(folder)
+
+    def names_all(self) -> list:
+        folder = C_folder(name=self.root.name, path=self.root)
+        ClassDirectory.walk(folder)
+        return self.names(folder)
+
+    def test_negation_re_includes_and_last_rule_wins(self):
+        self.build()
+        self.assertEqual(self.walk(PathFilter(["*.log", "!keep.log"])), [name for name in self.names_all() if name != "b.log"])
+        self.assertNotIn("build/keep.log", self.walk(PathFilter(["*.log", "!keep.log", "build/*.log"])))
+        self.assertNotIn("b.log", self.walk(PathFilter(["!b.log", "*.log"])))  # sonra gelen kural kazanır
+
+    def test_excluded_folder_cannot_be_re_included(self):
+        self.build()
+        names = self.walk(PathFilter(["build/", "!build/keep.log"]))
+        self.assertFalse([name for name in names if name.startswith("build/")])
+        self.assertEqual(self.walk(PathFilter(["/src/*", "!/src/main.py"])), [name for name in self.names_all() if not name.startswith("src/") or name == "src/main.py"])
+
+    def test_ignore_file_comes_before_command_line_patterns(self):
+        self.build()
+        self.write(PathFilter.IGNORE_FILE, b"# yorum\n*.md\n!docs/readme.md\n")
+        rules = PathFilter(["!*.md"]).bind(self.root)
+        folder = C_folder(name=self.root.name, path=self.root)
+        ClassDirectory.walk(folder, rules=rules)
+        self.assertIn("ç ş.md", self.names(folder))
+        rules = PathFilter().bind(self.root)
+        folder = C_folder(name=self.root.name, path=self.root)
+        ClassDirectory.walk(folder, rules=rules)
+        self.assertEqual([name for name in self.names(folder) if name.endswith(".md")], ["docs/readme.md"])
+
+
+class DuplicateTest(_TreeTest):
+    def setUp(self):
+        super().setUp()
+        block = 64 * 1024
+        self.write("one/a.bin", b"A" * 5000)
+        self.write("two/a copy.bin", b"A" * 5000)
+        self.write("two/a again.bin", b"A" * 5000)
+        self.write("one/b.bin", b"B" * 5000)  # aynı boyut, farklı içerik
+        edges = b"E" * block
+        self.write("big/1.bin", edges + b"1" * block + edges)  # ilk/son blok aynı, orta farklı: tam hash ayırır
+        self.write("big/2.bin", edges + b"2" * block + edges)
+        self.write("big/3.bin", edges + b"1" * block + edges)
+        self.write("empty/0.bin", b"")
+        self.write("empty/1.bin", b"")
+        self.expected = [(3 * block, sorted(str(self.root / name) for name in ("big/1.bin", "big/3.bin"))),
+                         (5000, sorted(str(self.root / name) for name in ("one/a.bin", "two/a copy.bin", "two/a again.bin")))]
+
+    def find(self, **options):
+        explorer = DirectoryExplorer(self.root, ignore_file=False, duplicates=True, **options)
+        explorer.explore()
+        groups = explorer.find_duplicate_files()
+        return groups, explorer.stats, explorer
+
+    def test_groups_by_content(self):
+        groups, stats, _ = self.find()
+        self.assertEqual(groups, self.expected)
+        self.assertEqual(stats.to_dict()["duplicates"][0]["wasted"], 3 * 64 * 1024)
+
+    def test_cache_gives_the_same_groups_without_reading(self):
+        cache = self.root.parent / (self.root.name + ".hashes")
+        self.addCleanup(lambda: cache.unlink() if cache.exists() else None)
+        groups, _, first = self.find(hash_cache=cache)
+        self.assertEqual(groups, self.expected)
+        finder = DuplicateFinder(cache=HashCache.load(cache))
+        self.assertEqual(finder.find(file for folder in first.data.folders for file in folder.files), self.expected)
+        self.assertEqual(finder.counts["read"], 0)
+        self.assertEqual(finder.counts["cached"], finder.counts["candidates"] + 3)  # +3: tam hash'e kalan büyük dosyalar
+        self.assertEqual(self.find(hash_cache=cache)[0], self.expected)
+        (self.root / "big/3.bin").write_bytes(b"E" * 64 * 1024 + b"3" * 64 * 1024 + b"E" * 64 * 1024)  # değişen dosya yeniden okunur
+        self.assertEqual(self.find(hash_cache=cache)[0], self.expected[1:])
+
+    def test_unwritable_cache_keeps_the_results(self):
+        groups, _, _ = self.find(hash_cache=self.root / "missing" / "hashes")
+        self.assertEqual(groups, self.expected)
+
+
+class SnapshotTest(_TreeTest):
+    def setUp(self):
+        super().setUp()
+        self.build()
+        self.snap = self.root.parent / (self.root.name + ".snap")
+        self.addCleanup(lambda: self.snap.unlink() if self.snap.exists() else None)
+
+    def scan(self, previous=None, verify_files=False):
+        folder = C_folder(name=self.root.name, path=self.root)
+        snapshot, changes = Snapshot.scan(folder, previous, verify_files=verify_files)
+        return folder, snapshot, changes
+
+    def touch_dir(self, rel: str) -> None:
+        """Moves a folder's mtime forward, so a change is seen even on file systems with a coarse clock."""
+        stat = os.stat(self.root / rel)
+        os.utime(self.root / rel, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    def test_first_scan_matches_walk_and_survives_save_and_load(self):
+        folder, snapshot, changes = self.scan()
+        walked = C_folder(name=self.root.name, path=self.root)
+        ClassDirectory.walk(walked)
+        self.assertEqual(ClassDirectory.to_dict_data(folder), ClassDirectory.to_dict_data(walked))
+        self.assertEqual((changes.added, changes.removed, changes.modified), ([], [], []))
+        snapshot.save(self.snap)
+        loaded = Snapshot.load(self.snap)
+        self.assertEqual((loaded.path, len(loaded), loaded.names), (snapshot.path, len(snapshot), snapshot.names))
+        self.assertEqual([p.name for p in self.snap.parent.glob(self.snap.name + ".*.tmp")], [])
+
+    def test_rescan_reports_changes_and_reuses_unchanged_folders(self):
+        _, previous, _ = self.scan()
+        self.write("src/new.py")
+        (self.root / "docs/readme.md").unlink()
+        shutil.rmtree(self.root / "src/pkg/deep")
+        self.write("build/out.o", b"rewritten and longer")
+        for rel in ("src", "docs", "src/pkg", "build"): self.touch_dir(rel)
+        folder, _, changes = self.scan(previous)
+        self.assertEqual(changes.added, [str(self.root / "src/new.py")])
+        self.assertEqual(sorted(changes.removed), sorted(str(self.root / rel) for rel in ("docs/readme.md", "src/pkg/deep", "src/pkg/deep/x", "src/pkg/deep/x/y.bin")))
+        self.assertEqual(changes.modified, [str(self.root / "build/out.o")])
+        self.assertEqual(changes.reused, 2)  # kök ve empty; değişen dört klasör yeniden listelenir
+        walked = C_folder(name=self.root.name, path=self.root)
+        ClassDirectory.walk(walked)
+        self.assertEqual(ClassDirectory.to_dict_data(folder), ClassDirectory.to_dict_data(walked))
+
+    def test_verify_files_catches_in_place_edits(self):
+        _, previous, _ = self.scan()
+        target = self.root / "src/main.py"
+        stat = target.stat()
+        with open(target, "r+b") as f: f.write(b"z")  # klasörün mtime'ı değişmez
+        os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertEqual(self.scan(previous)[2].modified, [])
+        _, _, changes = self.scan(previous, verify_files=True)
+        self.assertEqual(changes.modified, [str(target)])
+        self.assertEqual(changes.scanned, 0)
+
+    def test_folder_whose_stat_fails_is_kept_and_listed_again(self):
+        scandir = os.scandir
+        class Entry:
+            def __init__(self, entry): self._entry, self.name, self.path = entry, entry.name, entry.path
+            def is_file(self, **kwargs): return self._entry.is_file(**kwargs)
+            def is_dir(self, **kwargs): return self._entry.is_dir(**kwargs)
+            def stat(self, **kwargs):
+                if self.name == "src": raise PermissionError("denied")
+                return self._entry.stat(**kwargs)
+        class Listing:
+            def __init__(self, path): self._it = scandir(path)
+            def __enter__(self): return self
+            def __exit__(self, *exc): self._it.close()
+            def __iter__(self): return (Entry(entry) for entry in self._it)
+        with mock.patch.object(de.os, "scandir", Listing):
+            folder, previous, _ = self.scan()
+            self.assertIn("src", [sub.name for sub in folder.folders])
+            self.assertIn("src/pkg/__init__.py", self.names(folder))
+            _, _, changes = self.scan(previous)
+        self.assertEqual((changes.added, changes.removed), ([], []))
+        self.assertEqual(changes.scanned, 1)  # yalnızca stat'ı bilinmeyen src yeniden listelenir
+
+    def test_explorer_rescan_and_unwritable_snapshot(self):
+        explorer = DirectoryExplorer(self.root, ignore_file=False, snapshot=self.snap)
+        explorer.explore()
+        self.assertIsNone(explorer.changes)
+        self.write("docs/new.md")
+        self.touch_dir("docs")
+        explorer = DirectoryExplorer(self.root, ignore_file=False, snapshot=self.snap)
+        explorer.explore()
+        self.assertEqual(explorer.changes.added, [str(self.root / "docs/new.md")])
+        explorer = DirectoryExplorer(self.root, ignore_file=False, snapshot=self.root / "missing" / "s.snap")
+        explorer.explore()  # kaydedilemeyen snapshot taramayı bozmaz
+        self.assertTrue(explorer.data.is_walked)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,11 @@
 # -*- coding: utf-8 -*-
 # Created on  : 2025-08-09
-# Updated on  : 2025-08-13
+# Updated on  : 2026-10-18
 # @author     : mefamex
 # FOR         : folder depth file
 
-print(
+# Doğrudan çalıştırmada yazdırılır; --batch ile kapanır
+BANNER = (
     "\n",
     "#" * 30,
     "\n"
@@ -17,21 +18,28 @@ print(
     "* **Rekürsif Dizin Gezimi:** Belirtilen dizin ve tüm alt dizinlerini inceler.\n"
     "* **Detaylı Bilgi Toplama:** Dosya boyutu, oluşturulma tarihi, dizin derinliği gibi bilgileri hesaplar.\n"
     "* **Formatlı Çıkış:** Tablo şeklinde okunaklı bir terminal çıktısı sunar.\n"
+    "* **Erken Budama:** Yok sayılan klasörler (.git, venv, .gitignore kuralları) hiç listelenmez ve açılmaz.\n"
+    "* **Artımlı Analiz:** Sayımlar (mtime, boyut) ile önbelleğe alınır, tekrar çalıştırmada yalnızca değişen dosyalar okunur;\n"
+    "  --since ile önceki sonuç dosyasına göre uzantı başına farklar raporlanır.\n"
+    "* **Çok Çekirdekli Sayım:** Dosyalar süreç havuzunda, ikili parçalar halinde okunur; karakter, satır ve kelime tek geçişte sayılır.\n"
+    "* **Etkileşimsiz Mod:** --batch ile beklemesiz çalışır; --format json/csv dosya ve uzantı kayıtlarını hesaplandıkça akıtır.\n"
     "* **Metin Dosyasına Kaydetme:** Sonuçları bir metin dosyasına kaydeder.\n"
     "* **Özelleştirilebilir:** Çıkış formatı, analiz derinliği gibi ayarlar yapılabilir.\n\n"
     "**Kullanılan Modüller:**\n"
     "* os modülü\n"
-    "* datetime modülü\n\n"
+    "* datetime modülü\n"
+    "* argparse, csv, json, re ve concurrent.futures modülleri\n\n"
     "**Uyarılar:**\n"
     "* Çok büyük dizinlerde performans düşüşü yaşanabilir.\n"
     "* Dosya erişim hakları konusunda dikkatli olunmalıdır.\n\n"
     + "#" * 82 + "\n\n"
 )
 
-__version__ = '1.0.3'
-__last_modified__ = '2025-08-13'
+__version__ = '1.4.0'
+__last_modified__ = '2026-10-18'
 
-import os,time, datetime
+import os,sys,time, datetime, argparse, re, json, csv, tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 text = f'# Created for : {Path(__file__).parent.name}\n# Created on  : ' + datetime.datetime.now().isoformat(timespec='seconds') + 'Z\n'
 
@@ -39,19 +47,61 @@ text = f'# Created for : {Path(__file__).parent.name}\n# Created on  : ' + datet
 TARGET_EXTENSIONS = {'.txt', 'bat', '.md', '.py', '.html', 'css', '.js', 'json'}
 # starts with or ends with
 IGNORED_FOLDERS = {'.git', '__pycache__', '.venv' , 'venv'}
+# Her dizindeki bu dosya gitignore kuralları olarak okunur
+GITIGNORE = '.gitignore'
+# Dosyalar bu boyutta ikili parçalar halinde okunur
+CHUNK_SIZE = 1 << 20
+# Bundan az dosyada süreç başlatmak sayımdan pahalıdır
+MIN_POOL_FILES = 64
+# Sonuçlar ve sayım önbelleği çalışılan dizine yazılır
+RESULTS_FILE = '_folder_analysis_results.txt'
+CACHE_FILE = '_folder_analysis_cache.json'
+# count_file'ın sayım kuralları değişirse artırılır; eski önbellek yok sayılır
+CACHE_VERSION = 1
+# Son değişikliği bundan yeni olan dosyalar önbelleğe yazılmaz: aynı mtime içinde tekrar yazılırlarsa fark edilemez
+CACHE_MTIME_SLACK_NS = 2_000_000_000
+# --format json/csv kayıtlarının alanları; json her kaydı bir satıra yazar (JSON Lines). Yollar mutlaktır,
+# errors/cached/read/seconds yalnızca summary kaydında doludur
+STREAM_FIELDS = ('record', 'ext', 'path', 'files', 'chars', 'lines', 'words', 'errors', 'cached', 'read', 'seconds')
+# False iken ilerleme mesajları ("reading folder", "cache", "DONE") yazdırılmaz; hatalar her zaman stderr'e gider
+VERBOSE = True
 
-def count_characters_in_file(file_path):
+
+def log(*args):
+    if VERBOSE: print(*args)
+# Bayt sınıfları: ASCII boşlukları -> " ", UTF-8 devam baytları (10xxxxxx) -> "c", diğerleri -> "x"
+# Her kod noktasında devam baytı olmayan tam bir bayt bulunur; her kelime bir " x" geçişiyle (veya dosya başındaki "x" ile) başlar
+_BYTE_CLASSES = bytes(32 if b in b" \t\n\r\x0b\x0c" else 99 if 0x80 <= b < 0xC0 else 120 for b in range(256))
+
+def count_file(file_path):
+    """Dosyayı CHUNK_SIZE'lık ikili parçalarla tek geçişte okur, (karakter, satır, kelime) döndürür.
+    Karakterler str'ye çözülmeden, devam baytı olmayan baytlar sayılarak bulunur; metin modundaki gibi '\\r\\n' tek karakterdir.
+    Satırlar '\\n' sayısıdır (son satır '\\n' ile bitmiyorsa +1), kelimeler ASCII boşluklarıyla ayrılır (geçerli UTF-8'de `wc -w` gibi).
+    Geçersiz UTF-8 hata vermez; baytlar yine aynı kuralla sayılır."""
+    chars, lines, words, last_byte, last_mark = 0, 0, 0, b"", b" "
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-            return len(content)
-    except Exception as e:
-        print(f"Hata: {file_path} dosyası okunamadı - {str(e)}")
-        return 0
+        with open(file_path, 'rb', buffering=0) as file:
+            while True:
+                chunk = file.read(CHUNK_SIZE)
+                if not chunk: break
+                marks = chunk.translate(_BYTE_CLASSES)
+                # saf ASCII parçada devam baytı yoktur; '\r' yoksa '\r\n' aranmaz. Parça sınırındaki '\r' + '\n' ve kelime bir kez sayılır
+                chars += len(chunk) - (0 if chunk.isascii() else marks.count(b"c")) - (chunk.count(b"\r\n") if b"\r" in chunk else 0) - (last_byte == b"\r" and chunk[:1] == b"\n")
+                lines += chunk.count(b"\n")
+                words += marks.count(b" x") + (last_mark == b" " and marks[:1] == b"x")
+                last_byte, last_mark = chunk[-1:], marks[-1:]
+    except OSError as e:
+        print(f"Hata: {file_path} dosyası okunamadı - {str(e)}", file=sys.stderr)
+        return 0, 0, 0
+    return chars, lines + (last_byte not in (b"", b"\n")), words
+
+
+def count_characters_in_file(file_path):
+    return count_file(file_path)[0]
 
 
 
-def create_table(results, grand_total_char, grand_total_files):
+def create_table(results, grand_total_char, grand_total_files, grand_total_lines=0, grand_total_words=0):
     """Tablo formatında sonuçları oluşturur"""
     
     # Verileri hazırla (char sayısına göre sıralanmış)
@@ -60,76 +110,343 @@ def create_table(results, grand_total_char, grand_total_files):
     for ext in sorted_exts:
         file_count, char_count = len(results[ext]['files']), results[ext]['total_chars']
         if file_count == 0 and char_count == 0: continue
-        table_data.append({ 'type': ext[1:].upper(), 'char': f"{char_count:,}" if char_count > 0 else "---", 'file': str(file_count) if file_count > 0 else "---" })
+        line_count, word_count = results[ext].get('total_lines', 0), results[ext].get('total_words', 0)
+        table_data.append({ 'type': ext[1:].upper(), 'char': f"{char_count:,}" if char_count > 0 else "---", 'line': f"{line_count:,}" if line_count > 0 else "---",
+                            'word': f"{word_count:,}" if word_count > 0 else "---", 'file': str(file_count) if file_count > 0 else "---" })
     # Sütun genişliklerini hesapla
-    type_width = max(len("TYPE"), max(len(row['type']) for row in table_data)) + 2
-    char_width = max(len("CHAR"), max(len(row['char']) for row in table_data)) + 2
-    file_width = max(len("FILE"), max(len(row['file']) for row in table_data)) + 2
+    columns = ('type', 'char', 'line', 'word', 'file')
+    widths = [max(len(column), max((len(row[column]) for row in table_data), default=0)) + 2 for column in columns]
     
     # Tablo çizimi
-    separator = "|" + "=" * type_width + "|" + "=" * char_width + "|" + "=" * file_width + "|"
-    header_line = f"| {'TYPE':<{type_width-1}}| {'CHAR':<{char_width-1}}| {'FILE':<{file_width-1}}|"
+    separator = "|" + "|".join("=" * width for width in widths) + "|"
+    header_line = "|" + "|".join(f" {column.upper():<{width-1}}" for column, width in zip(columns, widths)) + "|"
     
     table = f"\nANALYZING RESULTS\n\n{separator}\n{header_line}\n"
-    table += "|" + "-" * type_width + "|" + "-" * char_width + "|" + "-" * file_width + "|\n"
+    table += "|" + "|".join("-" * width for width in widths) + "|\n"
     
     for row in table_data:
-        table += f"|{row['type']:>{type_width-1}} | {row['char']:<{char_width-1}}| {row['file']:<{file_width-1}}|\n"
+        table += f"|{row['type']:>{widths[0]-1}} |" + "|".join(f" {row[column]:<{width-1}}" for column, width in zip(columns[1:], widths[1:])) + "|\n"
 
-    table += f"{separator}\n\nTOTAL CHARS : {grand_total_char:,} \nTOTAL FILES : {grand_total_files:,}\n\n"+ f"in {Path(__file__).parent.name}".rjust(25) + "\n"
+    table += (f"{separator}\n\nTOTAL CHARS : {grand_total_char:,} \nTOTAL LINES : {grand_total_lines:,} \nTOTAL WORDS : {grand_total_words:,} \nTOTAL FILES : {grand_total_files:,}\n\n"
+              + f"in {Path(__file__).parent.name}".rjust(25) + "\n")
 
     return table
 
 
 
-def analyze_directory(directory):
+def _glob_to_regex(pattern):
+    """gitignore glob'unu regex'e çevirir: '*' ve '?' '/' ile eşleşmez, '**' her derinlikle, '[...]' karakter kümesiyle eşleşir."""
+    i, out = 0, []
+    while i < len(pattern):
+        if pattern.startswith('**/', i): out.append('(?:.*/)?'); i += 3; continue
+        if pattern.startswith('**', i): out.append('.*'); i += 2; continue
+        c = pattern[i]
+        if c == '*': out.append('[^/]*')
+        elif c == '?': out.append('[^/]')
+        elif c == '[' and pattern.find(']', i + 2) != -1:
+            j = pattern.find(']', i + 2)
+            body = pattern[i + 1:j]
+            out.append('[' + ('^' + body[1:] if body[:1] in '!^' else body).replace('\\', '\\\\') + ']')
+            i = j
+        else: out.append(re.escape(c))
+        i += 1
+    return ''.join(out)
+
+
+def parse_gitignore(file_path, base=''):
+    """Bir .gitignore dosyasını (base, regex, negate, dir_only) kurallarına çevirir; base dosyanın köke göre göreli dizinidir.
+    '#' yorum, '!' yeniden dahil etme, sonda '/' yalnızca klasör, başta/ortada '/' base'e sabitleme desteklenir."""
+    rules = []
+    try:
+        with open(file_path, encoding='utf-8', errors='replace') as file: lines = file.read().splitlines()
+    except OSError: return rules
+    for line in lines:
+        line = line.rstrip()
+        if not line or line.startswith('#'): continue
+        negate = line.startswith('!')
+        line = line[1:] if negate else line
+        line = line[1:] if line.startswith('\\') else line
+        dir_only, line = line.endswith('/'), line.rstrip('/')
+        if not line: continue
+        # '/' içermeyen desenler her derinlikteki isimle eşleşir
+        regex = _glob_to_regex(line.lstrip('/')) if '/' in line else '(?:.*/)?' + _glob_to_regex(line)
+        rules.append((base, re.compile(regex), negate, dir_only))
+    return rules
+
+
+def is_ignored(rel_path, is_dir, rules):
+    """Köke göre göreli posix yol için son eşleşen kural geçerlidir; '!' ile başlayan kural yeniden dahil eder."""
+    for base, regex, negate, dir_only in reversed(rules):
+        if dir_only and not is_dir: continue
+        if regex.fullmatch(rel_path[len(base) + 1:] if base else rel_path): return not negate
+    return False
+
+
+def collect_files(directory, ignored_folders=None, gitignore=True):
+    """Hedef uzantılı dosyaları (uzantı, yol) olarak listeler. Adı ignored_folders'taki bir değerle başlayan/biten klasörler
+    ve gitignore açıkken .gitignore kurallarına uyan klasörler os.walk listesinden çıkarılır, yani hiç listelenmez."""
+    ignored = tuple(IGNORED_FOLDERS if ignored_folders is None else ignored_folders)
+    paths, rules_by_dir = [], {directory: []}
+    for root, dirnames, files in os.walk(directory):
+        rules = rules_by_dir.pop(root)
+        log("reading folder:", root)
+        rel_root = os.path.relpath(root, directory).replace(os.sep, '/')
+        rel_root = '' if rel_root == '.' else rel_root
+        if gitignore and GITIGNORE in files: rules = rules + parse_gitignore(os.path.join(root, GITIGNORE), rel_root)
+        rel = (lambda name: f"{rel_root}/{name}") if rel_root else (lambda name: name)
+        # os.walk yalnızca dirnames'te kalan klasörlere iner: listeyi yerinde budamak alt ağacı tamamen atlar
+        dirnames[:] = [name for name in dirnames if not (name.startswith(ignored) or name.endswith(ignored)) and not (rules and is_ignored(rel(name), True, rules))]
+        for name in dirnames: rules_by_dir[os.path.join(root, name)] = rules
+        for file in files:
+            _, ext = os.path.splitext(file)
+            if ext in TARGET_EXTENSIONS and not (rules and is_ignored(rel(file), False, rules)): paths.append((ext, os.path.join(root, file)))
+    return paths
+
+
+def count_files(paths, workers=None):
+    """count_file sonuçlarını paths sırasıyla üretir; dosyalar `workers` süreçlik bir havuza dağıtılır (varsayılan: CPU sayısı)."""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(paths) < MIN_POOL_FILES:
+        yield from map(count_file, paths)
+        return
+    with ProcessPoolExecutor(workers) as pool:
+        yield from pool.map(count_file, paths, chunksize=max(1, min(64, len(paths) // (workers * 4))))
+
+
+def load_cache(file_path):
+    """Önbelleği {mutlak yol: [mtime_ns, size, chars, lines, words]} olarak okur; dosya yoksa, bozuksa ya da sürümü farklıysa boş döner."""
+    try:
+        with open(file_path, encoding='utf-8') as file: data = json.load(file)
+    except (OSError, ValueError): return {}
+    return data.get('files', {}) if isinstance(data, dict) and data.get('version') == CACHE_VERSION else {}
+
+
+def save_cache(file_path, cache):
+    """Önbelleği aynı dizinde benzersiz adlı bir geçici dosyaya yazar, sonra yerine taşır: yarıda kalan yazım eski önbelleği
+    bozmaz, aynı anda çalışan iki analiz birbirinin geçici dosyasını ezmez (son taşınan kazanır). Hata OSError olarak yükselir."""
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=os.path.dirname(os.path.abspath(file_path)), prefix=os.path.basename(file_path) + '.', suffix='.tmp', delete=False) as file:
+        try: json.dump({'version': CACHE_VERSION, 'files': cache}, file, separators=(',', ':'))
+        except BaseException:
+            file.close()
+            os.remove(file.name)
+            raise
+    try: os.replace(file.name, file_path)
+    except OSError:
+        os.remove(file.name)
+        raise
+
+
+def count_cached(paths, cache, workers=None, stats=None, root=None):
+    """count_file sonuçlarını paths sırasıyla üretir. (mtime_ns, size) önbellektekiyle aynı olan dosyalar açılmaz, kalanlar
+    count_files ile sayılır. Üretim bitince cache yerinde güncellenir: root (verilmezse tüm önbellek) altında yalnızca bu
+    çalıştırmada görülen dosyalar kalır, böylece aynı önbellek birçok dizin için paylaşılabilir. stats verilirse 'cached'
+    ve 'read' sayıları yazılır."""
+    entries, changed, fresh, recent = [], [], {}, time.time_ns() - CACHE_MTIME_SLACK_NS
+    for file_path in paths:
+        key = os.path.abspath(file_path)
+        try: st = os.stat(file_path)
+        except OSError: st = None
+        entry = cache.get(key) if st is not None else None
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size: fresh[key] = entry
+        else: entry = None; changed.append((file_path, key, st))
+        entries.append(entry)
+    # Önbellekteki sonuçlar hemen, değişen dosyalarınki sayıldıkça (aynı sırayla) üretilir
+    counted = zip(changed, count_files([file_path for file_path, _, _ in changed], workers))
+    for entry in entries:
+        if entry: yield tuple(entry[2:]); continue
+        (_, key, st), count = next(counted)
+        # okunamayan dosya (0, 0, 0) döner: boş olmayan bir dosyada en az bir satır vardır, böylece hata önbelleğe girmez
+        if st is not None and st.st_mtime_ns < recent and (count[1] or not st.st_size): fresh[key] = [st.st_mtime_ns, st.st_size, *count]
+        yield count
+    if root is None: cache.clear()
+    else:
+        prefix = os.path.join(os.path.abspath(root), '')
+        for key in [key for key in cache if key.startswith(prefix)]: del cache[key]
+    cache.update(fresh)
+    if stats is not None: stats.update(cached=len(paths) - len(changed), read=len(changed))
+    log(f"cache: {len(paths) - len(changed):,} dosya önbellekten, {len(changed):,} dosya okundu")
+
+
+def _unreadable(file_path, counts):
+    """count_file okuyamadığı dosyada (0, 0, 0) döner; boş olmayan bir dosyada en az bir satır vardır."""
+    if counts[1]: return False
+    try: return os.path.getsize(file_path) > 0
+    except OSError: return True
+
+
+def analyze_directory(directory, workers=None, ignored_folders=None, gitignore=True, cache=None, on_file=None, stats=None):
+    """Sonuçları uzantı başına {'files', 'total_chars', 'total_lines', 'total_words'} olarak döner ve tabloyu text'e ekler.
+    cache verilirse (load_cache) değişmeyen dosyalar okunmaz; cache yerinde güncellenir. on_file(ext, yol, chars, lines, words)
+    her dosya sayıldığında çağrılır. stats verilirse files, chars, lines, words, errors, read ve cached toplamları yazılır."""
     global text
     target_extensions = TARGET_EXTENSIONS 
-    ignored_folders = IGNORED_FOLDERS
-    grand_total_char, grand_total_files = 0, 0 
-    results = {ext: {'files': [], 'total_chars': 0} for ext in target_extensions}
+    grand_total_char, grand_total_files, grand_total_lines, grand_total_words = 0, 0, 0, 0
+    results = {ext: {'files': [], 'total_chars': 0, 'total_lines': 0, 'total_words': 0} for ext in target_extensions}
     
-    for root, _, files in os.walk(directory):
-        for q in ignored_folders:
-            if Path(root).name.startswith(q) or Path(root).name.endswith(q):continue
-        print("reading folder:", root)
-        for file in files:
-            _, ext = os.path.splitext(file)
-            if ext in target_extensions:
-                file_path = os.path.join(root, file)
-                char_count = count_characters_in_file(file_path)
-                results[ext]['files'].append(file_path)
-                results[ext]['total_chars'] += char_count
+    paths = collect_files(directory, ignored_folders, gitignore)
+    file_paths = [file_path for _, file_path in paths]
+
+    # Dosyalar listelendikten sonra süreç havuzunda sayılır
+    counted, errors = {'cached': 0, 'read': len(paths)}, 0
+    counts = count_files(file_paths, workers) if cache is None else count_cached(file_paths, cache, workers, counted, directory)
+    # counts önde: zip onu sonuna kadar tüketir, count_cached önbelleği ancak üretim bitince günceller
+    for (char_count, line_count, word_count), (ext, file_path) in zip(counts, paths):
+        results[ext]['files'].append(file_path)
+        results[ext]['total_chars'] += char_count
+        results[ext]['total_lines'] += line_count
+        results[ext]['total_words'] += word_count
+        errors += _unreadable(file_path, (char_count, line_count, word_count))
+        if on_file: on_file(ext, file_path, char_count, line_count, word_count)
     
-    print("\nDONE.\n\n\n")
+    log("\nDONE.\n\n\n")
 
     # Toplam değerleri hesapla
     for ext in target_extensions:
         grand_total_char += results[ext]['total_chars']
         grand_total_files += len(results[ext]['files'])
+        grand_total_lines += results[ext]['total_lines']
+        grand_total_words += results[ext]['total_words']
 
     # Tablo oluştur
-    table_output = create_table(results, grand_total_char, grand_total_files)
+    table_output = create_table(results, grand_total_char, grand_total_files, grand_total_lines, grand_total_words)
     text += table_output
     
-    print("\nDONE.\n\n\n")
+    log("\nDONE.\n\n\n")
+    if stats is not None: stats.update(files=grand_total_files, chars=grand_total_char, lines=grand_total_lines, words=grand_total_words, errors=errors, **counted)
+    return results
 
 
+def parse_results(file_path):
+    """Önceki bir sonuç dosyasını (created_on, {TYPE: {sütun: sayı}}) olarak okur; dosya yoksa None döner.
+    Sütunlar başlık satırından alınır, böylece LINE/WORD sütunu olmayan eski sürümlerin dosyaları da okunur."""
+    try:
+        with open(file_path, encoding='utf-8') as file: lines = file.read().splitlines()
+    except OSError: return None
+    created_on, columns, rows = '', None, {}
+    for line in lines:
+        if line.startswith('# Created on  :'): created_on = line.split(':', 1)[1].strip()
+        elif line.startswith('CHANGES SINCE'): break  # --since ile eklenen fark tablosu
+        elif not line.startswith('|') or line.startswith(('|=', '|-')): continue
+        elif columns is None: columns = [cell.strip().lower() for cell in line.strip('|').split('|')]
+        else:
+            cells = [cell.strip() for cell in line.strip('|').split('|')]
+            rows[cells[0]] = {column: 0 if cell == '---' else int(cell.replace(',', '')) for column, cell in zip(columns[1:], cells[1:])}
+    return created_on, rows
+
+
+DELTA_COLUMNS = ('char', 'line', 'word', 'file')
+
+
+def compute_deltas(previous, results):
+    """parse_results çıktısını analyze_directory sonuçlarıyla karşılaştırır; [(TYPE, {sütun: fark})] ve toplamları döner.
+    Eski dosyada olmayan sütunların farkı None'dır. Önce bugünkü sıraya göre (karakter sayısı), sonra artık olmayan türler gelir."""
+    _, before = previous
+    now = {ext[1:].upper(): {'char': r['total_chars'], 'line': r['total_lines'], 'word': r['total_words'], 'file': len(r['files'])}
+           for ext, r in results.items() if r['files'] or r['total_chars']}
+    rows, totals = [], {}
+    for t in sorted(now, key=lambda t: now[t]['char'], reverse=True) + sorted(set(before) - set(now)):
+        row_before, row_now, changes = before.get(t), now.get(t, {}), {}
+        for column in DELTA_COLUMNS:
+            if row_before and column not in row_before: changes[column] = None; continue
+            changes[column] = row_now.get(column, 0) - (row_before or {}).get(column, 0)
+            totals[column] = totals.get(column, 0) + changes[column]
+        rows.append((t, changes))
+    return rows, totals
+
+
+def create_delta_table(previous, results):
+    """compute_deltas sonucunu tablo olarak döner; eski dosyada olmayan sütunlar '?' ile gösterilir."""
+    created_on, (rows, totals), columns = previous[0], compute_deltas(previous, results), DELTA_COLUMNS
+    table_data = [[t] + ['?' if changes[column] is None else f"{changes[column]:+,}" if changes[column] else "0" for column in columns] for t, changes in rows]
+    widths = [max(len(column), max((len(row[i]) for row in table_data), default=0)) + 2 for i, column in enumerate(('type',) + columns)]
+    separator = "|" + "|".join("=" * width for width in widths) + "|"
+    table = f"\nCHANGES SINCE {created_on or '?'}\n\n{separator}\n"
+    table += "|" + "|".join(f" {column.upper():<{width-1}}" for column, width in zip(('type',) + columns, widths)) + "|\n"
+    table += "|" + "|".join("-" * width for width in widths) + "|\n"
+    for row in table_data: table += f"|{row[0]:>{widths[0]-1}} |" + "|".join(f" {cell:<{width-1}}" for cell, width in zip(row[1:], widths[1:])) + "|\n"
+    table += f"{separator}\n\n" + "".join(f"TOTAL {column.upper()}S : {totals[column]:+,} \n" for column in columns if column in totals)
+    return table
+
+
+def make_writer(fmt, stream):
+    """STREAM_FIELDS alanlı kayıtları (dict) stream'e yazan bir fonksiyon döner: 'json' her kaydı bir satıra (JSON Lines),
+    'csv' başlıklı satırlar olarak yazar. Her kayıttan sonra flush edilir, böylece okuyan taraf sonuçları hesaplandıkça alır."""
+    if fmt == 'csv':
+        writer = csv.DictWriter(stream, STREAM_FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        write = writer.writerow
+    else: write = lambda record: stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+    def emit(record):
+        write(record)
+        stream.flush()
+    return emit
+
 
 if __name__ == "__main__":
-    current_dir = os.getcwd()
-    print(f"Analiz edilen dizin: {current_dir}")
-    time.sleep(3)
+    parser = argparse.ArgumentParser(description="Dizindeki hedef uzantılı dosyaların karakter, satır ve kelime sayılarını çıkarır.")
+    parser.add_argument("directory", nargs="?", default=os.getcwd(), help="analiz edilecek dizin (varsayılan: geçerli dizin)")
+    parser.add_argument("--workers", type=int, default=None, help="dosyaları sayan süreç sayısı (varsayılan: CPU sayısı; 1: süreç havuzu yok)")
+    parser.add_argument("--ignore", action="append", default=[], metavar="NAME", help="adı NAME ile başlayan/biten klasörleri de atla (tekrarlanabilir)")
+    parser.add_argument("--no-default-ignores", action="store_true", help=f"varsayılan yok sayılan klasörleri ({', '.join(sorted(IGNORED_FOLDERS))}) kullanma")
+    parser.add_argument("--no-gitignore", action="store_true", help=".gitignore dosyalarını okuma")
+    parser.add_argument("--cache", metavar="FILE", help=f"sayım önbelleği (varsayılan: {CACHE_FILE}; --batch/--format json|csv ile yalnızca verilirse kullanılır)")
+    parser.add_argument("--no-cache", action="store_true", help="önbelleği kullanma, tüm dosyaları oku")
+    parser.add_argument("--since", nargs="?", const=RESULTS_FILE, metavar="FILE", help=f"önceki sonuç dosyasına göre uzantı başına farkları ekle (varsayılan: {RESULTS_FILE})")
+    parser.add_argument("--batch", action="store_true", help="etkileşimsiz mod (CI/cron): başlık, bekleme ve ilerleme mesajı yok, sonunda stderr'e özet")
+    parser.add_argument("--format", choices=("table", "json", "csv"), default="table", help="table: tablo ve sonuç dosyası; json/csv: dosya, uzantı ve özet kayıtlarını akıtır (--batch'i içerir)")
+    parser.add_argument("--output", default="-", metavar="FILE", help="json/csv kayıtlarının yazılacağı dosya (varsayılan: -, stdout)")
+    parser.add_argument("--fail-on-error", action="store_true", help="okunamayan dosya varsa 1 ile çık")
+    args = parser.parse_args()
+    if args.workers is not None and args.workers < 1: parser.error("--workers must be a positive integer")
+    if not os.path.isdir(args.directory): parser.error(f"directory not found: {args.directory}")
+    batch, started = args.batch or args.format != "table", time.perf_counter()
+    VERBOSE = not batch
+    current_dir = os.path.abspath(args.directory)  # dosya ve özet kayıtlarında aynı (mutlak) yol biçimi
+    if not batch:
+        print(*BANNER)
+        print(f"Analiz edilen dizin: {current_dir}")
+        time.sleep(3)
     
-    analyze_directory(current_dir)
+    # Önceki sonuçlar, yeni sonuç dosyası üzerine yazılmadan okunur
+    previous = parse_results(args.since) if args.since else None
+    if args.since and previous is None: print(f"Uyarı: {args.since} okunamadı, farklar raporlanmayacak.", file=sys.stderr)
+    # CI/cron'da çalışılan dizine ortak bir önbellek bırakılmaz: etkileşimsiz modda önbellek yalnızca --cache ile açılır
+    cache_file = None if args.no_cache else args.cache or (None if batch else CACHE_FILE)
+    cache = None if cache_file is None else load_cache(cache_file)
+    stream = None if args.format == "table" else sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", newline="")
+    emit = make_writer(args.format, stream) if stream else None
+    on_file = (lambda ext, path, chars, lines, words: emit({'record': 'file', 'ext': ext, 'path': path, 'chars': chars, 'lines': lines, 'words': words})) if emit else None
+    stats = {}
+    results = analyze_directory(current_dir, args.workers, set(args.ignore) | (set() if args.no_default_ignores else IGNORED_FOLDERS), not args.no_gitignore, cache, on_file, stats)
+    if cache is not None:
+        # sonuçlar zaten hesaplandı: önbellek yazılamazsa (salt okunur dizin vb.) çalıştırma bozulmaz, yalnızca uyarılır
+        try: save_cache(cache_file, cache)
+        except OSError as e: print(f"Uyarı: önbellek kaydedilemedi ({cache_file}) - {e}", file=sys.stderr)
     
-    # Sonuçları yazdır
-    for line in text.split("\n"):
-        print(line)
-        time.sleep(0.1)
+    if emit:
+        # Dosya kayıtlarından sonra uzantı, fark ve özet kayıtları gelir
+        for ext in sorted(results, key=lambda ext: results[ext]['total_chars'], reverse=True):
+            r = results[ext]
+            if r['files']: emit({'record': 'extension', 'ext': ext, 'files': len(r['files']), 'chars': r['total_chars'], 'lines': r['total_lines'], 'words': r['total_words']})
+        if previous is not None:
+            for t, changes in compute_deltas(previous, results)[0]: emit({'record': 'delta', 'ext': '.' + t.lower(), **{f"{column}s": change for column, change in changes.items()}})
+        emit({'record': 'summary', 'path': current_dir, **stats, 'seconds': round(time.perf_counter() - started, 3)})
+        if stream is not sys.stdout: stream.close()
+    else:
+        if previous is not None: text += create_delta_table(previous, results)
+        
+        # Sonuçları yazdır
+        for line in text.split("\n"):
+            print(line)
+            if not batch: time.sleep(0.1)
+
+        # Dosyaya kaydet
+        filename = RESULTS_FILE #_{datetime.datetime.now().strftime('%Y-%m-%d %H.%M.%S')}.txt"
+        with open(filename, "w", encoding="utf-8") as f: f.write(text)
 
-    # Dosyaya kaydet
-    filename = f"_folder_analysis_results.txt" #_{datetime.datetime.now().strftime('%Y-%m-%d %H.%M.%S')}.txt"
-    with open(filename, "w", encoding="utf-8") as f: f.write(text)
+        print(f"\n\nAnalysis results have been saved to '{os.path.abspath(filename)}'.", file=sys.stderr if batch else sys.stdout)
 
-    print(f"\n\nAnalysis results have been saved to '{os.path.abspath(filename)}'.")
\ No newline at end of file
+    if batch:
+        print(f"file_analyzer: {current_dir}: {stats['files']:,} dosya, {stats['chars']:,} karakter, {stats['lines']:,} satır, {stats['words']:,} kelime; "
+              f"{stats['read']:,} okundu, {stats['cached']:,} önbellekten, {stats['errors']:,} hata; {time.perf_counter() - started:.2f} sn", file=sys.stderr)
+    sys.exit(1 if args.fail_on_error and stats['errors'] else 0)
\ No newline at end of file
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+===============================================================================
+                        File Analyzer Benchmark
+===============================================================================
+Description:
+    file_analyzer için karşılaştırmalı performans ölçümleri.
+
+    count : Sentetik bir monorepo (varsayılan 3.000 küçük kaynak/metin dosyası, ASCII ve Türkçe UTF-8 karışık,
+            ve --large adet --large-mb MB'lık büyük dosya) oluşturur ve v1.0.3'teki sayımı (dosyanın tamamı
+            str olarak okunur, len alınır) count_file (ikili parçalar, devam baytı sayımı, satır ve kelime de
+            aynı geçişte) ile tek süreçte ve --workers süreçlik havuzda karşılaştırır. Süre, MB/sn ve tek
+            süreçli yöntemler için büyük dosyalarda ayrılan en yüksek bellek (tracemalloc) ölçülür; karakter
+            toplamlarının aynı olduğu doğrulanır. Disk önbelleği ısıtılır, yani okuma değil sayım ölçülür.
+
+    prune : Büyük bir virtualenv'li proje ağacı (varsayılan 1.000 kaynak dosyası, .venv içinde 30.000 paket dosyası,
+            .gitignore'daki node_modules/ ve build/ içinde 12.000, .git içinde 5.000 dosya) oluşturur ve v1.1.0'daki
+            taramayı (IGNORED_FOLDERS döngüsündeki `continue` hiçbir klasörü atlamaz) collect_files ile varsayılan
+            yok sayılan klasörler ve .gitignore açık/kapalı karşılaştırır. Listelenen klasör (os.scandir), sayılacak
+            dosya ve bayt ile tarama + tek süreçli sayım süresi ölçülür; budanan klasörlerin hiç listelenmediği gösterilir.
+
+    cache : count ile aynı monorepo üzerinde önbelleksiz sayımı count_cached ile karşılaştırır: boş önbellek (ilk
+            çalıştırma), dosyadan yüklenen dolu önbellek (hiçbir şey değişmemiş) ve dosyaların --changed yüzdesinin
+            mtime'ı değiştirilmiş hali. Açılan dosya sayısı ve önbellek okuma/yazma dahil süre ölçülür; sayımların
+            önbelleksiz sonuçla aynı olduğu doğrulanır. Dosyaların mtime'ı önce geçmişe alınır (yeni dosyalar önbelleğe girmez).
+
+    batch : --repos adet küçük depo (her biri --files dosya) üzerinde file_analyzer.py'yi ayrı süreç olarak çalıştırır:
+            v1.3.0 davranışı (varsayılan mod: 3 sn bekleme + satır başına 0,1 sn), --batch ve --format json. Toplam
+            süre, depo başına süre ve json modunda ilk kaydın geldiği an (akış) ölçülür; json özet kayıtlarının
+            toplamlarının count_files ile aynı olduğu doğrulanır.
+
+Usage:
+    cmd -> `python file_analyzer_benchmark.py count [--files 3000] [--large 4] [--large-mb 32] [--workers 1 4] [--root DIR] [--keep]`
+    cmd -> `python file_analyzer_benchmark.py cache [--files 3000] [--large 4] [--large-mb 32] [--changed 1.0] [--root DIR] [--keep]`
+    cmd -> `python file_analyzer_benchmark.py batch [--repos 5] [--files 200] [--root DIR] [--keep]`
+    cmd -> `python file_analyzer_benchmark.py prune [--files 1000] [--venv 30000] [--root DIR] [--keep]`
+
+Author:
+    Mefamex (info@mefamex.com) (https://mefamex.com)
+
+License:
+    MIT Lisansı (https://opensource.org/licenses/MIT)
+===============================================================================
+"""
+
+#============================ IMPORTS =========================================
+import argparse, io, json, os, random, shutil, subprocess, sys, tempfile, time, tracemalloc
+from contextlib import redirect_stdout
+from pathlib import Path
+from time import perf_counter
+import file_analyzer as fa
+#==============================================================================
+
+
+#============================ HELPERS =========================================
+def _print_table(title: str, header: list, rows: list) -> None:
+    widths = [max(len(str(x)) for x in col) + 2 for col in zip(header, *rows)]
+    line = "|" + "|".join("-" * w for w in widths) + "|"
+    print(f"\n{title}\n{line}")
+    print("|" + "|".join(f" {h:<{w - 1}}" for h, w in zip(header, widths)) + "|")
+    print(line)
+    for row in rows: print("|" + "|".join(f" {str(c):<{w - 1}}" for c, w in zip(row, widths)) + "|")
+    print(line)
+
+
+_WORDS = ("def", "return", "import", "class", "self", "value", "print", "dosya", "klasör", "sayım", "değişken", "şöyle",
+          "ğüşıöç", "—", "→", "𝄞", "README", "{", "}", "(x)", "#", "==")
+
+
+def build_monorepo(root: Path, files: int, large: int, large_mb: int) -> None:
+    """`files` small files (1-64 KiB) spread over packages, plus `large` generated files of `large_mb` MB each."""
+    rng = random.Random(22)
+    for i in range(files):
+        folder = root / f"pkg{i % 40:02d}" / f"mod{i % 7}"
+        folder.mkdir(parents=True, exist_ok=True)
+        lines, size, target = [], 0, rng.randint(1, 64) * 1024
+        while size < target:
+            lines.append(" " * rng.choice((0, 4, 8)) + " ".join(rng.choice(_WORDS) for _ in range(rng.randint(1, 12))))
+            size += len(lines[-1]) + 1
+        newline = "\r\n" if i % 5 == 0 else "\n"
+        with open(folder / f"f{i:05d}{('.py', '.md', '.js', '.txt')[i % 4]}", "w", encoding="utf-8", newline="") as f: f.write(newline.join(lines) + newline)
+    block = "\n".join(" ".join(rng.choice(_WORDS) for _ in range(10)) for _ in range(20_000)) + "\n"
+    for i in range(large):
+        folder = root / "generated"
+        folder.mkdir(parents=True, exist_ok=True)
+        with open(folder / f"bundle{i}.js", "w", encoding="utf-8") as f:
+            written = 0
+            while written < large_mb * 2**20: written += f.write(block)
+
+
+def legacy_count(file_path: str) -> int:
+    """v1.0.3 count_characters_in_file: the whole file decoded into one str."""
+    with open(file_path, 'r', encoding='utf-8') as file: return len(file.read())
+
+
+def build_project(root: Path, files: int, venv: int) -> None:
+    """Source files plus a virtualenv, gitignored node_modules/ and build/ output and a .git object store."""
+    rng = random.Random(23)
+    def write(folder: Path, name: str, size: int) -> None:
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / name).write_text(("x = 1  # örnek\n" * (size // 16 + 1))[:size], encoding="utf-8")
+    for i in range(files): write(root / "src" / f"pkg{i % 20:02d}", f"m{i:05d}{('.py', '.md')[i % 2]}", rng.randint(200, 8000))
+    for i in range(venv): write(root / ".venv" / "lib" / "python3.11" / "site-packages" / f"dist{i // 300:03d}" / f"sub{i % 300 // 30}", f"mod{i:06d}.py", rng.randint(200, 8000))
+    for i in range(venv // 3): write(root / "node_modules" / f"pkg{i // 100:03d}", f"index{i:06d}.js", rng.randint(200, 8000))
+    for i in range(venv // 15): write(root / "build" / f"chunk{i // 100:03d}", f"bundle{i:05d}.js", rng.randint(200, 8000))
+    for i in range(venv // 6): write(root / ".git" / "objects" / f"{i % 256:02x}", f"{i:038x}", 100)
+    (root / ".gitignore").write_text("node_modules/\n/build/\n*.pyc\n", encoding="utf-8")
+
+
+def legacy_collect(directory: str) -> list:
+    """v1.1.0 analyze_directory walk: the IGNORED_FOLDERS `continue` only skips the inner loop, every folder is listed."""
+    paths = []
+    for root, _, files in os.walk(directory):
+        for q in fa.IGNORED_FOLDERS:
+            if Path(root).name.startswith(q) or Path(root).name.endswith(q): continue
+        for file in files:
+            _, ext = os.path.splitext(file)
+            if ext in fa.TARGET_EXTENSIONS: paths.append((ext, os.path.join(root, file)))
+    return paths
+
+
+def _paths(root: Path) -> list:
+    return [os.path.join(folder, name) for folder, _, names in os.walk(root) for name in names if os.path.splitext(name)[1] in fa.TARGET_EXTENSIONS]
+#==============================================================================
+
+
+#============================ COUNT BENCHMARK =================================
+def run_count(files: int, large: int, large_mb: int, workers: list, root: str, keep: bool) -> None:
+    base = Path(root) if root else Path(tempfile.mkdtemp(prefix="fa_bench_"))
+    try:
+        tree = base / f"monorepo_{files}_{large}x{large_mb}"
+        if not tree.exists():
+            print(f"Monorepo oluşturuluyor: {tree}...")
+            build_monorepo(tree, files, large, large_mb)
+        paths = _paths(tree)
+        total_mb = sum(os.path.getsize(p) for p in paths) / 2**20
+        big = [p for p in paths if os.path.getsize(p) >= 2**20]
+        for p in paths:
+            with open(p, "rb") as f: f.read()  # disk önbelleğini ısıt
+        methods = [("v1.0.3: read() + len (1 süreç)", lambda: [legacy_count(p) for p in paths], lambda: [legacy_count(p) for p in big])]
+        for n in workers: methods.append((f"count_file, workers={n}", lambda n=n: [c for c, _, _ in fa.count_files(paths, n)], (lambda: [fa.count_file(p) for p in big]) if n == 1 else None))
+        rows, totals = [], []
+        for name, run, single in methods:
+            start = perf_counter()
+            chars = run()
+            seconds = perf_counter() - start
+            totals.append(sum(chars))
+            peak = "-"
+            if single is not None and big:
+                tracemalloc.start()  # bellek ayrı bir geçişte ölçülür, tracemalloc süreyi şişirir
+                single()
+                peak = f"{tracemalloc.get_traced_memory()[1] / 2**20:,.1f}"
+                tracemalloc.stop()
+            rows.append([name, f"{sum(chars):,}", f"{seconds:.2f}", f"{total_mb / seconds:,.0f}", peak])
+        _print_table(f"COUNT: {len(paths):,} dosya, {total_mb:,.0f} MB, {os.cpu_count()} CPU (aynı karakter toplamı: {len(set(totals)) == 1})",
+                     ["yöntem", "chars", "wall s", "MB/s", f"peak MB ({large_mb} MB dosya)"], rows)
+    finally:
+        if not keep and not root: shutil.rmtree(base, ignore_errors=True)
+#==============================================================================
+
+
+#============================ CACHE BENCHMARK =================================
+def run_cache(files: int, large: int, large_mb: int, changed: float, root: str, keep: bool) -> None:
+    base = Path(root) if root else Path(tempfile.mkdtemp(prefix="fa_bench_"))
+    try:
+        tree = base / f"monorepo_{files}_{large}x{large_mb}"
+        if not tree.exists():
+            print(f"Monorepo oluşturuluyor: {tree}...")
+            build_monorepo(tree, files, large, large_mb)
+        paths, old = _paths(tree), time.time() - 3600
+        for p in paths: os.utime(p, (old, old))
+        cache_file, opened, count_file = str(base / "bench_cache.json"), [0], fa.count_file
+        def counting(file_path):
+            opened[0] += 1
+            return count_file(file_path)
+        def cached(load: bool):
+            cache = fa.load_cache(cache_file) if load else {}
+            counts = list(fa.count_cached(paths, cache, 1))
+            fa.save_cache(cache_file, cache)
+            return counts
+        def touch():
+            for p in random.Random(24).sample(paths, max(1, int(len(paths) * changed / 100))): os.utime(p, (old + 1, old + 1))
+        methods = [("önbelleksiz (v1.2.0)", None, lambda: list(fa.count_files(paths, 1))), ("boş önbellek (ilk çalıştırma)", None, lambda: cached(False)),
+                   ("dolu önbellek, değişiklik yok", None, lambda: cached(True)), (f"dolu önbellek, %{changed:g} değişmiş", touch, lambda: cached(True))]
+        rows, expected = [], None
+        for p in paths:
+            with open(p, "rb") as f: f.read()  # disk önbelleğini ısıt
+        fa.count_file = counting
+        try:
+            with redirect_stdout(io.StringIO()):  # "cache: ..." satırları tabloyu bozmasın
+                for name, prepare, run in methods:
+                    if prepare: prepare()
+                    opened[0] = 0
+                    start = perf_counter()
+                    counts = run()
+                    seconds = perf_counter() - start
+                    expected = expected or counts
+                    rows.append([name, f"{opened[0]:,}", f"{sum(c for c, _, _ in counts):,}", f"{seconds:.3f}", counts == expected])
+        finally:
+            fa.count_file = count_file
+        _print_table(f"CACHE: {len(paths):,} dosya, önbellek {os.path.getsize(cache_file) / 2**10:,.0f} KiB", ["yöntem", "files opened", "chars", "wall s", "same counts"], rows)
+    finally:
+        if not keep and not root: shutil.rmtree(base, ignore_errors=True)
+        elif root and os.path.exists(base / "bench_cache.json"): os.remove(base / "bench_cache.json")
+#==============================================================================
+
+
+#============================ BATCH BENCHMARK =================================
+def run_batch(repos: int, files: int, root: str, keep: bool) -> None:
+    base = Path(root) if root else Path(tempfile.mkdtemp(prefix="fa_bench_"))
+    try:
+        trees = [base / f"repo_{files}_{i}" for i in range(repos)]
+        for tree in trees:
+            if not tree.exists():
+                print(f"Depo oluşturuluyor: {tree}...")
+                build_monorepo(tree, files, 0, 0)
+        script, work = str(Path(fa.__file__).resolve()), base / "batch_work"
+        work.mkdir(exist_ok=True)
+        expected = [sum(c for c, _, _ in fa.count_files(_paths(tree), 1)) for tree in trees]
+        methods = [("v1.3.0 varsayılan mod (bekleme var)", []), ("--batch", ["--batch"]), ("--format json", ["--format", "json"])]
+        rows = []
+        for name, extra in methods:
+            totals, first, start = [], [], perf_counter()
+            for tree in trees:
+                began = perf_counter()
+                proc = subprocess.Popen([sys.executable, script, str(tree), "--workers", "1", "--no-cache", *extra], cwd=work, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, encoding="utf-8")
+                lines = []
+                for line in proc.stdout:
+                    if not lines and extra[:1] == ["--format"]: first.append(perf_counter() - began)
+                    lines.append(line)
+                proc.wait()
+                if extra[:1] == ["--format"]: totals.append(json.loads(lines[-1])["chars"])
+            seconds = perf_counter() - start
+            rows.append([name, f"{seconds:.2f}", f"{seconds / repos:.3f}", f"{sum(first) / len(first):.3f}" if first else "-", totals == expected if totals else "-"])
+        _print_table(f"BATCH: {repos} depo x {files:,} dosya (ayrı süreçler)", ["mod", "toplam s", "depo başına s", "ilk kayıt s", "aynı toplamlar"], rows)
+    finally:
+        if not keep and not root: shutil.rmtree(base, ignore_errors=True)
+        elif root: shutil.rmtree(base / "batch_work", ignore_errors=True)
+#==============================================================================
+
+
+#============================ PRUNE BENCHMARK =================================
+def run_prune(files: int, venv: int, root: str, keep: bool) -> None:
+    base = Path(root) if root else Path(tempfile.mkdtemp(prefix="fa_bench_"))
+    try:
+        tree = base / f"project_{files}_{venv}"
+        if not tree.exists():
+            print(f"Proje ağacı oluşturuluyor: {tree}...")
+            build_project(tree, files, venv)
+        listed, scandir = [], os.scandir
+        def tracking(path=".", *args):
+            listed.append(Path(path).relative_to(tree).parts[:1])
+            return scandir(path, *args)
+        methods = [("v1.1.0 (continue: hiçbir klasör atlanmaz)", lambda: legacy_collect(str(tree))),
+                   ("IGNORED_FOLDERS, .gitignore kapalı", lambda: fa.collect_files(str(tree), gitignore=False)),
+                   ("IGNORED_FOLDERS + .gitignore", lambda: fa.collect_files(str(tree)))]
+        rows = []
+        legacy_collect(str(tree))  # disk önbelleğini ısıt
+        with redirect_stdout(io.StringIO()):  # "reading folder" satırları ölçümü bozmasın
+            for name, collect in methods:
+                listed.clear()
+                os.scandir = tracking
+                try: collect()
+                finally: os.scandir = scandir
+                start = perf_counter()
+                paths = collect()
+                collected = perf_counter() - start
+                chars = sum(c for c, _, _ in fa.count_files([p for _, p in paths], 1))
+                seconds = perf_counter() - start
+                tops = {top[0] for top in listed if top}
+                rows.append([name, f"{len(listed):,}", bool(tops & {".venv", ".git"}), bool(tops & {"node_modules", "build"}), f"{len(paths):,}",
+                             f"{sum(os.path.getsize(p) for _, p in paths) / 2**20:,.1f}", f"{chars:,}", f"{collected:.2f}", f"{seconds:.2f}"])
+        _print_table(f"PRUNE: {files:,} kaynak dosyası, .venv içinde {venv:,} dosya", ["yöntem", "listed folders", ".venv/.git listed", "gitignored listed", "files to count", "MB", "chars", "walk s", "walk + count s"], rows)
+    finally:
+        if not keep and not root: shutil.rmtree(base, ignore_errors=True)
+#==============================================================================
+
+
+#============================ MAIN EXECUTION ==================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="file_analyzer benchmark suite")
+    sub = parser.add_subparsers(dest="suite", required=True)
+    p_count = sub.add_parser("count", help="v1.0.3 sayımını count_file ve süreç havuzuyla karşılaştırır")
+    p_count.add_argument("--files", type=int, default=3_000)
+    p_count.add_argument("--large", type=int, default=4, help="büyük (üretilmiş) dosya sayısı")
+    p_count.add_argument("--large-mb", type=int, default=32)
+    p_count.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    p_count.add_argument("--root", default="", help="ağacın oluşturulacağı/bulunduğu dizin (verilirse silinmez)")
+    p_count.add_argument("--keep", action="store_true", help="geçici ağacı silme")
+    p_cache = sub.add_parser("cache", help="önbelleksiz sayımı (mtime, boyut) önbelleğiyle karşılaştırır")
+    p_cache.add_argument("--files", type=int, default=3_000)
+    p_cache.add_argument("--large", type=int, default=4, help="büyük (üretilmiş) dosya sayısı")
+    p_cache.add_argument("--large-mb", type=int, default=32)
+    p_cache.add_argument("--changed", type=float, default=1.0, help="son ölçümde mtime'ı değiştirilen dosya yüzdesi")
+    p_cache.add_argument("--root", default="", help="ağacın oluşturulacağı/bulunduğu dizin (verilirse silinmez)")
+    p_cache.add_argument("--keep", action="store_true", help="geçici ağacı silme")
+    p_batch = sub.add_parser("batch", help="varsayılan modu --batch ve --format json ile birçok depo üzerinde karşılaştırır")
+    p_batch.add_argument("--repos", type=int, default=5)
+    p_batch.add_argument("--files", type=int, default=200, help="depo başına dosya sayısı")
+    p_batch.add_argument("--root", default="", help="ağacın oluşturulacağı/bulunduğu dizin (verilirse silinmez)")
+    p_batch.add_argument("--keep", action="store_true", help="geçici ağacı silme")
+    p_prune = sub.add_parser("prune", help="v1.1.0 taramasını budamalı collect_files ile büyük bir virtualenv üzerinde karşılaştırır")
+    p_prune.add_argument("--files", type=int, default=1_000, help="kaynak dosyası sayısı")
+    p_prune.add_argument("--venv", type=int, default=30_000, help=".venv içindeki dosya sayısı (node_modules/build/.git bununla orantılı)")
+    p_prune.add_argument("--root", default="", help="ağacın oluşturulacağı/bulunduğu dizin (verilirse silinmez)")
+    p_prune.add_argument("--keep", action="store_true", help="geçici ağacı silme")
+    args = parser.parse_args()
+    if args.suite == "cache": run_cache(args.files, args.large, args.large_mb, args.changed, args.root, args.keep)
+    if args.suite == "batch": run_batch(args.repos, args.files, args.root, args.keep)
+    if args.suite == "prune": run_prune(args.files, args.venv, args.root, args.keep)
+    if args.suite == "count": run_count(args.files, args.large, args.large_mb, args.workers, args.root, args.keep)
+#==============================================================================
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+threadpool.POOL için regresyon testleri.
+
+Usage:
+    cmd -> `python -m pytest multiThread/test_threadpool.py` veya `python -m unittest test_threadpool` (multiThread içinde)
+"""
+
+import asyncio, functools, os, queue, threading, time, unittest
+from array import array
+from unittest import mock
+import threadpool
+from threadpool import POOL, AsyncPOOL, RateLimit, RateLimiter, RetryPolicy, cancel_requested
+
+
+# Process backend görevleri "spawn" ile başlayan child'da çalışır: modül seviyesinde ve pickle edilebilir olmalı
+class _TwoArgError(Exception):
+    def __init__(self, code, detail): super().__init__(f"{code}: {detail}")  # pickle'dan tek argümanla geri kurulamaz
+
+
+def _raise_two_arg_error(): raise _TwoArgError(7, "bad")
+
+
+def _return_lock(): return threading.Lock()
+
+
+class BoundedQueueTest(unittest.TestCase):
+    """max_queue / on_full: a full queue blocks, drops or raises."""
+
+    def _busy_pool(self, on_full):
+        started, gate = threading.Event(), threading.Event()
+        pool = POOL(1, logFuture=False, max_queue=1, on_full=on_full)
+        pool.submit(lambda: (started.set(), gate.wait()))
+        self.assertTrue(started.wait(2))
+        pool.submit(int, 1)  # kuyruktaki tek yer dolar
+        return pool, gate
+
+    def test_drop_returns_a_cancelled_future(self):
+        pool, gate = self._busy_pool("drop")
+        try:
+            self.assertTrue(pool.submit(int, 2).cancelled())
+            self.assertEqual(pool.dropped, 1)
+        finally:
+            gate.set()
+            pool.shutdown()
+
+    def test_raise_raises_queue_full(self):
+        pool, gate = self._busy_pool("raise")
+        try:
+            with self.assertRaises(queue.Full): pool.submit(int, 2)
+        finally:
+            gate.set()
+            pool.shutdown()
+
+    def test_block_waits_for_a_free_slot(self):
+        pool, gate = self._busy_pool("block")
+        try:
+            submitted = []
+            producer = threading.Thread(target=lambda: submitted.append(pool.submit(int, 2)))
+            producer.start()
+            producer.join(0.2)
+            self.assertTrue(producer.is_alive())
+            gate.set()
+            producer.join(2)
+            self.assertEqual(submitted[0].result(timeout=2), 2)
+        finally:
+            gate.set()
+            pool.shutdown()
+
+
+class ResultStreamingTest(unittest.TestCase):
+    def test_map_yields_in_input_order(self):
+        with POOL(4, logFuture=False) as pool:
+            self.assertEqual(list(pool.map(lambda x: (time.sleep(0.01 * (5 - x)), x)[1], range(5))), list(range(5)))
+            self.assertEqual(list(pool.map(pow, range(6), [2] * 6, window=2)), [0, 1, 4, 9, 16, 25])
+
+    def test_as_completed_yields_in_finish_order(self):
+        with POOL(2, logFuture=False) as pool:
+            slow, fast = pool.submit(lambda: time.sleep(0.3) or "slow"), pool.submit(lambda: "fast")
+            self.assertEqual([f.result() for f in pool.as_completed([slow, fast], timeout=2)], ["fast", "slow"])
+            with self.assertRaises(TimeoutError): list(pool.as_completed([pool.submit(time.sleep, 0.3)], timeout=0.05))
+
+    def test_map_raises_the_task_error(self):
+        with POOL(2, logFuture=False) as pool:
+            with self.assertRaises(ZeroDivisionError): list(pool.map(lambda x: 1 / x, [1, 0, 2]))
+
+
+class ProcessBackendTest(unittest.TestCase):
+    def test_chunks_run_in_one_child_and_children_are_recycled(self):
+        with POOL(1, logFuture=False, backend="process", chunksize=5, max_tasks_per_child=5) as pool:
+            first = pool.submit(time.sleep, 0.5)
+            time.sleep(0.1)  # dispatcher ilk görevi tek başına aldı, kalanlar child meşgulken birikir
+            pids = [f.result(timeout=30) for f in [pool.submit(os.getpid) for _ in range(10)]]
+            first.result(timeout=30)
+        self.assertEqual(len(set(pids[:5])), 1, pids)  # ilk chunk ilk child'da (6. görevde geri dönüşüm)
+        self.assertEqual(len(set(pids[5:])), 1, pids)
+        self.assertNotEqual(pids[0], pids[5])
+        self.assertNotEqual(pids[0], os.getpid())
+
+    def test_large_results_come_back_through_shared_memory(self):
+        with mock.patch.object(threadpool, "_from_shared", wraps=threadpool._from_shared) as from_shared:
+            with POOL(1, logFuture=False, backend="process", shm_threshold=1 << 16) as pool:
+                self.assertEqual(pool.submit(bytes, 1 << 17).result(timeout=30), bytes(1 << 17))
+                self.assertIsInstance(pool.submit(bytearray, 1 << 17).result(timeout=30), bytearray)
+                self.assertEqual(pool.submit(array, "d", bytes(1 << 17)).result(timeout=30), array("d", bytes(1 << 17)))
+                self.assertEqual(pool.submit(bytes, 10).result(timeout=30), bytes(10))  # eşiğin altı: pipe
+        self.assertEqual(from_shared.call_count, 3)
+
+    def test_unpicklable_exception_and_result_are_wrapped(self):
+        with POOL(1, logFuture=False, backend="process") as pool:
+            error, result, after = pool.submit(_raise_two_arg_error), pool.submit(_return_lock), pool.submit(pow, 2, 10)
+            self.assertRegex(str(error.exception(timeout=30)), "_TwoArgError: 7: bad")
+            self.assertIsInstance(error.exception(), RuntimeError)
+            self.assertRegex(str(result.exception(timeout=30)), "Unpicklable task result")
+            self.assertEqual(after.result(timeout=30), 1024)  # child aynı chunk'taki diğer görevleri kaybetmez
+
+
+class AsyncPoolTest(unittest.TestCase):
+    def test_cancelling_a_task_cancels_or_stops_the_pool_task(self):
+        ran, stopped, gate = [], threading.Event(), threading.Event()
+        def cooperative():
+            while not cancel_requested(): time.sleep(0.01)
+            stopped.set()
+        async def main():
+            async with AsyncPOOL(max_concurrency=10, max_threads=1) as apool:
+                busy = apool.submit(gate.wait)
+                queued = apool.submit(ran.append, 1)  # tek worker meşgul: POOL kuyruğunda bekler
+                await asyncio.sleep(0.05)
+                queued.cancel()
+                await asyncio.sleep(0.05)
+                gate.set()
+                await busy
+                running = apool.submit(cooperative)
+                await asyncio.sleep(0.1)
+                running.cancel()
+                with self.assertRaises(asyncio.CancelledError): await running
+                self.assertTrue(queued.cancelled())
+        asyncio.run(main())
+        self.assertEqual(ran, [])
+        self.assertTrue(stopped.wait(2))
+
+
+class StealingSchedulerTest(unittest.TestCase):
+    def test_priority_levels_run_high_first(self):
+        order, started, gate = [], threading.Event(), threading.Event()
+        with POOL(1, logFuture=False, scheduler="stealing") as pool:
+            pool.submit(lambda: (started.set(), gate.wait()))
+            self.assertTrue(started.wait(2))
+            for name, priority in (("low", POOL.LOW), ("normal", POOL.NORMAL), ("high", POOL.HIGH)): pool.submit(order.append, name, priority=priority)
+            gate.set()
+            pool.join(verbose=False)
+        self.assertEqual(order, ["high", "normal", "low"])
+
+    def test_affinity_pins_tasks_and_idle_workers_steal_the_rest(self):
+        gate = threading.Event()
+        with POOL(2, logFuture=False, scheduler="stealing") as pool:
+            names = [f.result(timeout=2) for f in [pool.submit(lambda: threading.current_thread().name, affinity="user-1") for _ in range(10)]]
+            self.assertEqual(len(set(names)), 1)
+            pool.submit(gate.wait, affinity="user-1")  # sabitlenen worker kilitlenir
+            plain = [pool.submit(int, i) for i in range(10)]  # yarısı kilitli worker'ın deque'sine düşer
+            self.assertEqual(sorted(f.result() for f in pool.as_completed(plain, timeout=2)), list(range(10)))
+            gate.set()
+
+    def test_fifo_scheduler_rejects_priority(self):
+        with POOL(1, logFuture=False) as pool:
+            with self.assertRaises(ValueError): pool.submit(int, priority=POOL.HIGH)
+
+
+class AdaptiveScalingTest(unittest.TestCase):
+    def test_grows_under_load_and_shrinks_when_idle(self):
+        with POOL(4, logFuture=False, min_threads=1, keep_alive=0.2, scale_interval=0.05, scale_up_wait_ms=1) as pool:
+            for _ in range(12): pool.submit(time.sleep, 0.1)
+            time.sleep(0.3)
+            self.assertGreater(pool.metrics()["workers"], 1)
+            pool.join(verbose=False)
+            deadline = time.monotonic() + 3
+            while pool.metrics()["workers"] > 1 and time.monotonic() < deadline: time.sleep(0.05)
+            scaling = pool.metrics()["scaling"]
+        self.assertEqual(pool.metrics()["workers"], 1)
+        self.assertGreaterEqual(scaling["scale_ups"], 1)
+        self.assertGreaterEqual(scaling["scale_downs"], 1)
+
+
+class SubmitManyTest(unittest.TestCase):
+    def test_chunks_keep_input_order(self):
+        with POOL(2, logFuture=False) as pool:
+            futures = pool.submit_many(abs, range(-10, 0), chunksize=4)
+            self.assertEqual([f.result(timeout=2) for f in futures], [[10, 9, 8, 7], [6, 5, 4, 3], [2, 1]])
+            self.assertEqual(list(pool.map(pow, range(7), [2] * 7, chunksize=3)), [0, 1, 4, 9, 16, 25, 36])
+            failing = pool.submit_many(lambda x: 1 / x, [1, 0, 2], chunksize=3)
+            self.assertIsInstance(failing[0].exception(timeout=2), ZeroDivisionError)
+
+
+class CancelAllRateLimitTest(unittest.TestCase):
+    def test_admitted_requeued_task_releases_its_slot(self):
+        """A task let through by the limiter and re-queued, then cancelled before it starts, must give back its slot."""
+        limiter = RateLimiter(per_key=RateLimit(rate=5, burst=1, max_in_flight=1))
+        gate = threading.Event()
+        pool = POOL(1, logFuture=False, rate_limiter=limiter)
+        try:
+            pool.submit(lambda: None, rate_key="a").result(timeout=2)
+            parked = pool.submit(lambda: "parked", rate_key="a")  # token ~0.2 sn sonra: park edilir
+            time.sleep(0.05)
+            busy = pool.submit(gate.wait)  # tek worker meşgul, kabul edilen görev kuyrukta kalır
+            time.sleep(0.4)  # _pump görevi kabul edip kuyruğa geri koyar
+            self.assertEqual(pool.cancel_all(running=False), 1)
+            self.assertTrue(parked.cancelled())
+            self.assertEqual(limiter.in_flight(), {"a": 0})
+            gate.set()
+            busy.result(timeout=2)
+            self.assertEqual(pool.submit(lambda: "next", rate_key="a").result(timeout=2), "next")
+        finally:
+            gate.set()
+            pool.shutdown(wait=False, cancel_pending=True)  # hata durumunda takılan görevleri beklemez
+
+
+class SubmitOptionsTest(unittest.TestCase):
+    def test_option_named_like_a_parameter_of_func_is_rejected(self):
+        """submit()'s own keywords must not silently swallow an argument meant for func."""
+        def fetch(url, retry=0): return url, retry
+        with POOL(1, logFuture=False, scheduler="stealing") as pool:
+            with self.assertRaisesRegex(TypeError, "retry"): pool.submit(fetch, "u", retry=3)
+            with self.assertRaisesRegex(TypeError, "priority"): pool.submit(lambda priority=None: priority, priority=POOL.HIGH)
+            self.assertEqual(pool.submit(functools.partial(fetch, retry=3), "u").result(timeout=2), ("u", 3))
+            self.assertEqual(pool.submit(fetch, "u", priority=POOL.HIGH).result(timeout=2), ("u", 0))
+            self.assertEqual(pool.submit(lambda **kw: kw, x=1, priority=POOL.LOW).result(timeout=2), {"x": 1})
+
+    def test_submit_with_passes_every_keyword_to_func(self):
+        def fetch(url, retry=0, priority=None): return url, retry, priority
+        with POOL(1, logFuture=False, scheduler="stealing") as pool:
+            future = pool.submit_with({"priority": POOL.HIGH, "task_timeout": 5}, fetch, "u", retry=3, priority="p")
+            self.assertEqual(future.result(timeout=2), ("u", 3, "p"))
+            self.assertEqual(future._options.priority, POOL.HIGH)
+            self.assertEqual(pool.submit_with({}, fetch, "u", retry=1).result(timeout=2), ("u", 1, None))
+            with self.assertRaisesRegex(TypeError, "retries"): pool.submit_with({"retries": 3}, fetch, "u")
+
+
+
+class TimeoutRetryTest(unittest.TestCase):
+    def test_timed_out_worker_is_replaced(self):
+        pool = POOL(1, logFuture=False, task_timeout=0.2)
+        try:
+            stuck = pool.submit(time.sleep, 2)
+            self.assertIsInstance(stuck.exception(timeout=2), TimeoutError)
+            self.assertEqual(pool.submit(lambda: "next").result(timeout=1), "next")  # takılan thread hâlâ uyurken
+            self.assertEqual(pool.metrics()["timed_out"], 1)
+        finally:
+            pool.shutdown(wait=False)
+
+    def test_retry_until_success_and_only_for_listed_errors(self):
+        calls = []
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3: raise ConnectionError("try again")
+            return "ok"
+        with POOL(1, logFuture=False, retry=RetryPolicy(max_attempts=3, backoff=0.01, retry_on=(ConnectionError,))) as pool:
+            future = pool.submit(flaky)
+            self.assertEqual(future.result(timeout=2), "ok")
+            self.assertEqual(future.attempts, 3)
+            other = pool.submit(lambda: {}["missing"])
+            self.assertIsInstance(other.exception(timeout=2), KeyError)
+            self.assertEqual(other.attempts, 1)
+            pool.join(verbose=False)
+            self.assertEqual(pool.retried, 2)
+
+
+class ShutdownTest(unittest.TestCase):
+    def test_shutdown_does_not_wait_for_a_worker_abandoned_by_the_watchdog(self):
+        pool = POOL(1, logFuture=False, task_timeout=0.2)
+        stuck = pool.submit(time.sleep, 3)
+        time.sleep(0.05)
+        start = time.perf_counter()
+        pool.shutdown(wait=True)
+        self.assertLess(time.perf_counter() - start, 1.5)
+        self.assertIsInstance(stuck.exception(timeout=0), TimeoutError)
+
+
+
+class MetricsTest(unittest.TestCase):
+    def test_throughput_is_reported_during_the_first_second(self):
+        with POOL(2, logFuture=False) as pool:
+            for i in range(100): pool.submit(int, i)
+            pool.join(verbose=False)
+            throughput = pool.metrics()["throughput"]
+        self.assertTrue(all(rate > 0 for rate in throughput.values()), throughput)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,25 +16,67 @@ Author:
 
 Features: 
     - Verimli paralel görev yürütümü
-    - Dinamik thread havuzu yönetimi
+    - Havuza ait sabit worker thread'leri (bir kez başlatılır)
+    - Sınırlı görev kuyruğu ve ayarlanabilir geri basınç (block / drop / raise)
+    - Sentinel ile temiz kapanış (shutdown)
+    - Hafif Future nesneleri (result / exception / done callback)
+    - Girdi sırasında (map) veya bitiş sırasında (as_completed) sonuç akışı
+    - Mikro görevler için toplu gönderim: submit_many() ve map(chunksize=...)
+    - Görev başına / havuz geneli zaman aşımı (takılan worker yenilenir), işbirlikçi iptal
+      (cancel_all(), cancel_requested()) ve üstel geri bekleme + jitter ile yeniden deneme (RetryPolicy)
+    - Token bucket hız sınırı (RateLimiter): genel veya anahtar (host) başına başlatma/sn ve eşzamanlı
+      görev sınırı; bekleyen görevler worker tutmadan park edilir
     - Thread-safe görev ekleme ve sonuç toplama
     - Esnek sonuç yönetimi (saklama veya anında yazdırma)
     - Performans ölçümü ve süre hesaplama
+    - Kilitsiz worker metrikleri: duvar/CPU süresi, kuyruk bekleme, kullanım oranı, kayan pencerede throughput
+    - Sabit bellekli gecikme histogramı (p50 / p95 / p99) ve periyodik raporlayıcı
+    - CPU yoğun işler için process backend: chunk'lı gönderim, N görevde bir process yenileme,
+      büyük bytes/array sonuçları için shared memory
+    - AsyncPOOL: asyncio servisleri için awaitable görevler, coroutine + bloklayan fonksiyon karışımı,
+      eşzamanlılık semaforu ve `async for` ile sonuç akışı
+    - İş çalan zamanlayıcı (scheduler="stealing"): worker başına deque, HIGH/NORMAL/LOW öncelikleri,
+      aynı anahtarlı görevleri aynı worker'da tutan affinity
+    - Uyarlanabilir ölçekleme: kuyruk beklemesi artınca worker ekler, keep_alive süresince boşta
+      kalan worker'ları kapatır (min/max sınırları), kararlar metrics()["scaling"] içinde
     - Basit ve sezgisel API
 
 Modules:
     - threading: Thread yönetimi ve senkronizasyon
     - queue: Thread-safe görev kuyruğu
+    - collections / itertools: map() için kayan pencere
+    - heapq: Yeniden deneme ve zaman aşımı zamanlayıcısı
+    - math: Hız sınırlayıcıda sonsuz bekleme değeri
+    - concurrent.futures: CancelledError uyumluluğu
     - time: Performans ölçümü ve zamanlama
     - random: Test amaçlı rastgele sayı üretimi
+    - typing: Tip ipuçları
+    - multiprocessing / pickle / array / os: Process backend ve shared memory sonuç aktarımı
+    - asyncio: AsyncPOOL ön yüzü
 
 Classes:
     - POOL: Ana thread pool sınıfı, görev yönetimi ve paralel çalıştırma için
+    - Future: Gönderilen görevin sonucunu ve hatasını taşıyan hafif nesne
+    - LatencyHistogram: Sabit bucket'lı, sabit bellekli süre histogramı
+    - WorkerStats: Tek bir worker'a ait kilitsiz sayaçlar
+    - AsyncPOOL: POOL için asyncio ön yüzü
+    - WorkStealingQueue: Öncelik seviyeli, worker başına deque'li iş çalan görev kuyruğu
+    - RetryPolicy: Üstel geri bekleme ve jitter ile yeniden deneme kuralı
+    - RateLimit / RateLimiter: Token bucket ve genel + anahtar başına hız sınırlayıcı
 
 Functions:
-    - __init__(max_threads, logFuture, ResultwhenDone): Thread pool'u başlatır
-    - submit(func, *args, **kwargs): Yeni görev ekler
+    - __init__(max_threads, logFuture, ResultwhenDone, max_queue, on_full): Thread pool'u başlatır
+    - submit(func, *args, **kwargs): Yeni görev ekler ve Future döner
+    - submit_with(options, func, *args, **kwargs): Görev ayarlarını ayrı bir dict ile alır; tüm kwargs fonksiyona gider
+    - map(func, *iterables, chunksize): Sonuçları girdi sırasıyla akıtır
+    - submit_many(func, iterable, chunksize): Öğeleri chunk'lar halinde tek görev olarak gönderir
+    - as_completed(futures): Future'ları bitiş sırasıyla akıtır
+    - cancel_all(running): Bekleyen görevleri iptal eder, çalışanlardan durmasını ister
+    - cancel_requested(): Çalışan görevin içinden iptal / zaman aşımı isteğini sorgular (modül fonksiyonu)
+    - metrics(): Havuz metriklerinin anlık görüntüsünü döner
+    - start_reporter(interval, reporter) / stop_reporter(): Periyodik metrik raporu
     - join(): Tüm görevlerin tamamlanmasını bekler ve sonuçları döner
+    - shutdown(wait, cancel_pending): Kuyruktaki görevler bitince worker'ları durdurur
     - _worker(): Thread worker fonksiyonu (dahili)
 
 Usage:
@@ -42,14 +84,18 @@ Usage:
     2. submit() metodu ile görevleri ekleyin
     3. join() metodu ile tüm görevlerin tamamlanmasını bekleyin
     4. Sonuçları, geçen süreyi ve toplam işlem süresini alın
+    5. İş bitince shutdown() çağırın (veya `with POOL(...) as pool:` kullanın)
 
 Requirements:
-    - Python 3.6 veya üstü
+    - Python 3.9 veya üstü
     - Dependencies:
         - threading (built-in)
         - queue (built-in)
+        - collections, itertools, heapq, math, concurrent.futures (built-in)
         - time (built-in)
         - random (built-in)
+        - typing (built-in)
+        - multiprocessing, pickle, array, os, asyncio (built-in)
 
 Installation:
     1. Tek dosya olarak kullanım:
@@ -66,6 +112,19 @@ License:
 Changelog:
     - 1.0.0 (2024-09-08): İlk sürüm
     - 1.1.0 (2025-07-20): Dokümantasyon iyileştirmeleri ve usage example güncellenmesi
+    - 1.2.0 (2026-10-18): Kalıcı worker'lar, sınırlı kuyruk (block/drop/raise) ve shutdown()
+    - 1.3.0 (2026-10-18): submit() Future döner, map() ve as_completed() ile sonuç akışı
+    - 1.4.0 (2026-10-18): Kilitsiz worker metrikleri, yüzdelik gecikme histogramı, metrics() ve periyodik raporlayıcı
+    - 1.5.0 (2026-10-18): backend="process": chunk'lı dağıtım, worker geri dönüşümü ve shared memory sonuçlar
+    - 1.6.0 (2026-10-18): AsyncPOOL: asyncio ön yüzü, eşzamanlılık semaforu ve async as_completed/map
+    - 1.7.0 (2026-10-18): scheduler="stealing": worker başına deque, iş çalma, öncelik seviyeleri ve affinity
+    - 1.8.0 (2026-10-18): Uyarlanabilir worker sayısı (min_threads/max_threads, keep_alive) ve ölçekleme metrikleri
+    - 1.9.0 (2026-10-18): submit_many() ve map(chunksize=...) ile küçük görevler için toplu gönderim
+    - 1.10.0 (2026-10-18): task_timeout, cancel_all() / cancel_requested() ile iptal ve RetryPolicy ile yeniden deneme
+    - 1.11.0 (2026-10-18): rate_limiter / submit(rate_key=...): genel ve anahtar başına token bucket hız sınırı
+    - 1.12.0 (2026-10-18): submit_with(options, func, ...). UYUMLULUK: 1.7.0-1.11.0 ile gelen priority, affinity,
+      task_timeout, retry ve rate_key submit()'e ayrılmış adlardır (SUBMIT_OPTIONS) ve func'a ulaşmaz; bu adlarla parametre alan
+      fonksiyonlar submit_with() veya functools.partial ile gönderilmelidir (aksi halde submit() TypeError fırlatır)
 
 Contributors: None
 
@@ -75,15 +134,17 @@ Contact:
     - GitHub: https://github.com/Mefamex/Python_Code_Snippets
 
 Additional Information:
-    Bu modül, I/O yoğun işlemler için uygundur. CPU yoğun işlemler için multiprocessing 
-    modülü tercih edilebilir. Thread havuzu, bellek kullanımını optimize ederken 
+    Bu modül, I/O yoğun işlemler için uygundur. CPU yoğun işlemler için aynı API ile
+    backend="process" kullanılabilir. Thread havuzu, bellek kullanımını optimize ederken 
     aynı anda çalışan görev sayısını kontrol eder.
 
 Notes:
-    - Bu modül I/O yoğun işlemler için optimize edilmiştir
+    - Bu modül I/O yoğun işlemler için optimize edilmiştir; CPU yoğun işler için backend="process"
+    - Process backend'de görev fonksiyonu, argümanlar ve sonuç pickle edilebilir olmalıdır (lambda kullanılamaz)
+    - Process backend "spawn" ile başlar; ana script `if __name__ == "__main__":` ile korunmalıdır
     - Çok fazla thread kullanmak sistem performansını olumsuz etkileyebilir
     - Thread-safe tasarım sayesinde güvenli görev yönetimi sağlar
-    - Performans metrikleri otomatik olarak hesaplanır
+    - Performans metrikleri otomatik olarak hesaplanır; görev başına değer saklanmaz, bellek sabit kalır
 
 Disclaimer and Legal Notice:
     Bu yazılım, herhangi bir garanti olmaksızın "olduğu gibi" sağlanmaktadır.
@@ -96,7 +157,7 @@ Disclaimer and Legal Notice:
 ===========================================================
 """
 
-__version__ = "1.1.0"
+__version__ = "1.12.0"
 __author__ = "Mefamex"
 __email__ = "info@mefamex.com"
 __license__ = "MIT"
@@ -108,78 +169,1526 @@ __url_github__ = "https://github.com/Mefamex/Python_Code_Snippets"
 __copyright__ = "Copyright (c) 2025 Mefamex"
 __description__ = "Python için verimli thread pool implementasyonu - paralel görev yürütümü"
 __date__ = "2024-09-08"
-__date_modify__ = "2025-07-20"
-__python_version__ = ">=3.6" 
+__date_modify__ = "2026-10-18"
+__python_version__ = ">=3.9" 
 __dependencies__ = {
     "threading": "built-in",
     "queue": "built-in",
+    "collections": "built-in",
+    "itertools": "built-in",
+    "heapq": "built-in",
+    "math": "built-in",
+    "concurrent.futures": "built-in",
     "time": "built-in",
-    "random": "built-in"
+    "random": "built-in",
+    "typing": "built-in",
+    "multiprocessing": "built-in",
+    "pickle": "built-in",
+    "array": "built-in",
+    "os": "built-in",
+    "asyncio": "built-in"
 }
 #===============================================================================
 
 
 
 #============================ IMPORTS =========================================
-import threading
-from queue import Queue
-from time import time, sleep
-from random import randint
+import asyncio, inspect, os, pickle, threading
+from math import inf
+import multiprocessing
+from array import array
+from collections import deque, namedtuple
+from functools import lru_cache
+from concurrent.futures import CancelledError
+from heapq import heappush, heappop
+from itertools import count, islice
+from multiprocessing.shared_memory import SharedMemory
+from queue import Queue, Full, Empty
+from time import time, sleep, monotonic, perf_counter_ns, thread_time_ns, process_time_ns
+from random import randint, uniform
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional
+#==============================================================================
+
+#============================ CLASS FUTURE ====================================
+_PENDING, _RUNNING, _CANCELLED, _FINISHED = "PENDING", "RUNNING", "CANCELLED", "FINISHED"
+_TaskOptions = namedtuple("_TaskOptions", "timeout retry priority affinity rate_key")  # POOL'un görev başına ayarları
+_NO_OPTIONS = _TaskOptions(None, None, 1, None, None)
+SUBMIT_OPTIONS = ("priority", "affinity", "task_timeout", "retry", "rate_key")  # submit()'in kendine ayırdığı anahtar kelimeler
+
+
+@lru_cache(maxsize=256)
+def _option_params(func: Callable) -> frozenset:
+    """Names in SUBMIT_OPTIONS that func also accepts as a keyword argument (its own parameter, not **kwargs)."""
+    try: params = inspect.signature(func).parameters
+    except (TypeError, ValueError): return frozenset()  # imzası okunamayan yerleşik fonksiyonlar
+    keyword = (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+    return frozenset(name for name in SUBMIT_OPTIONS if name in params and params[name].kind in keyword)
+
+
+class Future:
+    """
+    Lightweight handle for the outcome of a task submitted to POOL.
+    The wait event is only allocated when someone actually blocks on an unfinished task.
+    """
+    __slots__ = ("_state", "_result", "_exception", "_callbacks", "_waiter", "attempts", "_cancel_requested", "_options")
+    _lock = threading.Lock()  # Tüm future'lar için kısa süreli durum kilidi
+
+    def __init__(self):
+        self._state, self._result, self._exception = _PENDING, None, None
+        self._callbacks, self._waiter, self.attempts = [], None, 0
+        self._cancel_requested, self._options = False, _NO_OPTIONS
+
+    def __repr__(self) -> str: return f"<Future state={self._state} attempts={self.attempts}>"
+
+    def done(self) -> bool: return self._state in (_FINISHED, _CANCELLED)
+
+    def running(self) -> bool: return self._state == _RUNNING
+
+    def cancelled(self) -> bool: return self._state == _CANCELLED
+
+    def cancel(self) -> bool:
+        """Cancels the task if it has not started yet. Returns True on success.
+        A running task cannot be interrupted: the call returns False and only asks the task to stop,
+        which the task sees through cancel_requested()."""
+        with self._lock:
+            if self._state == _CANCELLED: return True
+            if self._state != _PENDING:
+                if self._state == _RUNNING: self._cancel_requested = True
+                return False
+            self._state = _CANCELLED
+        self._finish()
+        return True
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """Returns the task result, re-raising the task exception if it failed.
+
+        Raises:
+            TimeoutError: If the task is not done within timeout seconds.
+            CancelledError: If the task was cancelled or dropped.
+        """
+        if not self._wait(timeout): raise TimeoutError("Task did not finish in time.")
+        if self._state == _CANCELLED: raise CancelledError()
+        if self._exception is not None: raise self._exception
+        return self._result
+
+    def exception(self, timeout: Optional[float] = None) -> Optional[BaseException]:
+        """Returns the exception raised by the task, or None if it succeeded."""
+        if not self._wait(timeout): raise TimeoutError("Task did not finish in time.")
+        if self._state == _CANCELLED: raise CancelledError()
+        return self._exception
+
+    def add_done_callback(self, fn: Callable[["Future"], Any]) -> None:
+        """Calls fn(future) when the task is done, immediately if it already is."""
+        with self._lock:
+            if not self.done():
+                self._callbacks.append(fn)
+                return
+        self._run_callback(fn)
+
+    def _set_running(self) -> int:
+        """Starts a new attempt and returns its number, or 0 if the task was cancelled."""
+        with self._lock:
+            if self._state != _PENDING: return 0
+            self._state, self.attempts = _RUNNING, self.attempts + 1
+            return self.attempts
+
+    def _is_current(self, attempt: int) -> bool: return self._state == _RUNNING and self.attempts == attempt
+
+    def _set_result(self, result: Any, attempt: int) -> bool:
+        if self._options.timeout: return self._settle(attempt, _FINISHED, result=result)
+        # Süre sınırı yoksa çalışan denemeyi yalnızca kendi worker'ı bitirir, kilit gerekmez
+        if self._state != _RUNNING or self.attempts != attempt: return False
+        self._result, self._state = result, _FINISHED
+        self._finish()
+        return True
+
+    def _set_exception(self, exception: BaseException, attempt: int) -> bool: return self._settle(attempt, _FINISHED, exception=exception)
+
+    def _set_cancelled(self, attempt: int) -> bool: return self._settle(attempt, _CANCELLED)
+
+    def _retry_later(self, attempt: int) -> bool: return self._settle(attempt, _PENDING)
+
+    def _settle(self, attempt: int, state: str, result: Any = None, exception: Optional[BaseException] = None) -> bool:
+        """Ends `attempt` with the given state. Returns False if a timeout or retry already moved past it."""
+        with self._lock:
+            if not self._is_current(attempt): return False
+            self._state, self._result, self._exception = state, result, exception
+        if state != _PENDING: self._finish()
+        return True
+
+    def _abort(self, exception: BaseException) -> bool:
+        """Fails a task that waits for its retry but will never be queued again."""
+        with self._lock:
+            if self._state != _PENDING: return False
+            self._state, self._exception = _FINISHED, exception
+        self._finish()
+        return True
+
+    def _finish(self) -> None:
+        with self._lock: waiter, callbacks, self._callbacks = self._waiter, self._callbacks, []
+        if waiter is not None: waiter.set()
+        for fn in callbacks: self._run_callback(fn)
+
+    def _run_callback(self, fn: Callable[["Future"], Any]) -> None:
+        try: fn(self)
+        except Exception as e: print(f"Future callback hatası: {e!r}")
+
+    def _wait(self, timeout: Optional[float]) -> bool:
+        if self.done(): return True
+        with self._lock:
+            if self.done(): return True
+            if self._waiter is None: self._waiter = threading.Event()
+            waiter = self._waiter
+        return waiter.wait(timeout)
+
+
+_task_local = threading.local()  # worker thread'inin bağlı olduğu POOL
+
+
+def cancel_requested() -> bool:
+    """Returns True inside a running POOL task once it should stop: it was cancelled with Future.cancel()
+    or POOL.cancel_all(), or it ran past its timeout. Long tasks can poll it and return early or raise
+    concurrent.futures.CancelledError. Always False outside pool threads and in the process backend."""
+    pool = getattr(_task_local, "pool", None)
+    if pool is None: return False
+    me = threading.current_thread()
+    if me in pool._abandoned: return True  # zaman aşımı: yerine yeni worker başlatıldı
+    entry = pool._current.get(me)
+    return entry is not None and any(item[3]._cancel_requested or not item[3]._is_current(attempt) for item, attempt in entry[1])
+#==============================================================================
+
+#============================ METRICS =========================================
+class LatencyHistogram:
+    """
+    Fixed-bucket log-linear histogram of nanosecond durations.
+    Every power of two is split into 8 linear sub-buckets (~12.5% relative error), so memory stays
+    constant no matter how many values are recorded.
+    """
+    SUB_BITS = 3
+    SUB_BUCKETS = 1 << SUB_BITS
+    MAX_EXP = 44  # 2**44 ns ≈ 4.9 saat, daha uzun süreler son bucket'a yazılır
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts: List[int] = [0] * ((self.MAX_EXP - self.SUB_BITS + 2) * self.SUB_BUCKETS)
+        self.count, self.total, self.max = 0, 0, 0
+
+    @classmethod
+    def _index(cls, value: int) -> int:
+        if value < cls.SUB_BUCKETS: return max(value, 0)
+        shift = value.bit_length() - 1 - cls.SUB_BITS
+        return (shift + 1) * cls.SUB_BUCKETS + ((value >> shift) - cls.SUB_BUCKETS)
+
+    @classmethod
+    def _upper_bound(cls, index: int) -> int:
+        if index < cls.SUB_BUCKETS: return index
+        shift = index // cls.SUB_BUCKETS - 1
+        return ((index % cls.SUB_BUCKETS + cls.SUB_BUCKETS + 1) << shift) - 1
+
+    def record(self, value: int) -> None:
+        self.counts[min(self._index(value), len(self.counts) - 1)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max: self.max = value
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Adds the counts of other into this histogram and returns self."""
+        for i, c in enumerate(other.counts):
+            if c: self.counts[i] += c
+        self.count, self.total, self.max = self.count + other.count, self.total + other.total, max(self.max, other.max)
+        return self
+
+    def percentile(self, q: float) -> int:
+        """Returns the upper bound (ns) of the bucket holding the q-th percentile (0 < q <= 100)."""
+        if not self.count: return 0
+        target, seen = max(1, int(-(-self.count * q // 100))), 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= target: return min(self._upper_bound(i), self.max)
+        return self.max
+
+    def summary_ms(self) -> Dict[str, float]:
+        ms = lambda ns: round(ns / 1e6, 3)
+        return {"p50": ms(self.percentile(50)), "p95": ms(self.percentile(95)), "p99": ms(self.percentile(99)),
+                "max": ms(self.max), "mean": ms(self.total / self.count) if self.count else 0.0}
+
+
+class WorkerStats:
+    """
+    Counters owned by a single worker thread. Only that worker writes to them, so recording a task
+    needs no lock; snapshots read them from other threads and may be a few tasks behind.
+    """
+    WINDOW = 61  # kayan throughput penceresi için saniye sayısı: en uzun pencere (60 sn) + içinde bulunulan saniye
+    __slots__ = ("name", "started_ns", "busy_ns", "cpu_ns", "wait_ns", "tasks", "failed", "idle", "latency", "queue_wait", "_slot_sec", "_slot_count")
+
+    def __init__(self, name: str):
+        self.name, self.started_ns = name, perf_counter_ns()
+        self.busy_ns, self.cpu_ns, self.wait_ns, self.tasks, self.failed, self.idle = 0, 0, 0, 0, 0, False
+        self.latency, self.queue_wait = LatencyHistogram(), LatencyHistogram()
+        self._slot_sec, self._slot_count = [-1] * self.WINDOW, [0] * self.WINDOW
+
+    def record(self, wait_ns: int, wall_ns: int, cpu_ns: int, failed: bool, end_ns: int) -> None:
+        self.busy_ns += wall_ns
+        self.cpu_ns += cpu_ns
+        self.wait_ns += wait_ns
+        self.tasks += 1
+        if failed: self.failed += 1
+        self.latency.record(wall_ns)
+        self.queue_wait.record(wait_ns)
+        sec = end_ns // 1_000_000_000
+        slot = sec % self.WINDOW
+        if self._slot_sec[slot] != sec: self._slot_sec[slot], self._slot_count[slot] = sec, 0
+        self._slot_count[slot] += 1
+
+    def completed_in(self, window: int, now_ns: int) -> int:
+        """Number of tasks finished during the last `window` full seconds and the current (partial) second."""
+        now_sec = now_ns // 1_000_000_000
+        return sum(c for s, c in zip(self._slot_sec, self._slot_count) if now_sec - window <= s <= now_sec)
+
+    def utilisation(self, now_ns: int) -> float:
+        return self.busy_ns / max(1, now_ns - self.started_ns)
+
+    def merge(self, other: "WorkerStats") -> None:
+        """Folds the counters of a retired worker into this one so pool totals survive scale-downs."""
+        self.busy_ns, self.cpu_ns, self.wait_ns = self.busy_ns + other.busy_ns, self.cpu_ns + other.cpu_ns, self.wait_ns + other.wait_ns
+        self.tasks, self.failed = self.tasks + other.tasks, self.failed + other.failed
+        self.latency.merge(other.latency)
+        self.queue_wait.merge(other.queue_wait)
+        for slot, (sec, c) in enumerate(zip(other._slot_sec, other._slot_count)):
+            if sec == self._slot_sec[slot]: self._slot_count[slot] += c
+            elif sec > self._slot_sec[slot]: self._slot_sec[slot], self._slot_count[slot] = sec, c
+#==============================================================================
+
+#============================ SCHEDULER =======================================
+_STOP = object()  # Worker'a kapanma sinyali veren sentinel
+
+
+class WorkStealingQueue:
+    """
+    Task queue made of per-worker deques, one per priority level, with work stealing.
+
+    Plain tasks are spread round-robin (or pushed to the submitting worker's own deque when a task
+    submits more work); idle workers steal from the others. Tasks with an affinity key are pinned
+    to hash(key) % workers and never stolen. Every level is drained before a lower one, across all
+    workers. Popping a task takes no lock (deque operations are atomic); the shared lock is only
+    touched by put() and task_done() for the capacity and join() bookkeeping.
+
+    Args:
+        workers (int): Number of worker slots.
+        maxsize (int, optional): Maximum number of unfinished (queued or running) tasks, 0 means unbounded. Defaults to 0.
+        levels (int, optional): Number of priority levels, 0 is the most urgent. Defaults to 3.
+    """
+    IDLE_POLL = 0.1  # kaçırılan uyandırmalara karşı güvenlik süresi (saniye)
+
+    def __init__(self, workers: int, maxsize: int = 0, levels: int = 3):
+        self.workers, self.maxsize, self.levels = workers, maxsize, levels
+        self._shared = [[deque() for _ in range(levels)] for _ in range(workers)]
+        self._pinned = [[deque() for _ in range(levels)] for _ in range(workers)]
+        self._events = [threading.Event() for _ in range(workers)]
+        self._sleeping, self._in_idle, self._stop = [False] * workers, [False] * workers, [False] * workers
+        self._idle, self._rr, self._tls = deque(), count(), threading.local()
+        # Her worker kurbanları farklı sırada dener, hırsızlar aynı deque'de yığılmaz
+        self._victims = [[(w + i) % workers for i in range(1, workers)] for w in range(workers)]
+        self._lock = threading.Lock()
+        self._not_full, self._all_done = threading.Condition(self._lock), threading.Condition(self._lock)
+        self._unfinished = 0
+
+    def bind(self, worker: int) -> None:
+        """Marks the calling thread as worker `worker`, so tasks it submits land on its own deque."""
+        self._tls.index = worker
+
+    def put(self, item: Any, block: bool = True, priority: int = 1, affinity: Any = None) -> None:
+        if not 0 <= priority < self.levels: raise ValueError(f"priority must be between 0 and {self.levels - 1}.")
+        with self._not_full:
+            if self.maxsize > 0:
+                if not block and self._unfinished >= self.maxsize: raise Full
+                while self._unfinished >= self.maxsize: self._not_full.wait()
+            self._unfinished += 1
+        if affinity is not None:
+            worker = hash(affinity) % self.workers
+            self._pinned[worker][priority].append(item)
+            if self._sleeping[worker]: self._events[worker].set()
+            return
+        worker = getattr(self._tls, "index", None)
+        if worker is None: worker = next(self._rr) % self.workers
+        self._shared[worker][priority].append(item)
+        if self._sleeping[worker]: self._events[worker].set()
+        else: self._wake_idle()
+
+    def put_nowait(self, item: Any, priority: int = 1, affinity: Any = None) -> None:
+        self.put(item, block=False, priority=priority, affinity=affinity)
+
+    def _wake_idle(self) -> None:
+        while self._idle:
+            try: worker = self._idle.popleft()
+            except IndexError: return
+            self._in_idle[worker] = False
+            if self._sleeping[worker]:
+                self._events[worker].set()
+                return
+
+    def _pop(self, worker: int) -> Any:
+        pinned, own, shared = self._pinned[worker], self._shared[worker], self._shared
+        victims = self._victims[worker]
+        for level in range(self.levels):
+            if pinned[level]:
+                try: return pinned[level].popleft()
+                except IndexError: pass
+            if own[level]:
+                try: return own[level].popleft()
+                except IndexError: pass
+            for victim in victims:
+                d = shared[victim][level]
+                if d:
+                    try: return d.popleft()
+                    except IndexError: pass
+        return None
+
+    def get(self, worker: int, block: bool = True) -> Any:
+        """Returns the next task for `worker`, or _STOP once the queue is closed and nothing is left."""
+        while True:
+            item = self._pop(worker)
+            if item is not None: return item
+            if self._stop[worker]:
+                self._stop[worker] = False
+                return _STOP
+            if not block: raise Empty
+            event = self._events[worker]
+            event.clear()
+            self._sleeping[worker] = True
+            if not self._in_idle[worker]:
+                self._in_idle[worker] = True
+                self._idle.append(worker)
+            item = self._pop(worker)  # uyku ilan edildikten sonra tekrar bak: kayıp uyandırma olmaz
+            if item is None and not self._stop[worker]: event.wait(self.IDLE_POLL)
+            self._sleeping[worker] = False
+            if item is not None: return item
+
+    def get_nowait(self, worker: int) -> Any: return self.get(worker, block=False)
+
+    def task_done(self) -> None:
+        with self._lock:
+            self._unfinished -= 1
+            if self.maxsize > 0: self._not_full.notify()
+            if self._unfinished <= 0: self._all_done.notify_all()
+
+    def join(self) -> None:
+        with self._all_done:
+            while self._unfinished > 0: self._all_done.wait()
+
+    def close(self) -> None:
+        """Asks every worker to stop once no task is left for it."""
+        with self._lock: self._unfinished += self.workers  # her worker'ın _STOP'u da task_done ile kapanır
+        for worker in range(self.workers):
+            self._stop[worker] = True
+            self._events[worker].set()
+
+    def drain(self) -> List[Any]:
+        """Removes and returns every queued task; the caller calls task_done() for each of them."""
+        items = []
+        for queues in (self._shared, self._pinned):
+            for levels in queues:
+                for d in levels:
+                    while d:
+                        try: items.append(d.popleft())
+                        except IndexError: break
+        return items
+
+    def qsize(self) -> int:
+        return sum(len(d) for queues in (self._shared, self._pinned) for levels in queues for d in levels)
+#==============================================================================
+
+#============================ PROCESS BACKEND =================================
+class _SharedResult:
+    """Reference to a large bytes/array result that a child process left in shared memory."""
+    __slots__ = ("name", "size", "kind", "typecode")
+
+    def __init__(self, name: str, size: int, kind: str, typecode: str = ""):
+        self.name, self.size, self.kind, self.typecode = name, size, kind, typecode
+
+    def __getstate__(self): return (self.name, self.size, self.kind, self.typecode)
+
+    def __setstate__(self, state): self.name, self.size, self.kind, self.typecode = state
+
+
+def _to_shared(value: Any, threshold: int) -> Any:
+    """Moves bytes, bytearray and array.array results of at least threshold bytes into shared memory."""
+    if not threshold or not isinstance(value, (bytes, bytearray, array)): return value
+    data = memoryview(value).cast("B")
+    if data.nbytes < threshold: return value
+    shm = SharedMemory(create=True, size=data.nbytes)
+    try: shm.buf[:data.nbytes] = data
+    finally: shm.close()
+    return _SharedResult(shm.name, data.nbytes, type(value).__name__, value.typecode if isinstance(value, array) else "")
+
+
+def _from_shared(ref: _SharedResult) -> Any:
+    """Copies a shared memory result back into a regular object and releases the segment."""
+    shm = SharedMemory(name=ref.name)
+    try: data = bytes(shm.buf[:ref.size])
+    finally:
+        shm.close()
+        shm.unlink()
+    if ref.kind == "bytearray": return bytearray(data)
+    if ref.kind == "array":
+        result = array(ref.typecode)
+        result.frombytes(data)
+        return result
+    return data
+
+
+def _picklable(value: Any) -> bool:
+    """True if value survives a pickle round trip (some exceptions pickle but cannot be rebuilt)."""
+    try: pickle.loads(pickle.dumps(value))
+    except Exception: return False
+    return True
+
+
+def _process_main(conn, shm_threshold: int) -> None:
+    """Child process loop: runs chunks of (func, args, kwargs) and sends back (ok, value, wall_ns, cpu_ns) per task."""
+    while True:
+        try: chunk = conn.recv()
+        except (EOFError, OSError): return
+        if chunk is None: return
+        replies = []
+        for func, args, kwargs in chunk:
+            start_ns, cpu_start_ns = perf_counter_ns(), process_time_ns()
+            try: reply = (True, _to_shared(func(*args, **kwargs), shm_threshold))
+            except Exception as e: reply = (False, e if _picklable(e) else RuntimeError(f"{type(e).__name__}: {e}"))
+            replies.append(reply + (perf_counter_ns() - start_ns, process_time_ns() - cpu_start_ns))
+        try: conn.send(replies)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # Pickle edilemeyen sonuç/hata yüzünden tüm chunk kaybolmasın
+            conn.send([r if _picklable(r[1]) else (False, RuntimeError(f"Unpicklable task {'result' if r[0] else 'exception'}: {r[1]!r}"), r[2], r[3]) for r in replies])
+#==============================================================================
+
+#============================ BATCHING ========================================
+def _run_batch(func: Callable, batch: list, star: bool) -> list:
+    """Runs func over one chunk of items inside a single pool task (module level so it pickles)."""
+    if star: return [func(*args) for args in batch]
+    return [func(item) for item in batch]
+
+
+def _chunks(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk: return
+        yield chunk
+#==============================================================================
+
+#============================ RETRY ===========================================
+class RetryPolicy:
+    """
+    Retry rule for failed tasks: exponential backoff with random jitter.
+    The n-th retry waits min(max_backoff, backoff * multiplier ** (n - 1)) seconds, scaled by a random factor
+    in [1 - jitter, 1 + jitter] so tasks that failed together do not all come back at the same moment.
+    Args:
+        max_attempts (int, optional): Total number of attempts, the first run included. Defaults to 3.
+        backoff (float, optional): Seconds before the first retry. Defaults to 0.1.
+        multiplier (float, optional): Growth factor of the delay between attempts. Defaults to 2.0.
+        max_backoff (float, optional): Upper bound of a single delay in seconds. Defaults to 30.0.
+        jitter (float, optional): Relative random spread of each delay, between 0 and 1. Defaults to 0.1.
+        retry_on (tuple, optional): Exception types worth retrying; TimeoutError covers task timeouts. Defaults to (Exception,).
+    """
+    __slots__ = ("max_attempts", "backoff", "multiplier", "max_backoff", "jitter", "retry_on")
+
+    def __init__(self, max_attempts: int = 3, backoff: float = 0.1, multiplier: float = 2.0, max_backoff: float = 30.0,
+                 jitter: float = 0.1, retry_on: tuple = (Exception,)):
+        if max_attempts < 1: raise ValueError("max_attempts must be at least 1.")
+        if backoff < 0 or max_backoff < 0 or multiplier < 1: raise ValueError("backoff and max_backoff must be >= 0, multiplier >= 1.")
+        if not 0 <= jitter <= 1: raise ValueError("jitter must be between 0 and 1.")
+        self.max_attempts, self.backoff, self.multiplier, self.max_backoff = max_attempts, backoff, multiplier, max_backoff
+        self.jitter, self.retry_on = jitter, tuple(retry_on) if isinstance(retry_on, (list, tuple)) else (retry_on,)
+
+    def __repr__(self) -> str:
+        return f"RetryPolicy(max_attempts={self.max_attempts}, backoff={self.backoff}, multiplier={self.multiplier}, max_backoff={self.max_backoff}, jitter={self.jitter})"
+
+    def should_retry(self, attempt: int, error: BaseException) -> bool:
+        """Whether a task whose attempt number `attempt` raised `error` gets another attempt."""
+        return attempt < self.max_attempts and isinstance(error, self.retry_on)
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait after the failed attempt number `attempt`."""
+        base = min(self.max_backoff, self.backoff * self.multiplier ** min(attempt - 1, 64))
+        return base * uniform(1 - self.jitter, 1 + self.jitter)
+
+
+class _Timer:
+    """
+    Runs callbacks after a delay on a single daemon thread (retry backoff and timeout checks).
+    The thread starts with the first scheduled callback and exits once nothing is left to run.
+    """
+    def __init__(self, name: str):
+        self.name, self._heap, self._seq = name, [], count()
+        self._cond, self._thread = threading.Condition(), None
+
+    def schedule(self, delay: float, callback: Callable[[], Any]) -> None:
+        with self._cond:
+            heappush(self._heap, (monotonic() + delay, next(self._seq), callback))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            else: self._cond.notify()
+
+    def flush(self) -> None:
+        """Runs every pending callback right away, in due order."""
+        with self._cond: heap, self._heap = self._heap, []
+        for _, _, callback in sorted(heap): self._call(callback)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if not self._heap:
+                        self._thread = None
+                        return
+                    delay = self._heap[0][0] - monotonic()
+                    if delay <= 0: break
+                    self._cond.wait(delay)
+                callback = heappop(self._heap)[2]
+            self._call(callback)
+
+    @staticmethod
+    def _call(callback: Callable[[], Any]) -> None:
+        try: callback()
+        except Exception as e: print(f"POOL timer hatası: {e!r}")
+#==============================================================================
+
+#============================ RATE LIMIT ======================================
+class RateLimit:
+    """
+    Token bucket with an optional cap on concurrently running tasks.
+    Tokens refill continuously at `rate` per second up to `burst`; every task start takes one.
+    Args:
+        rate (float, optional): Task starts per second, None for no rate limit. Defaults to None.
+        burst (float, optional): Bucket size, i.e. how many starts may happen back to back. Defaults to max(1, rate).
+        max_in_flight (int, optional): Maximum number of started but unfinished tasks, None for no cap. Defaults to None.
+    """
+    __slots__ = ("rate", "burst", "max_in_flight", "tokens", "stamp", "in_flight")
+
+    def __init__(self, rate: Optional[float] = None, burst: Optional[float] = None, max_in_flight: Optional[int] = None):
+        if rate is not None and rate <= 0: raise ValueError("rate must be positive.")
+        if max_in_flight is not None and max_in_flight < 1: raise ValueError("max_in_flight must be at least 1.")
+        if burst is None: burst = max(1.0, rate or 1.0)
+        if burst < 1: raise ValueError("burst must be at least 1.")
+        self.rate, self.burst, self.max_in_flight = rate, float(burst), max_in_flight
+        self.tokens, self.stamp, self.in_flight = float(burst), monotonic(), 0
+
+    def __repr__(self) -> str: return f"RateLimit(rate={self.rate}, burst={self.burst:g}, max_in_flight={self.max_in_flight})"
+
+    def copy(self) -> "RateLimit": return RateLimit(self.rate, self.burst, self.max_in_flight)
+
+    def _wait(self, now: float) -> float:
+        """Seconds until a start is allowed: 0.0 now, inf while only a finishing task can free a slot."""
+        if self.max_in_flight is not None and self.in_flight >= self.max_in_flight: return inf
+        if self.rate is None: return 0.0
+        self.tokens, self.stamp = min(self.burst, self.tokens + (now - self.stamp) * self.rate), now
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def _take(self) -> None:
+        if self.rate is not None: self.tokens -= 1
+        self.in_flight += 1
+
+
+class RateLimiter:
+    """
+    Set of token buckets that decides when a task may start, globally and per key (e.g. per host).
+    A task with key K needs a token from the global limit and from K's own limit at the same time.
+    POOL parks tasks that may not start yet instead of blocking a worker, so tasks of other keys keep running.
+    Args:
+        limit (RateLimit, optional): Limit shared by every task. Defaults to None.
+        per_key (RateLimit, optional): Template copied for every new key without an explicit limit. Defaults to None.
+        limits (dict, optional): Explicit limits for particular keys. Defaults to None.
+    """
+    def __init__(self, limit: Optional[RateLimit] = None, per_key: Optional[RateLimit] = None, limits: Optional[Dict[Any, RateLimit]] = None):
+        self.limit, self.per_key, self.limits = limit, per_key, dict(limits or {})
+        self._lock = threading.Lock()
+
+    def _buckets(self, key: Any) -> List[RateLimit]:
+        buckets = [] if self.limit is None else [self.limit]
+        if key is None: return buckets
+        bucket = self.limits.get(key)
+        if bucket is None and self.per_key is not None: bucket = self.limits[key] = self.per_key.copy()
+        if bucket is not None: buckets.append(bucket)
+        return buckets
+
+    def try_acquire(self, key: Any = None) -> float:
+        """Takes a start for `key` if every limit allows it now and returns 0.0; otherwise takes nothing and
+        returns the seconds until a token is due (inf while waiting for a running task to finish)."""
+        with self._lock:
+            buckets, now = self._buckets(key), monotonic()
+            wait = max([bucket._wait(now) for bucket in buckets], default=0.0)
+            if wait: return wait
+            for bucket in buckets: bucket._take()
+            return 0.0
+
+    def release(self, key: Any = None) -> None:
+        """Marks one task of `key` started with try_acquire() as finished."""
+        with self._lock:
+            for bucket in self._buckets(key): bucket.in_flight -= 1
+
+    def acquire(self, key: Any = None, timeout: Optional[float] = None) -> bool:
+        """Blocking try_acquire() for code outside POOL. Returns False if timeout passes first."""
+        deadline = None if timeout is None else monotonic() + timeout
+        while True:
+            wait = self.try_acquire(key)
+            if not wait: return True
+            if deadline is not None and monotonic() + min(wait, 0.05) > deadline: return False
+            sleep(min(wait, 0.05))  # inf: çalışan bir görevin bitmesini kısa aralıklarla bekle
+
+    def in_flight(self) -> Dict[Any, int]:
+        """Running tasks per key; the global limit is reported under None."""
+        with self._lock:
+            counts = {key: bucket.in_flight for key, bucket in self.limits.items()}
+            if self.limit is not None: counts[None] = self.limit.in_flight
+            return counts
 #==============================================================================
 
 #============================ CLASS POOL ======================================
+
 class POOL:
     """
     A thread pool for efficient parallel task execution.
+    With backend="process" every worker thread drives its own child process, so CPU-bound tasks use
+    all cores behind the same submit/map/join API (tasks and results must be picklable).
     Args:
-        max_threads (int, optional): Maximum number of threads in the pool. Defaults to 10.
+        max_threads (int, optional): Number of workers owned by the pool. Defaults to 10 for threads, os.cpu_count() for processes.
         logFuture (bool, optional): Whether to store task results in a list. Defaults to True.
         ResultwhenDone (bool, optional): Whether to print task results immediately after completion. Defaults to False.
+        max_queue (int, optional): Maximum number of pending tasks, 0 means unbounded. Defaults to max_threads * 100.
+        on_full (str, optional): Backpressure policy when the queue is full: "block", "drop" or "raise". Defaults to "block".
+        report_interval (float, optional): Seconds between periodic metric reports, None disables the reporter. Defaults to None.
+        reporter (callable, optional): Called with each metrics snapshot; prints a one-line summary when None. Defaults to None.
+        backend (str, optional): "thread" or "process". Defaults to "thread".
+        chunksize (int, optional): Process backend: maximum number of queued tasks sent to a child in one message. Defaults to 1.
+        max_tasks_per_child (int, optional): Process backend: restart a child after this many tasks, None never. Defaults to None.
+        shm_threshold (int, optional): Process backend: bytes/bytearray/array results of at least this size come back
+            through shared memory instead of the pipe, 0 disables. Defaults to 1 MiB.
+        mp_context (str, optional): Process backend: multiprocessing start method. Defaults to "spawn".
+        scheduler (str, optional): "fifo" uses one shared queue.Queue; "stealing" uses per-worker deques with
+            work stealing and enables submit(priority=..., affinity=...). With "stealing" max_queue counts
+            running tasks too. Defaults to "fifo".
+        min_threads (int, optional): Enables adaptive scaling between min_threads and max_threads workers
+            ("fifo" scheduler only). None keeps a fixed max_threads workers. Defaults to None.
+        keep_alive (float, optional): Adaptive mode: seconds an idle worker waits before retiring. Defaults to 30.0.
+        scale_up_wait_ms (float, optional): Adaptive mode: mean queue wait that triggers adding workers. Defaults to 20.0.
+        scale_interval (float, optional): Adaptive mode: seconds between scaling decisions. Defaults to 0.25.
+        task_timeout (float, optional): Default seconds a task may run before its future fails with TimeoutError.
+            A thread stuck in such a task is replaced by a fresh worker; a process child is terminated.
+            None disables. Defaults to None.
+        retry (RetryPolicy, optional): Default retry rule for failed tasks, None runs every task once. Defaults to None.
+        rate_limiter (RateLimiter, optional): Limits task starts per second and running tasks, globally and per
+            submit(rate_key=...). Tasks that may not start yet are parked without holding a worker. Defaults to None.
     """
-    def __init__(self, max_threads:int=10, logFuture:bool=True, ResultwhenDone:bool=False):
-        self.ResultwhenDone, self.logFuture =ResultwhenDone, logFuture
-        self.task_queue, self.lock = Queue(), threading.Lock()
-        self.futures , self.max_threads= [], max_threads
-        self.start_time,self.task_times = time(), []
+    ON_FULL_POLICIES = ("block", "drop", "raise")
+    BACKENDS = ("thread", "process")
+    SCHEDULERS = ("fifo", "stealing")
+    HIGH, NORMAL, LOW = 0, 1, 2  # submit(priority=...) seviyeleri
+    THROUGHPUT_WINDOWS = (1, 10, 60)
+    WATCHDOG_TICK = 0.05  # zaman aşımı kontrol aralığı (saniye)
 
+    def __init__(self, max_threads:Optional[int]=None, logFuture:bool=True, ResultwhenDone:bool=False, max_queue:Optional[int]=None, on_full:str="block",
+                 report_interval:Optional[float]=None, reporter:Optional[Callable[[Dict[str, Any]], Any]]=None,
+                 backend:str="thread", chunksize:int=1, max_tasks_per_child:Optional[int]=None, shm_threshold:int=1 << 20, mp_context:str="spawn",
+                 scheduler:str="fifo", min_threads:Optional[int]=None, keep_alive:float=30.0, scale_up_wait_ms:float=20.0, scale_interval:float=0.25,
+                 task_timeout:Optional[float]=None, retry:Optional[RetryPolicy]=None, rate_limiter:Optional[RateLimiter]=None):
+        if backend not in self.BACKENDS: raise ValueError(f"backend must be one of {self.BACKENDS}.")
+        if scheduler not in self.SCHEDULERS: raise ValueError(f"scheduler must be one of {self.SCHEDULERS}.")
+        if max_threads is None: max_threads = 10 if backend == "thread" else (os.cpu_count() or 1)
+        if max_threads < 1: raise ValueError("max_threads must be at least 1.")
+        if on_full not in self.ON_FULL_POLICIES: raise ValueError(f"on_full must be one of {self.ON_FULL_POLICIES}.")
+        if chunksize < 1: raise ValueError("chunksize must be at least 1.")
+        if max_tasks_per_child is not None and max_tasks_per_child < 1: raise ValueError("max_tasks_per_child must be at least 1.")
+        if task_timeout is not None and task_timeout <= 0: raise ValueError("task_timeout must be positive.")
+        if min_threads is not None:
+            if not 1 <= min_threads <= max_threads: raise ValueError("min_threads must be between 1 and max_threads.")
+            if scheduler != "fifo": raise ValueError("Adaptive scaling needs scheduler='fifo'.")
+            if keep_alive <= 0 or scale_interval <= 0: raise ValueError("keep_alive and scale_interval must be positive.")
+        if max_queue is None: max_queue = max_threads * 100
+        self.adaptive, self.min_threads, self.keep_alive = min_threads is not None, min_threads or max_threads, keep_alive
+        self.scale_up_wait_ms, self.scale_interval = scale_up_wait_ms, scale_interval
+        self.backend, self.chunksize, self.max_tasks_per_child, self.shm_threshold = backend, chunksize, max_tasks_per_child, shm_threshold
+        self._mp_context = multiprocessing.get_context(mp_context) if backend == "process" else None
+        self.ResultwhenDone, self.logFuture = ResultwhenDone, logFuture
+        self.scheduler, self.lock = scheduler, threading.Lock()
+        self.task_queue = WorkStealingQueue(max_threads, max_queue) if scheduler == "stealing" else Queue(maxsize=max_queue)
+        self.futures , self.max_threads, self.on_full = [], max_threads, on_full
+        self.start_time, self.start_ns = time(), perf_counter_ns()
+        self.errors, self.dropped, self._shutdown = [], 0, False
+        self.worker_stats, self.workers, self._worker_ids = [], [], count()
+        self._retired_stats = WorkerStats("retired")  # küçülmede çıkan worker'ların sayaçları
+        self.scaling_events, self.scale_ups, self.scale_downs = deque(maxlen=50), 0, 0
+        self.task_timeout, self.retry, self.retried, self.timed_out, self.cancelled = task_timeout, retry, 0, 0, 0
+        self._options = _TaskOptions(task_timeout, retry, self.NORMAL, None, None)
+        # Hız sınırı: başlayamayan görevler anahtar başına park edilir, izin verilenler kuyruğa geri döner
+        self.rate_limiter, self.throttled, self._rate_lock = rate_limiter, 0, threading.Lock()
+        self._parked, self._admitted, self._pump_due = {}, set(), None
+        # Çalışan görevler (thread -> (deadline_ns, [(item, attempt)], index, process)), takılan thread'ler ve geri beklemedeki görevler
+        self._current, self._abandoned, self._backoff = {}, {}, set()
+        self._backoff_done, self._timer, self._watching = threading.Condition(self.lock), _Timer("POOL-timer"), False
+        with self.lock:
+            for _ in range(self.min_threads): self._start_worker()
+        self._scaler_thread, self._scaler_stop = None, threading.Event()
+        if self.adaptive:
+            self._scaler_thread = threading.Thread(target=self._scale_loop, name="POOL-scaler", daemon=True)
+            self._scaler_thread.start()
+        self._reporter_thread, self._reporter_stop = None, threading.Event()
+        if report_interval: self.start_reporter(report_interval, reporter)
 
-    def _worker(self):
-        """Worker function executed by each thread in the pool."""
-        while True:
-            func, args, kwargs = self.task_queue.get()
-            task_start_time = time()
+    def __enter__(self) -> "POOL": return self
+
+    def __exit__(self, exc_type, exc, tb) -> None: self.shutdown(wait=True)
+
+
+    def _start_worker(self, index: Optional[int] = None) -> None:
+        """Starts one more worker, in slot `index` when it replaces one. The caller must hold self.lock."""
+        if index is None: index = next(self._worker_ids)
+        stats = WorkerStats(f"POOL-worker-{index}")
+        worker = threading.Thread(target=self._process_worker if self.backend == "process" else self._worker, args=(stats, index), name=stats.name, daemon=True)
+        self.worker_stats.append(stats)
+        self.workers.append(worker)
+        worker.start()
+
+    def _retire(self, stats: WorkerStats) -> bool:
+        """Removes an idle worker in adaptive mode. Returns False if the pool must keep it."""
+        with self.lock:
+            if self._shutdown or len(self.workers) <= self.min_threads: return False
+            index = self.worker_stats.index(stats)
+            del self.worker_stats[index], self.workers[index]
+            self._retired_stats.merge(stats)
+            self.scale_downs += 1
+            self._record_scaling("shrink", len(self.workers) + 1, len(self.workers), f"idle for {self.keep_alive:g}s")
+        return True
+
+    def _record_scaling(self, action: str, before: int, after: int, reason: str) -> None:
+        self.scaling_events.append({"uptime_s": round((perf_counter_ns() - self.start_ns) / 1e9, 3), "action": action, "from": before, "to": after, "reason": reason})
+
+    def _scale_loop(self) -> None:
+        """Adds workers while tasks wait in the queue and every worker is busy."""
+        last_wait_ns, last_tasks = self._wait_totals()
+        while not self._scaler_stop.wait(self.scale_interval):
+            wait_ns, tasks = self._wait_totals()
+            finished = tasks - last_tasks
+            recent_wait_ms = (wait_ns - last_wait_ns) / finished / 1e6 if finished else 0.0
+            last_wait_ns, last_tasks = wait_ns, tasks
+            queued = self.task_queue.qsize()
+            with self.lock:
+                live = len(self.workers)
+                if self._shutdown: return
+                if not queued or live >= self.max_threads or any(stats.idle for stats in self.worker_stats): continue
+                # Ya bekleme eşiği aşıldı ya da aralık boyunca hiçbir görev bitmedi (tüm worker'lar tıkalı)
+                if finished and recent_wait_ms < self.scale_up_wait_ms: continue
+                add = min(self.max_threads - live, max(1, min(queued, live)))
+                for _ in range(add): self._start_worker()
+                self.scale_ups += 1
+                self._record_scaling("grow", live, live + add, f"queued={queued} wait={recent_wait_ms:.1f}ms finished={finished}")
+
+    def _wait_totals(self) -> tuple[int, int]:
+        stats = self._all_stats()
+        return sum(s.wait_ns for s in stats), sum(s.tasks for s in stats)
+
+    def _all_stats(self) -> List[WorkerStats]:
+        """Live worker stats plus the merged stats of retired workers."""
+        with self.lock: return self.worker_stats + list(self._abandoned.values()) + [self._retired_stats]
+
+    def _queue_getters(self, index: int) -> tuple[Callable[[], Any], Callable[[], Any]]:
+        """Returns blocking and non-blocking get functions of the task queue for worker `index`.
+        In adaptive mode the blocking get raises queue.Empty after keep_alive idle seconds."""
+        if self.scheduler == "fifo":
+            if self.adaptive: return (lambda: self.task_queue.get(timeout=self.keep_alive)), self.task_queue.get_nowait
+            return self.task_queue.get, self.task_queue.get_nowait
+        self.task_queue.bind(index)
+        return (lambda: self.task_queue.get(index)), (lambda: self.task_queue.get_nowait(index))
+
+    def _worker(self, stats: WorkerStats, index: int):
+        """Worker function executed by each thread in the pool until a stop sentinel arrives,
+        or until the timed-out task it was replaced for finally returns."""
+        get, _ = self._queue_getters(index)
+        me, current, limited = threading.current_thread(), self._current, self.rate_limiter is not None
+        _task_local.pool = self
+        while me not in self._abandoned:
+            stats.idle = True
+            try: item = get()
+            except Empty:
+                if self._retire(stats): return
+                continue
+            stats.idle = False
+            if limited and item is not _STOP and not self._admit(item): continue  # park edildi
             try:
-                result = func(*args, **kwargs)
-                self.task_times.append( time() - task_start_time)
-                if self.logFuture: self.futures.append(result)
-                if self.ResultwhenDone: print(result)
-            finally:self.task_queue.task_done()
+                if item is _STOP: return
+                func, args, kwargs, future, enqueued_ns = item
+                attempt = future._set_running()
+                if not attempt: continue  # iptal edilmiş görev
+                timeout = future._options.timeout
+                deadline = perf_counter_ns() + int(timeout * 1e9) if timeout else 0
+                current[me] = (deadline, ((item, attempt),), index, None)
+                start_ns, cpu_start_ns = perf_counter_ns(), thread_time_ns()
+                try: result, error = func(*args, **kwargs), None
+                except Exception as e: result, error = None, e
+                end_ns = perf_counter_ns()
+                if not deadline: del current[me]
+                else:
+                    with self.lock: current.pop(me, None)  # watchdog ile aynı anda karar vermesin
+                self._complete(stats, item, attempt, result, error, start_ns - enqueued_ns, end_ns - start_ns, thread_time_ns() - cpu_start_ns, end_ns)
+            finally:
+                if limited and item is not _STOP: self._release(item)
+                if me not in self._abandoned: self.task_queue.task_done()  # takılan görevi watchdog kapatır
+        with self.lock: self._retired_stats.merge(self._abandoned.pop(me))
+
+    def _complete(self, stats: WorkerStats, item: tuple, attempt: int, result: Any, error: Optional[BaseException], wait_ns: int, wall_ns: int, cpu_ns: int, end_ns: int) -> None:
+        """Records the task metrics and publishes its outcome, or schedules a retry."""
+        stats.record(wait_ns, wall_ns, cpu_ns, error is not None, end_ns)
+        if error is not None:
+            self._fail(item, attempt, error)
+            return
+        if not item[3]._set_result(result, attempt): return  # zaman aşımıyla zaten sonuçlanmış deneme
+        if self.logFuture: self.futures.append(result)
+        if self.ResultwhenDone: print(result)
+
+    def _fail(self, item: tuple, attempt: int, error: BaseException) -> bool:
+        """Retries a failed attempt if its policy allows it, otherwise publishes the error.
+        Returns False if the attempt was already settled (by a timeout or by the worker)."""
+        future = item[3]
+        if isinstance(error, CancelledError):
+            if not future._set_cancelled(attempt): return False
+            with self.lock: self.cancelled += 1
+            return True
+        policy = future._options.retry
+        if policy is not None and not future._cancel_requested and policy.should_retry(attempt, error):
+            with self.lock:
+                if not self._shutdown and future._retry_later(attempt):
+                    self.retried += 1
+                    self._backoff.add(future)
+                    self._timer.schedule(policy.delay(attempt), lambda: self._requeue(item, error))
+                    return True
+        if not future._set_exception(error, attempt): return False
+        with self.lock: self.errors.append(error)
+        return True
+
+    def _requeue(self, item: tuple, error: BaseException) -> None:
+        """Timer callback: puts a task back on the queue once its backoff delay has passed."""
+        func, args, kwargs, future, _ = item
+        with self.lock:
+            if not self._shutdown:
+                try: self._put((func, args, kwargs, future, perf_counter_ns()), block=False)
+                except Full:
+                    self._timer.schedule(self.WATCHDOG_TICK, lambda: self._requeue(item, error))
+                    return
+            elif future._abort(error): self.errors.append(error)
+            self._backoff.discard(future)
+            self._backoff_done.notify_all()
+
+    def _admit(self, item: tuple) -> bool:
+        """Asks the rate limiter whether a dequeued task may start now. If not, the task is parked behind the
+        other waiting tasks of its key (it stays unfinished for join()) and the worker moves on."""
+        future = item[3]
+        key = future._options.rate_key
+        with self._rate_lock:
+            if future in self._admitted:  # limiter'dan geçip kuyruğa geri dönmüş görev
+                self._admitted.discard(future)
+                return True
+            parked, wait = self._parked.get(key), None
+            if parked is not None: parked.append(item)  # sırayı korumak için anahtarın bekleyenlerinin arkasına
+            else:
+                wait = self.rate_limiter.try_acquire(key)
+                if not wait: return True
+                self._parked[key] = deque([item])
+            self.throttled += 1
+        if wait: self._schedule_pump(wait)
+        return False
+
+    def _release(self, item: tuple) -> None:
+        self.rate_limiter.release(item[3]._options.rate_key)
+        if self._parked: self._pump()
+
+    def _schedule_pump(self, wait: float) -> None:
+        if wait == inf: return  # çalışan bir görev bitince _release() tetikler
+        due = monotonic() + wait
+        with self._rate_lock:
+            if self._pump_due is not None and self._pump_due <= due: return
+            self._pump_due = due
+        self._timer.schedule(wait, self._pump)
 
+    def _pump(self) -> None:
+        """Lets parked tasks through as the limiter allows, one key at a time in turn, and re-queues them."""
+        ready, next_wait = [], inf
+        with self._rate_lock:
+            self._pump_due, progress = None, True
+            while progress:
+                progress = False
+                for key, parked in self._parked.items():
+                    if not parked: continue
+                    wait = self.rate_limiter.try_acquire(key)
+                    if wait: next_wait = min(next_wait, wait)
+                    else:
+                        ready.append(parked.popleft())
+                        self._admitted.add(ready[-1][3])
+                        progress = True
+            for key in [key for key, parked in self._parked.items() if not parked]: del self._parked[key]
+        for item in ready: self._resume(item)
+        if next_wait < inf: self._schedule_pump(next_wait)
 
-    def submit(self, func, *args, **kwargs) -> None:
+    def _resume(self, item: tuple) -> None:
+        """Puts a task the limiter let through back on the queue; a worker starts it without asking again."""
+        try: self._put(item, block=False)
+        except Full:
+            self._timer.schedule(self.WATCHDOG_TICK, lambda: self._resume(item))
+            return
+        self.task_queue.task_done()  # park edilen ilk alımın kaydı kapanır
+
+    def _start_watch(self) -> None:
+        with self.lock:
+            if self._watching: return
+            self._watching = True
+        self._timer.schedule(self.WATCHDOG_TICK, self._watch)
+
+    def _watch(self) -> None:
+        """Timer callback: fails the tasks that ran past their deadline and frees the worker they hold."""
+        now = perf_counter_ns()
+        for thread, entry in self._current.copy().items():
+            deadline, batch, index, process = entry
+            if not deadline or now < deadline: continue
+            with self.lock:
+                if self._current.get(thread) is not entry: continue
+                del self._current[thread]
+                if process is None: self._abandon(thread, index)
+            for item, attempt in batch:
+                if self._fail(item, attempt, TimeoutError(f"Task exceeded its {item[3]._options.timeout:g}s timeout.")):
+                    with self.lock: self.timed_out += 1
+            if process is not None: process.terminate()  # dispatcher yeni bir child başlatır
+            else: self.task_queue.task_done()  # join() takılan thread'i beklemesin
+        with self.lock:
+            if self._shutdown and not any(worker.is_alive() for worker in self.workers):
+                self._watching = False
+                return
+        self._timer.schedule(self.WATCHDOG_TICK, self._watch)
+
+    def _abandon(self, thread: threading.Thread, index: int) -> None:
+        """Replaces a worker stuck in a timed-out task. The caller must hold self.lock.
+        Threads cannot be killed, so the old one exits as soon as its call returns."""
+        if thread not in self.workers: return
+        position = self.workers.index(thread)
+        self._abandoned[thread] = self.worker_stats[position]
+        del self.workers[position], self.worker_stats[position]
+        self._start_worker(index)
+
+    def _process_worker(self, stats: WorkerStats, index: int):
+        """Dispatcher thread that feeds one child process in chunks and recycles it after max_tasks_per_child tasks."""
+        process, conn, served = None, None, 0
+        getters, me = self._queue_getters(index), threading.current_thread()
+        try:
+            while True:
+                stats.idle = True
+                try: items, stop = self._take_chunk(*getters)
+                except Empty:
+                    if self._retire(stats): return
+                    continue
+                stats.idle = False
+                if self.rate_limiter is not None: items = [item for item in items if self._admit(item)]
+                try:
+                    batch = [(item, attempt) for item in items for attempt in (item[3]._set_running(),) if attempt]
+                    if batch:
+                        if process is None: (process, conn), served = self._start_child(), 0
+                        # Child chunk'ı tek seferde yanıtlar, süre sınırı chunk'taki sürelerin toplamıdır
+                        timeouts = [item[3]._options.timeout for item, _ in batch]
+                        deadline = perf_counter_ns() + int(sum(timeouts) * 1e9) if all(timeouts) else 0
+                        self._current[me] = (deadline, batch, index, process)
+                        healthy = self._run_chunk(conn, batch, stats)
+                        if not deadline: del self._current[me]
+                        else:
+                            with self.lock: self._current.pop(me, None)
+                        served += len(batch)
+                        if not healthy or (self.max_tasks_per_child and served >= self.max_tasks_per_child):
+                            self._stop_child(process, conn)
+                            process = conn = None
+                finally:
+                    for item in items:
+                        if self.rate_limiter is not None: self._release(item)
+                        self.task_queue.task_done()
+                if stop: return
+        finally:
+            if process is not None: self._stop_child(process, conn)
+
+    def _take_chunk(self, get: Callable[[], Any], get_nowait: Callable[[], Any]) -> tuple[list, bool]:
+        """Blocks for one queued item, then grabs up to chunksize - 1 more without waiting."""
+        items, stop = [], False
+        item = get()
+        while True:
+            if item is _STOP:
+                self.task_queue.task_done()
+                stop = True
+                break
+            items.append(item)
+            if len(items) >= self.chunksize: break
+            try: item = get_nowait()
+            except Empty: break
+        return items, stop
+
+    def _start_child(self):
+        parent_conn, child_conn = self._mp_context.Pipe()
+        process = self._mp_context.Process(target=_process_main, args=(child_conn, self.shm_threshold), daemon=True)
+        process.start()
+        child_conn.close()
+        return process, parent_conn
+
+    @staticmethod
+    def _stop_child(process, conn) -> None:
+        try: conn.send(None)
+        except (OSError, ValueError): pass
+        conn.close()
+        process.join(5)
+        if process.is_alive(): process.terminate()
+
+    def _run_chunk(self, conn, batch: list, stats: WorkerStats) -> bool:
+        """Sends a chunk to the child and completes its futures. Returns False if the child has to be replaced."""
+        dispatch_ns = perf_counter_ns()
+        try: conn.send([(func, args, kwargs) for (func, args, kwargs, _, _), _ in batch])
+        except (OSError, EOFError) as e: return self._fail_chunk(batch, stats, RuntimeError(f"Worker process is not reachable: {e!r}"))
+        except Exception as e:
+            # Pickle hatası: hiçbir şey gönderilmedi, hatalı görevi ayırmak için teker teker dene
+            if len(batch) > 1: return all([self._run_chunk(conn, [task], stats) for task in batch])
+            return self._fail_chunk(batch, stats, e, healthy=True)
+        try: replies = conn.recv()
+        except (OSError, EOFError): return self._fail_chunk(batch, stats, RuntimeError("Worker process died while running the task."))
+        except Exception as e: return self._fail_chunk(batch, stats, e, healthy=True)  # yanıt okundu ama çözülemedi
+        end_ns = perf_counter_ns()
+        for (item, attempt), (ok, value, wall_ns, cpu_ns) in zip(batch, replies):
+            if ok and isinstance(value, _SharedResult):
+                try: value = _from_shared(value)
+                except Exception as e: ok, value = False, e
+            self._complete(stats, item, attempt, value if ok else None, None if ok else value, dispatch_ns - item[4], wall_ns, cpu_ns, end_ns)
+        return True
+
+    def _fail_chunk(self, batch: list, stats: WorkerStats, error: BaseException, healthy: bool = False) -> bool:
+        end_ns = perf_counter_ns()
+        for item, attempt in batch: self._complete(stats, item, attempt, None, error, end_ns - item[4], 0, 0, end_ns)
+        return healthy
+
+
+    def submit(self, func, *args, priority: int = NORMAL, affinity: Any = None, task_timeout: Optional[float] = None,
+               retry: Optional[RetryPolicy] = None, rate_key: Any = None, **kwargs) -> Future:
         """Submits a new task for execution.
         Args:
             func: The function to be executed.
             *args: Positional arguments for the function.
-            **kwargs: Keyword arguments for the function.
+            priority (int, optional): POOL.HIGH, POOL.NORMAL or POOL.LOW, needs scheduler="stealing". Defaults to POOL.NORMAL.
+            affinity (hashable, optional): Tasks with the same key always run on the same worker, needs scheduler="stealing". Defaults to None.
+            task_timeout (float, optional): Seconds this task may run, overrides the pool's task_timeout. Defaults to None.
+            retry (RetryPolicy, optional): Retry rule of this task, overrides the pool's retry. Defaults to None.
+            rate_key (hashable, optional): Key of the rate_limiter bucket the task counts against (e.g. the host). Defaults to None.
+            **kwargs: Keyword arguments for the function. The names in SUBMIT_OPTIONS are reserved by submit() and never
+                reach func; use submit_with() or functools.partial(func, retry=...) to pass them to func.
+
+        Returns:
+            Future: Handle for the task result. A task dropped by the "drop" policy returns an already cancelled future.
+
+        Raises:
+            RuntimeError: If the pool has been shut down.
+            TypeError: If a submit() option is given and func has a parameter of the same name, so the value would
+                silently be taken by submit() instead of reaching func.
+            ValueError: If priority or affinity is used with the "fifo" scheduler, rate_key without a rate_limiter,
+                or task_timeout is not positive.
+            queue.Full: If the queue is full and the policy is "raise".
+        """
+        if priority != self.NORMAL or affinity is not None or task_timeout is not None or retry is not None or rate_key is not None:
+            given = {"priority": priority != self.NORMAL, "affinity": affinity is not None, "task_timeout": task_timeout is not None,
+                     "retry": retry is not None, "rate_key": rate_key is not None}
+            try: params = _option_params(func)
+            except TypeError: params = _option_params.__wrapped__(func)  # hash'lenemeyen çağrılabilir nesne
+            clash = sorted(name for name in params if given[name])
+            if clash: raise TypeError(f"{', '.join(clash)} {'is a submit() option' if len(clash) == 1 else 'are submit() options'} and would not be passed to "
+                                      f"{getattr(func, '__qualname__', func)!r}; use submit_with() or functools.partial(func, {clash[0]}=...) to pass it to the function.")
+        return self._submit(func, args, kwargs, priority, affinity, task_timeout, retry, rate_key)
+
+    def submit_with(self, options: Dict[str, Any], func, *args, **kwargs) -> Future:
+        """Submits a new task with its per-task options in a separate dict, so every keyword argument reaches func.
+
+        Use it when func itself takes a parameter named like a submit() option (priority, retry, ...).
+
+        Args:
+            options (dict): Per-task options, any of SUBMIT_OPTIONS (e.g. {"retry": RetryPolicy(3), "rate_key": host}).
+            func: The function to be executed.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function, passed unchanged.
+
+        Returns:
+            Future: Handle for the task result, as in submit().
+
+        Raises:
+            TypeError: If options has a key that is not in SUBMIT_OPTIONS.
+            RuntimeError, ValueError, queue.Full: As in submit().
         """
+        unknown = sorted(set(options) - set(SUBMIT_OPTIONS))
+        if unknown: raise TypeError(f"Unknown submit option(s): {', '.join(unknown)}; expected any of {', '.join(SUBMIT_OPTIONS)}.")
+        return self._submit(func, args, kwargs, **options)
+
+    def _submit(self, func, args: tuple, kwargs: dict, priority: int = NORMAL, affinity: Any = None, task_timeout: Optional[float] = None,
+                retry: Optional[RetryPolicy] = None, rate_key: Any = None) -> Future:
+        if self._shutdown: raise RuntimeError("Cannot submit tasks after shutdown.")
+        if self.scheduler == "fifo" and (priority != self.NORMAL or affinity is not None): raise ValueError("priority and affinity need scheduler='stealing'.")
+        if task_timeout is not None and task_timeout <= 0: raise ValueError("task_timeout must be positive.")
+        if rate_key is not None and self.rate_limiter is None: raise ValueError("rate_key needs a rate_limiter.")
         if not self.start_time:self.start_time = time()
-        self.task_queue.put((func, args, kwargs))
-        with self.lock:
-            if self.task_queue.qsize() > 0 and threading.active_count() < self.max_threads:
-                threading.Thread(target=self._worker).start()
+        future = Future()
+        if priority != self.NORMAL or affinity is not None or task_timeout is not None or retry is not None or rate_key is not None:
+            future._options = _TaskOptions(self.task_timeout if task_timeout is None else task_timeout, self.retry if retry is None else retry, priority, affinity, rate_key)
+        else: future._options = self._options
+        if future._options.timeout and not self._watching: self._start_watch()
+        item = (func, args, kwargs, future, perf_counter_ns())
+        if self.on_full == "block":
+            self._put(item)
+            return future
+        try: self._put(item, False)
+        except Full:
+            if self.on_full == "raise": raise
+            with self.lock: self.dropped += 1
+            future.cancel()
+        return future
+
+    def _put(self, item: tuple, block: bool = True) -> None:
+        if self.scheduler == "fifo": self.task_queue.put(item, block)
+        else: self.task_queue.put(item, block, item[3]._options.priority, item[3]._options.affinity)
+
+    def submit_many(self, func, iterable: Iterable, chunksize: int = 64) -> List[Future]:
+        """Submits func(item) for every item, packing `chunksize` items into a single pool task.
+
+        For tasks that take microseconds this removes most of the per-task submit and queue overhead.
+        Metrics count every chunk as one task.
+
+        Args:
+            func: The function to be executed, called with one item.
+            iterable: Items to process.
+            chunksize (int, optional): Number of items per pool task. Defaults to 64.
+
+        Returns:
+            list: One Future per chunk, in input order. Each resolves to the list of results of its chunk,
+                or to the first exception raised inside that chunk.
+        """
+        if chunksize < 1: raise ValueError("chunksize must be at least 1.")
+        return [self.submit(_run_batch, func, chunk, False) for chunk in _chunks(iterable, chunksize)]
+
+    def map(self, func, *iterables: Iterable, timeout: Optional[float] = None, window: Optional[int] = None, chunksize: int = 1) -> Iterator[Any]:
+        """Applies func to every item of the iterables and yields the results in input order.
+
+        Only `window` tasks are in flight at a time, so huge or endless iterables are consumed lazily.
+
+        Args:
+            func: The function to be executed.
+            *iterables: Argument iterables, zipped like the built-in map().
+            timeout (float, optional): Total seconds allowed for the whole iteration. Defaults to None.
+            window (int, optional): Maximum number of submitted but not yet yielded tasks (chunks). Defaults to max_threads * 2.
+            chunksize (int, optional): Number of items run inside one pool task, see submit_many(). Defaults to 1.
+
+        Raises:
+            TimeoutError: If the results are not ready before the timeout.
+        """
+        if chunksize < 1: raise ValueError("chunksize must be at least 1.")
+        deadline = None if timeout is None else time() + timeout
+        if chunksize == 1: args_iter, submit = zip(*iterables), (lambda args: self.submit(func, *args))
+        else: args_iter, submit = _chunks(zip(*iterables), chunksize), (lambda chunk: self.submit(_run_batch, func, chunk, True))
+        pending = deque()
+        for args in islice(args_iter, window or self.max_threads * 2): pending.append(submit(args))
+        while pending:
+            future = pending.popleft()
+            result = future.result(None if deadline is None else max(0.0, deadline - time()))
+            if chunksize == 1: yield result
+            else: yield from result
+            for args in islice(args_iter, 1): pending.append(submit(args))
+
+    def as_completed(self, futures: Iterable[Future], timeout: Optional[float] = None) -> Iterator[Future]:
+        """Yields the given futures as soon as each one finishes.
+
+        Args:
+            futures: Futures returned by submit().
+            timeout (float, optional): Total seconds to wait for all futures. Defaults to None.
+
+        Raises:
+            TimeoutError: If some futures are still unfinished after the timeout.
+        """
+        deadline = None if timeout is None else time() + timeout
+        done_queue, futures = Queue(), set(futures)
+        for future in futures: future.add_done_callback(done_queue.put)
+        for _ in range(len(futures)):
+            try: yield done_queue.get(timeout=None if deadline is None else max(0.0, deadline - time()))
+            except Empty: raise TimeoutError("Some tasks did not finish in time.") from None
 
     def join(self, verbose: bool = True) -> tuple[list, float, float]:
         """Waits for all tasks to complete and returns results.
 
+        Tasks waiting for a retry are waited for as well.
+
         Returns:
             tuple: A tuple containing the list of task results, elapsed time, and total time.
         """
-        self.task_queue.join()
+        while True:
+            self.task_queue.join()
+            with self.lock:
+                if not self._backoff: break
+                self._backoff_done.wait()
         elapsed_time = time() - self.start_time
-        total_time = sum( [q for q in self.task_times ])
-        if verbose: print(f"Toplam geçen süre: {elapsed_time:.2f} saniye\n kurtarılan :{total_time-elapsed_time:.2f}")
+        total_time = sum(stats.busy_ns for stats in self._all_stats()) / 1e9
+        if verbose:
+            print(f"Toplam geçen süre: {elapsed_time:.2f} saniye\n kurtarılan :{total_time-elapsed_time:.2f}")
+            if self.errors or self.retried or self.cancelled: print(f" hata: {len(self.errors)} yeniden deneme: {self.retried} zaman aşımı: {self.timed_out} iptal: {self.cancelled}")
         return self.futures,elapsed_time,total_time
+
+    def cancel_all(self, running: bool = True) -> int:
+        """Cancels every task that has not started yet, retries waiting for their backoff and tasks parked
+        by the rate limiter included.
+
+        Args:
+            running (bool, optional): Also ask the running tasks to stop. They are not interrupted: they see the
+                request through cancel_requested() and end by returning or raising CancelledError. Defaults to True.
+
+        Returns:
+            int: Number of tasks cancelled before they started.
+        """
+        cancelled, drained = 0, self._drain()
+        for item in drained:
+            if not item[3].done() and item[3].cancel(): cancelled += 1
+            self.task_queue.task_done()
+        with self._rate_lock:
+            # limiter'dan geçip kuyruğa geri dönmüş ama başlamamış görevler token ve çalışma yeri tutar: geri verilir
+            admitted = [item for item in drained if item[3] in self._admitted]
+            for item in admitted:
+                self._admitted.discard(item[3])
+                self.rate_limiter.release(item[3]._options.rate_key)
+            parked = [item for items in self._parked.values() for item in items]
+            self._parked.clear()
+        if admitted and self._parked: self._pump()  # bu arada park edilen görevler boşalan yere geçer
+        for item in parked:
+            if not item[3].done() and item[3].cancel(): cancelled += 1
+            self.task_queue.task_done()
+        with self.lock: waiting = list(self._backoff)
+        cancelled += sum(1 for future in waiting if not future.done() and future.cancel())
+        if running:
+            for _, batch, _, _ in self._current.copy().values():
+                for item, _ in batch: item[3].cancel()
+        with self.lock: self.cancelled += cancelled
+        return cancelled
+
+    def _drain(self) -> List[tuple]:
+        """Takes every queued task out of the queue, leaving stop sentinels in place."""
+        if self.scheduler == "stealing": return self.task_queue.drain()
+        items, stops = [], 0
+        while True:
+            try: item = self.task_queue.get_nowait()
+            except Empty: break
+            if item is _STOP:
+                stops += 1
+                self.task_queue.task_done()
+            else: items.append(item)
+        for _ in range(stops): self.task_queue.put(_STOP)
+        return items
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        """Stops the workers after the already queued tasks are finished.
+        Tasks still waiting for a retry are not queued again; they fail with their last error.
+
+        Args:
+            wait (bool, optional): Block until every worker thread has exited. Defaults to True.
+            cancel_pending (bool, optional): Cancel the queued tasks instead of running them, see cancel_all(). Defaults to False.
+        """
+        if cancel_pending: self.cancel_all()
+        self._scaler_stop.set()
+        if self._scaler_thread is not None and self._scaler_thread is not threading.current_thread(): self._scaler_thread.join()
+        with self.lock:
+            if self._shutdown: stopped = True
+            else: stopped, self._shutdown = False, True
+        if not stopped:
+            self.stop_reporter()
+            self._timer.flush()
+            # Sentinel'ler kuyruğun sonuna eklenir, bekleyen görevler önce bitirilir
+            if wait: self._send_stops()
+            else: threading.Thread(target=self._send_stops, daemon=True).start()
+        if wait:
+            # self.workers her turda yeniden okunur: watchdog'un zaman aşımında bıraktığı (_abandon) thread listeden
+            # çıkar ve beklenmez, yerine başlatılan worker ise beklenir
+            me = threading.current_thread()
+            while True:
+                with self.lock: pending = [worker for worker in self.workers if worker is not me and worker.is_alive()]
+                if not pending: break
+                pending[0].join(self.WATCHDOG_TICK)
+
+    def _send_stops(self) -> None:
+        # Park edilen görevler kuyruğa sonradan döner; sentinel'ler onların önüne geçmesin
+        if self.rate_limiter is not None: self.task_queue.join()
+        if self.scheduler == "stealing": return self.task_queue.close()
+        for _ in list(self.workers): self.task_queue.put(_STOP)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns a snapshot of the pool metrics.
+
+        Returns:
+            dict: Task counts ("failed" counts failed attempts, "errors" the tasks that finally failed), throughput (tasks/s) over sliding windows, latency and queue wait
+                percentiles in milliseconds, CPU/wall time, per-worker utilisation and scaling decisions.
+        """
+        now_ns = perf_counter_ns()
+        # completed_in'in kapsadığı süre: window tam saniye + içinde bulunulan saniyenin geçen kısmı, en fazla uptime
+        uptime, partial = (now_ns - self.start_ns) / 1e9, now_ns % 1_000_000_000 / 1e9
+        span = lambda window: max(1e-9, min(window + partial, uptime))
+        with self.lock: live, all_stats = list(self.worker_stats), self.worker_stats + list(self._abandoned.values()) + [self._retired_stats]
+        latency, queue_wait = LatencyHistogram(), LatencyHistogram()
+        for stats in all_stats: latency.merge(stats.latency), queue_wait.merge(stats.queue_wait)
+        per_worker = [{"name": stats.name, "tasks": stats.tasks, "failed": stats.failed, "busy_s": round(stats.busy_ns / 1e9, 3),
+                       "cpu_s": round(stats.cpu_ns / 1e9, 3), "utilisation": round(stats.utilisation(now_ns), 4)} for stats in live]
+        return {
+            "uptime_s": round((now_ns - self.start_ns) / 1e9, 3),
+            "workers": len(live),
+            "queued": self.task_queue.qsize(),
+            "completed": sum(stats.tasks for stats in all_stats),
+            "failed": sum(stats.failed for stats in all_stats),
+            "dropped": self.dropped,
+            "retried": self.retried,
+            "timed_out": self.timed_out,
+            "cancelled": self.cancelled,
+            "errors": len(self.errors),
+            "rate_limit": {"parked": sum(len(items) for items in list(self._parked.values())), "throttled": self.throttled,
+                           "in_flight": self.rate_limiter.in_flight() if self.rate_limiter is not None else {}},
+            "throughput": {f"{w}s": round(sum(stats.completed_in(w, now_ns) for stats in all_stats) / span(w), 2) for w in self.THROUGHPUT_WINDOWS},
+            "latency_ms": latency.summary_ms(),
+            "queue_wait_ms": queue_wait.summary_ms(),
+            "wall_time_s": round(sum(stats.busy_ns for stats in all_stats) / 1e9, 3),
+            "cpu_time_s": round(sum(stats.cpu_ns for stats in all_stats) / 1e9, 3),
+            "utilisation": round(sum(w["utilisation"] for w in per_worker) / max(1, len(per_worker)), 4),
+            "per_worker": per_worker,
+            "scaling": {"adaptive": self.adaptive, "min": self.min_threads, "max": self.max_threads, "scale_ups": self.scale_ups,
+                        "scale_downs": self.scale_downs, "events": list(self.scaling_events)[-10:]},
+        }
+
+    def start_reporter(self, interval: float = 10.0, reporter: Optional[Callable[[Dict[str, Any]], Any]] = None) -> None:
+        """Starts a daemon thread that passes a metrics snapshot to reporter every interval seconds.
+
+        Args:
+            interval (float, optional): Seconds between reports. Defaults to 10.0.
+            reporter (callable, optional): Receives the snapshot dict; prints a one-line summary when None. Defaults to None.
+        """
+        if interval <= 0: raise ValueError("interval must be positive.")
+        self.stop_reporter()
+        self._reporter_stop = threading.Event()
+        self._reporter_thread = threading.Thread(target=self._report_loop, args=(interval, reporter or self._print_metrics, self._reporter_stop), name="POOL-reporter", daemon=True)
+        self._reporter_thread.start()
+
+    def stop_reporter(self) -> None:
+        """Stops the periodic reporter if it is running."""
+        self._reporter_stop.set()
+        if self._reporter_thread is not None and self._reporter_thread is not threading.current_thread(): self._reporter_thread.join()
+        self._reporter_thread = None
+
+    def _report_loop(self, interval: float, reporter: Callable[[Dict[str, Any]], Any], stop: threading.Event) -> None:
+        while not stop.wait(interval):
+            try: reporter(self.metrics())
+            except Exception as e: print(f"POOL reporter hatası: {e!r}")
+
+    @staticmethod
+    def _print_metrics(m: Dict[str, Any]) -> None:
+        lat, wait = m["latency_ms"], m["queue_wait_ms"]
+        print(f"[POOL] worker={m['workers']} tamamlanan={m['completed']} hata={m['errors']} tekrar={m['retried']} kuyruk={m['queued']} hız(10s)={m['throughput']['10s']}/s "
+              f"p50/p95/p99={lat['p50']}/{lat['p95']}/{lat['p99']} ms bekleme p95={wait['p95']} ms kullanım=%{m['utilisation'] * 100:.1f}")
+#===============================================================================
+
+
+#============================ CLASS ASYNCPOOL ==================================
+class AsyncPOOL:
+    """
+    Asyncio front end for POOL. Coroutine functions run on the event loop, plain callables are
+    offloaded to the pool workers, and both share one concurrency semaphore.
+    Args:
+        max_concurrency (int, optional): Maximum number of tasks running at the same time. Defaults to 100.
+        pool (POOL, optional): Pool that runs the blocking callables. When None an owned POOL is created
+            (unbounded queue, since the semaphore already bounds it) and shut down with this object.
+        **pool_kwargs: Arguments for the owned POOL.
+    """
+    def __init__(self, max_concurrency: int = 100, pool: Optional[POOL] = None, **pool_kwargs):
+        if max_concurrency < 1: raise ValueError("max_concurrency must be at least 1.")
+        self.max_concurrency, self._owns_pool = max_concurrency, pool is None
+        self.pool = pool if pool is not None else POOL(**{"logFuture": False, "max_queue": 0, **pool_kwargs})
+        self._semaphore: Optional[asyncio.Semaphore] = None  # çalışan event loop içinde oluşturulur
+        self._pending: set = set()
+
+    async def __aenter__(self) -> "AsyncPOOL": return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None: await self.shutdown()
+
+    def submit(self, func, *args, **kwargs) -> "asyncio.Task":
+        """Schedules func on the running event loop and returns an awaitable task.
+
+        Args:
+            func: A coroutine function, a coroutine object or a blocking callable (run on the pool workers).
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+        """
+        if self._semaphore is None: self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        task = asyncio.ensure_future(self._run(func, args, kwargs))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+        return task
+
+    async def _run(self, func, args: tuple, kwargs: dict) -> Any:
+        async with self._semaphore:
+            if asyncio.iscoroutine(func): return await func
+            if asyncio.iscoroutinefunction(func): return await func(*args, **kwargs)
+            future = self.pool.submit(func, *args, **kwargs)
+            try: return await self._wrap(future)
+            except asyncio.CancelledError:
+                future.cancel()  # başlamadıysa iptal, çalışıyorsa cancel_requested() ile durma isteği
+                raise
+
+    @staticmethod
+    def _wrap(future: Future) -> "asyncio.Future":
+        """Bridges a POOL Future into an asyncio future of the running loop."""
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        def transfer(f: Future) -> None:
+            if waiter.done(): return
+            if f.cancelled(): waiter.cancel()
+            elif f.exception() is not None: waiter.set_exception(f.exception())
+            else: waiter.set_result(f.result())
+        future.add_done_callback(lambda f: loop.call_soon_threadsafe(transfer, f))
+        return waiter
+
+    async def as_completed(self, tasks: Optional[Iterable[Awaitable]] = None, return_exceptions: bool = False) -> AsyncIterator[Any]:
+        """Yields task results as soon as each task finishes.
+
+        Args:
+            tasks (iterable, optional): Tasks returned by submit(); all tasks pending at call time when None.
+            return_exceptions (bool, optional): Yield exceptions instead of raising them. Defaults to False.
+        """
+        tasks = set(self._pending) if tasks is None else {asyncio.ensure_future(t) for t in tasks}
+        done_queue: asyncio.Queue = asyncio.Queue()
+        for task in tasks: task.add_done_callback(done_queue.put_nowait)
+        for _ in range(len(tasks)):
+            task = await done_queue.get()
+            error = asyncio.CancelledError() if task.cancelled() else task.exception()
+            if error is None: yield task.result()
+            elif return_exceptions: yield error
+            else: raise error
+
+    async def map(self, func, iterable: Iterable, window: Optional[int] = None) -> AsyncIterator[Any]:
+        """Applies func to every item and yields the results in input order, keeping at most `window` tasks in flight.
+
+        Args:
+            func: A coroutine function or a blocking callable.
+            iterable: Input items, consumed lazily.
+            window (int, optional): Maximum number of submitted but not yet yielded tasks. Defaults to max_concurrency.
+        """
+        items, pending = iter(iterable), deque()
+        for item in islice(items, window or self.max_concurrency): pending.append(self.submit(func, item))
+        while pending:
+            yield await pending.popleft()
+            for item in islice(items, 1): pending.append(self.submit(func, item))
+
+    async def join(self) -> List[Any]:
+        """Waits for every pending task and returns their results, exceptions included."""
+        return list(await asyncio.gather(*list(self._pending), return_exceptions=True))
+
+    async def shutdown(self, cancel_pending: bool = False) -> None:
+        """Waits for (or cancels) the pending tasks and shuts down the owned pool without blocking the loop."""
+        if cancel_pending:
+            for task in list(self._pending): task.cancel()
+        if self._pending: await asyncio.gather(*list(self._pending), return_exceptions=True)
+        if self._owns_pool: await asyncio.get_running_loop().run_in_executor(None, self.pool.shutdown)
 #===============================================================================
 
 
@@ -203,11 +1712,17 @@ if __name__ == "__main__":
     print("Sonuçlar:", sonuc_listesi)
     print(f"Toplam geçen süre: {gecen_sure:.2f} sn, Toplam iş süresi: {toplam_is_suresi:.2f} sn")
 
+    # Sonuçları girdi sırasıyla akıtmak için map()
+    for sonuc in pool.map(kare_al, range(5)): print(sonuc)
+    pool.shutdown()
+
 
 # Kısa açıklama:
 # - POOL nesnesi oluşturulur.
 # - submit ile görevler eklenir.
 # - join ile tüm görevlerin bitmesi beklenir ve sonuçlar alınır.
+# - submit bir Future döner; map/as_completed sonuçları akış halinde verir.
+# - shutdown ile worker thread'leri kapatılır.
 # - logFuture=True ile sonuçlar kaydedilir, ResultwhenDone=True ile her görev bittiğinde ekrana yazılır.
 """
 #===============================================================================
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+===========================================================
+                THREAD POOL BENCHMARK
+===========================================================
+
+Description:
+    threadpool.POOL için karşılaştırmalı performans ölçümleri.
+
+    scheduler : Tek kuyruklu "fifo" ile iş çalan "stealing" zamanlayıcıyı 1, 8 ve 64
+                worker'da karşılaştırır.
+                - contention : 4 üretici thread'den boş görev gönderilir, görev/saniye ölçülür
+                - tail       : Yavaş LOW öncelikli bir yük altında gönderilen acil görevlerin
+                               gönderimden bitişe p50/p99 gecikmesi ölçülür
+
+    throughput: Boş (trivial), I/O bekleyen (sleep) ve CPU yoğun görevler için görev/saniye;
+                tek tek submit() ile farklı chunk boyutlarında submit_many() karşılaştırılır.
+
+    ratelimit : Hız sınırlı iki "host"a 5-50 ms süren istekler. Sınırı aşmamak için en hızlı yanıta
+                göre küçük tutulan max_threads ile büyük havuz + RateLimiter karşılaştırılır;
+                host başına ulaşılan başlatma/saniye ve en yüksek eşzamanlı istek ölçülür.
+
+Usage:
+    cmd -> `python threadpool_benchmark.py scheduler [--workers 1 8 64] [--tasks 50000]`
+    cmd -> `python threadpool_benchmark.py throughput [--workers 8] [--chunks 1 16 256] [--backend thread|process] [--scale 1.0]`
+    cmd -> `python threadpool_benchmark.py ratelimit [--rate 100] [--seconds 3]`
+
+Author:
+    Mefamex (info@mefamex.com) (https://mefamex.com)
+
+License:
+    MIT Lisansı (https://opensource.org/licenses/MIT)
+===========================================================
+"""
+
+#============================ IMPORTS =========================================
+import argparse, threading
+from random import uniform
+from time import perf_counter, perf_counter_ns, sleep
+from typing import Optional
+from threadpool import POOL, LatencyHistogram, RateLimit, RateLimiter
+#==============================================================================
+
+
+#============================ HELPERS =========================================
+def _noop() -> None: return None
+
+
+def _trivial(x: int) -> int: return x * x
+
+
+def _io_sleep(x: int) -> int:
+    sleep(0.0005)
+    return x
+
+
+def _cpu(x: int) -> int: return sum(i * i for i in range(x % 7 + 500))
+
+
+def _print_table(title: str, header: list, rows: list) -> None:
+    widths = [max(len(str(x)) for x in col) + 2 for col in zip(header, *rows)]
+    line = "|" + "|".join("-" * w for w in widths) + "|"
+    print(f"\n{title}\n{line}")
+    print("|" + "|".join(f" {h:<{w - 1}}" for h, w in zip(header, widths)) + "|")
+    print(line)
+    for row in rows: print("|" + "|".join(f" {str(c):<{w - 1}}" for c, w in zip(row, widths)) + "|")
+    print(line)
+#==============================================================================
+
+
+#============================ SCHEDULER BENCHMARK =============================
+def bench_contention(scheduler: str, workers: int, tasks: int, producers: int = 4) -> float:
+    """Returns tasks/second for no-op tasks pushed by several producer threads."""
+    with POOL(workers, logFuture=False, scheduler=scheduler) as pool:
+        per_producer = tasks // producers
+        def produce():
+            for _ in range(per_producer): pool.submit(_noop)
+        threads = [threading.Thread(target=produce) for _ in range(producers)]
+        start = perf_counter()
+        for t in threads: t.start()
+        for t in threads: t.join()
+        pool.join(verbose=False)
+        return per_producer * producers / (perf_counter() - start)
+
+
+def bench_tail(scheduler: str, workers: int, urgent: int = 200) -> dict:
+    """Submits a burst of slow LOW jobs, then urgent no-op jobs; returns urgent submit-to-done latency in ms."""
+    histogram, lock = LatencyHistogram(), threading.Lock()
+    low_kwargs, high_kwargs = ({}, {}) if scheduler == "fifo" else ({"priority": POOL.LOW}, {"priority": POOL.HIGH})
+    with POOL(workers, logFuture=False, max_queue=0, scheduler=scheduler) as pool:
+        for _ in range(workers * 50): pool.submit(sleep, 0.002, **low_kwargs)
+        for _ in range(urgent):
+            submitted = perf_counter_ns()
+            def done(_, submitted=submitted):
+                elapsed = perf_counter_ns() - submitted
+                with lock: histogram.record(elapsed)
+            pool.submit(_noop, **high_kwargs).add_done_callback(done)
+            sleep(0.0005)
+        pool.join(verbose=False)
+    return histogram.summary_ms()
+
+
+def run_scheduler(workers: list, tasks: int) -> None:
+    rows = []
+    for n in workers:
+        for scheduler in POOL.SCHEDULERS:
+            throughput, tail = bench_contention(scheduler, n, tasks), bench_tail(scheduler, n)
+            rows.append([n, scheduler, f"{throughput:,.0f}", tail["p50"], tail["p99"], tail["max"]])
+    _print_table("SCHEDULER: contention (görev/sn) ve acil görev gecikmesi (ms)", ["workers", "scheduler", "tasks/s", "p50", "p99", "max"], rows)
+#==============================================================================
+
+
+#============================ THROUGHPUT BENCHMARK ============================
+WORKLOADS = {"trivial": (_trivial, 100_000), "io-sleep": (_io_sleep, 4_000), "cpu": (_cpu, 20_000)}
+
+
+def bench_throughput(func, tasks: int, workers: int, chunksize: Optional[int], backend: str) -> float:
+    """Returns tasks/second; chunksize None submits every task on its own."""
+    with POOL(workers, logFuture=False, backend=backend) as pool:
+        start = perf_counter()
+        if chunksize is None: futures = [pool.submit(func, i) for i in range(tasks)]
+        else: futures = pool.submit_many(func, range(tasks), chunksize=chunksize)
+        for f in futures: f.result()
+        return tasks / (perf_counter() - start)
+
+
+def run_throughput(workers: int, chunks: list, backend: str, scale: float) -> None:
+    header, rows = ["workload", "tasks", "submit()"] + [f"chunk={c}" for c in chunks], []
+    for name, (func, tasks) in WORKLOADS.items():
+        tasks = max(1, int(tasks * scale))
+        results = [bench_throughput(func, tasks, workers, c, backend) for c in [None] + chunks]
+        rows.append([name, f"{tasks:,}"] + [f"{r:,.0f}" for r in results])
+    _print_table(f"THROUGHPUT: görev/sn (backend={backend}, workers={workers})", header, rows)
+#==============================================================================
+
+
+#============================ RATE LIMIT BENCHMARK ============================
+HOSTS = ("host-a", "host-b")
+
+
+def bench_ratelimit(rate: float, seconds: float, limited: bool) -> dict:
+    """Sends requests of 5-50 ms to every host for `seconds`; returns starts/s and peak concurrency per host."""
+    lock, live, peak, started = threading.Lock(), dict.fromkeys(HOSTS, 0), dict.fromkeys(HOSTS, 0), dict.fromkeys(HOSTS, 0)
+    def request(host: str) -> None:
+        with lock:
+            live[host] += 1
+            peak[host], started[host] = max(peak[host], live[host]), started[host] + 1
+        sleep(uniform(0.005, 0.05))
+        with lock: live[host] -= 1
+    tasks = int(rate * seconds)
+    if limited:
+        pool = POOL(64, logFuture=False, max_queue=0, rate_limiter=RateLimiter(per_key=RateLimit(rate=rate, burst=1)))
+        submit = lambda host: pool.submit(request, host, rate_key=host)
+    else:
+        # Sınırı hiç aşmamak için her host'a en hızlı yanıt süresine göre thread ayrılır: rate * 5 ms
+        pool = POOL(max(1, int(rate * 0.005)) * len(HOSTS), logFuture=False, max_queue=0)
+        submit = lambda host: pool.submit(request, host)
+    with pool:
+        start = perf_counter()
+        for _ in range(tasks):
+            for host in HOSTS: submit(host)
+        pool.join(verbose=False)
+        elapsed = perf_counter() - start
+    return {host: (started[host] / elapsed, peak[host]) for host in HOSTS}
+
+
+def run_ratelimit(rate: float, seconds: float) -> None:
+    rows = []
+    for name, limited in (("az thread (güvenli)", False), ("RateLimiter + 64 thread", True)):
+        for host, (achieved, peak) in bench_ratelimit(rate, seconds, limited).items():
+            rows.append([name, host, f"{rate:g}", f"{achieved:,.1f}", peak])
+    _print_table("RATELIMIT: host başına başlatma/sn", ["mode", "host", "limit/s", "achieved/s", "peak in-flight"], rows)
+#==============================================================================
+
+
+#============================ MAIN EXECUTION ==================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="threadpool.POOL benchmark suite")
+    sub = parser.add_subparsers(dest="suite", required=True)
+    p_sched = sub.add_parser("scheduler", help="fifo ve stealing zamanlayıcıları karşılaştırır")
+    p_sched.add_argument("--workers", type=int, nargs="+", default=[1, 8, 64])
+    p_sched.add_argument("--tasks", type=int, default=50_000)
+    p_tp = sub.add_parser("throughput", help="submit() ile submit_many() chunk boyutlarını karşılaştırır")
+    p_tp.add_argument("--workers", type=int, default=8)
+    p_tp.add_argument("--chunks", type=int, nargs="+", default=[1, 16, 256])
+    p_tp.add_argument("--backend", choices=POOL.BACKENDS, default="thread")
+    p_tp.add_argument("--scale", type=float, default=1.0, help="görev sayılarını bu katsayıyla çarpar")
+    p_rl = sub.add_parser("ratelimit", help="az thread ile RateLimiter'ı hız sınırlı host'larda karşılaştırır")
+    p_rl.add_argument("--rate", type=float, default=100.0, help="host başına izin verilen istek/sn")
+    p_rl.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+    if args.suite == "scheduler": run_scheduler(args.workers, args.tasks)
+    if args.suite == "throughput": run_throughput(args.workers, args.chunks, args.backend, args.scale)
+    if args.suite == "ratelimit": run_ratelimit(args.rate, args.seconds)
+#==============================================================================
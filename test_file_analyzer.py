@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+file_analyzer için davranış testleri: parçalı sayım, .gitignore budaması, önbellek, --since farkları ve json/csv akışı.
+
+Usage:
+    cmd -> `python -m pytest test_file_analyzer.py` veya `python -m unittest test_file_analyzer`
+"""
+
+import csv, io, json, os, shutil, subprocess, sys, tempfile, time, unittest
+from unittest import mock
+import file_analyzer as fa
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'file_analyzer.py')
+
+SAMPLES = {
+    'ascii': b"hello world\nsecond line  with   spaces\n\nlast line without newline",
+    'crlf': b"one two\r\nthree\r\n\r\nfour five six\r\n",
+    'utf8': "ğüşçö İstanbul\n漢字 かな 😀 emoji\r\nson satır ü".encode('utf-8'),
+    'spaces': b"   \t leading and trailing \t  \n\x0b\x0c word\r",
+    'empty': b"",
+    'one': b"x",
+}
+
+
+def reference(data):
+    """read() ile okunmuş metinden beklenen (karakter, satır, kelime): '\r\n' tek karakter, kelimeler ASCII boşluklarıyla ayrılır."""
+    text = data.decode('utf-8')
+    return len(text) - text.count('\r\n'), text.count('\n') + (bool(text) and not text.endswith('\n')), len(data.split())
+
+
+class _TempDirTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix='fa_test_')
+        self.addCleanup(shutil.rmtree, self.root, True)
+        patcher = mock.patch.object(fa, 'VERBOSE', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write(self, rel, data=b"x", age=None):
+        path = os.path.join(self.root, *rel.split('/'))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f: f.write(data)
+        if age is not None: os.utime(path, (time.time() - age, time.time() - age))  # CACHE_MTIME_SLACK_NS'den eski
+        return path
+
+    def rel(self, paths):
+        return sorted(os.path.relpath(path, self.root).replace(os.sep, '/') for path in paths)
+
+
+class CountFileTest(_TempDirTest):
+    def test_chunked_counts_match_a_full_read(self):
+        for name, data in SAMPLES.items():
+            path = self.write(f"{name}.txt", data)
+            for chunk_size in (1, 2, 3, 4, 5, 7, 16, 1 << 20):
+                with self.subTest(sample=name, chunk_size=chunk_size), mock.patch.object(fa, 'CHUNK_SIZE', chunk_size):
+                    self.assertEqual(fa.count_file(path), reference(data))
+
+    def test_crlf_and_words_split_at_the_chunk_boundary(self):
+        path = self.write('split.txt', b"ab\r\ncd ef")
+        with mock.patch.object(fa, 'CHUNK_SIZE', 3):  # 'ab\r' | '\ncd' | ' ef'
+            self.assertEqual(fa.count_file(path), (8, 2, 3))
+        path = self.write('word.txt', "kelime".encode('utf-8') * 3)
+        with mock.patch.object(fa, 'CHUNK_SIZE', 4):
+            self.assertEqual(fa.count_file(path), (18, 1, 1))
+
+    def test_multibyte_character_split_across_chunks(self):
+        data = "ş😀".encode('utf-8') * 50
+        path = self.write('multi.md', data)
+        for chunk_size in (1, 3, 5):
+            with mock.patch.object(fa, 'CHUNK_SIZE', chunk_size): self.assertEqual(fa.count_file(path), (100, 1, 1))
+
+    def test_unreadable_file_counts_as_zero(self):
+        os.symlink(os.path.join(self.root, 'missing-target'), os.path.join(self.root, 'dangling.txt'))
+        with mock.patch('sys.stderr', new_callable=io.StringIO) as err:
+            self.assertEqual(fa.count_file(os.path.join(self.root, 'dangling.txt')), (0, 0, 0))
+        self.assertIn('dangling.txt', err.getvalue())
+
+
+class CollectFilesTest(_TempDirTest):
+    def setUp(self):
+        super().setUp()
+        for rel in ('a.py', 'notes.md', 'debug.log.txt', 'build/out.py', 'src/app.py', 'src/gen/x.py', 'src/keep.md', 'src/drop.md',
+                    'pkg/node_modules/lib.js', 'pkg/main.js', 'venv/lib/site.py', '.git/HEAD.txt', 'image.png'):
+            self.write(rel)
+        self.write('.gitignore', b"# yorum\nbuild/\n*.log.txt\nnode_modules\n")
+        self.write('src/.gitignore', b"gen/\n*.md\n!keep.md\n")
+
+    def listed(self, **kwargs):
+        listed, scandir = [], os.scandir
+        def tracking(path='.'):
+            listed.append(os.path.relpath(path, self.root).replace(os.sep, '/'))
+            return scandir(path)
+        with mock.patch.object(os, 'scandir', tracking): paths = fa.collect_files(self.root, **kwargs)
+        return self.rel(path for _, path in paths), listed
+
+    def test_gitignore_rules_prune_folders_before_they_are_listed(self):
+        files, listed = self.listed()
+        self.assertEqual(files, ['a.py', 'notes.md', 'pkg/main.js', 'src/app.py', 'src/keep.md'])
+        self.assertEqual(sorted(listed), ['.', 'pkg', 'src'])  # build, src/gen, node_modules, .git, venv hiç listelenmez
+
+    def test_gitignore_and_default_ignores_can_be_turned_off(self):
+        files, _ = self.listed(ignored_folders=(), gitignore=False)
+        self.assertIn('build/out.py', files)
+        self.assertIn('venv/lib/site.py', files)
+        self.assertIn('.git/HEAD.txt', files)
+        self.assertNotIn('image.png', files)
+
+
+class CacheTest(_TempDirTest):
+    def setUp(self):
+        super().setUp()
+        for i in range(5): self.write(f"d{i % 2}/f{i}.py", b"print('x')\n" * (i + 1), age=60)
+
+    def analyze(self, cache):
+        stats = {}
+        results = fa.analyze_directory(self.root, workers=1, cache=cache, stats=stats)
+        return results['.py']['total_lines'], stats
+
+    def test_unchanged_files_are_not_read_again(self):
+        cache = {}
+        lines, stats = self.analyze(cache)
+        self.assertEqual((lines, stats['files'], stats['read'], stats['cached']), (15, 5, 5, 0))
+        with mock.patch.object(fa, 'count_file', side_effect=AssertionError('opened')):
+            self.assertEqual(self.analyze(cache)[1]['cached'], 5)
+        self.write('d0/f0.py', b"x = 1\n" * 10, age=30)  # değişen dosya yeniden okunur
+        os.remove(os.path.join(self.root, 'd1', 'f1.py'))
+        lines, stats = self.analyze(cache)
+        self.assertEqual((lines, stats['read'], stats['cached']), (10 + 3 + 4 + 5, 1, 3))
+        self.assertEqual(len(cache), 4)  # silinen dosya önbellekten çıkar
+
+    def test_recently_modified_files_are_not_cached(self):
+        self.write('d0/fresh.py', b"x\n")
+        cache = {}
+        self.analyze(cache)
+        self.assertEqual(self.analyze(cache)[1]['read'], 1)
+
+    def test_save_and_load_round_trip(self):
+        cache, file = {}, os.path.join(self.root, 'cache.json')
+        self.analyze(cache)
+        fa.save_cache(file, cache)
+        self.assertEqual(fa.load_cache(file), cache)
+        self.assertEqual([name for name in os.listdir(self.root) if name.endswith('.tmp')], [])
+        with self.assertRaises(OSError): fa.save_cache(os.path.join(self.root, 'missing', 'cache.json'), cache)
+
+
+class CommandLineTest(_TempDirTest):
+    def setUp(self):
+        super().setUp()
+        self.tree = os.path.join(self.root, 'tree')
+        self.write('tree/a.py', b"import os\nprint(os.name)\n")
+        self.write('tree/b.py', b"x = 1\n")
+        self.write('tree/readme.md', "# Başlık\n\nmetin\n".encode('utf-8'))
+
+    def run_cli(self, *args, check=True):
+        result = subprocess.run([sys.executable, SCRIPT, self.tree, '--workers', '1', *args], cwd=self.root, capture_output=True, text=True, encoding='utf-8')
+        if check: self.assertEqual(result.returncode, 0, result.stderr)
+        return result
+
+    def test_json_lines_stream(self):
+        result = self.run_cli('--format', 'json')
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        self.assertEqual([r['record'] for r in records], ['file'] * 3 + ['extension'] * 2 + ['summary'])
+        summary = records[-1]
+        self.assertEqual(summary['path'], self.tree)
+        self.assertEqual({key: summary[key] for key in ('files', 'lines', 'errors', 'read', 'cached')}, {'files': 3, 'lines': 6, 'errors': 0, 'read': 3, 'cached': 0})
+        self.assertTrue(all(os.path.isabs(r['path']) for r in records if r['record'] == 'file'))
+        self.assertFalse(os.path.exists(os.path.join(self.root, fa.CACHE_FILE)))  # etkileşimsiz modda varsayılan önbellek yok
+        self.assertIn('3 dosya', result.stderr)
+
+    def test_csv_stream_has_every_summary_field(self):
+        rows = list(csv.DictReader(io.StringIO(self.run_cli('--format', 'csv').stdout)))
+        self.assertEqual(list(rows[0]), list(fa.STREAM_FIELDS))
+        summary = rows[-1]
+        self.assertEqual((summary['record'], summary['files'], summary['errors'], summary['read']), ('summary', '3', '0', '3'))
+        self.assertNotEqual(summary['seconds'], '')
+
+    def test_since_reports_deltas_against_the_previous_results(self):
+        self.run_cli('--batch')
+        results = os.path.join(self.root, fa.RESULTS_FILE)
+        self.assertTrue(os.path.exists(results))
+        self.write('tree/c.py', b"y = 2\nz = 3\n")
+        os.remove(os.path.join(self.tree, 'readme.md'))
+        records = [json.loads(line) for line in self.run_cli('--format', 'json', '--since').stdout.splitlines()]
+        deltas = {r['ext']: r for r in records if r['record'] == 'delta'}
+        self.assertEqual((deltas['.py']['files'], deltas['.py']['lines']), (1, 2))
+        self.assertEqual((deltas['.md']['files'], deltas['.md']['lines']), (-1, -3))
+        table = self.run_cli('--batch', '--since').stdout
+        self.assertIn('CHANGES SINCE', table)
+        self.assertEqual(fa.parse_results(results)[1]['PY']['file'], 3)  # eklenen fark tablosu satır olarak okunmaz
+
+    def test_fail_on_error(self):
+        os.symlink(os.path.join(self.root, 'missing-target'), os.path.join(self.tree, 'broken.py'))
+        self.assertEqual(self.run_cli('--batch').returncode, 0)
+        result = self.run_cli('--format', 'json', '--fail-on-error', check=False)
+        self.assertEqual(result.returncode, 1)
+        self.assertEqual(json.loads(result.stdout.splitlines()[-1])['errors'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()